@@ -1,5 +1,12 @@
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash, Response
 from models import Candidate, Question, TestResult, DataManager, Department
+from search import FACET_FIELDS, UNASSIGNED
+from storage import SQLiteStorage
+from exam_timer import DeadlineScheduler
+from events import EventBus
+from listing import decode_cursor, encode_cursor, project
+from question_import import import_questions, iter_question_rows
+import results_export
 import os
 from datetime import datetime, timedelta, timezone
 import uuid
@@ -7,6 +14,10 @@ from werkzeug.utils import secure_filename
 import tempfile
 import requests
 import json
+import csv
+import hashlib
+import io
+import time
 
 # transformers 라이브러리 조건부 import (선택적 기능)
 try:
@@ -79,8 +90,29 @@ app.config['COMPANY_LOGO'] = None  # 로고 이미지 파일명 (예: 'logo.png'
 # BASE_DIR: app.py가 위치한 디렉토리의 절대경로
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+def create_data_manager():
+    """설정된 저장소 백엔드로 데이터 매니저 생성
+    
+    환경변수 STORAGE_BACKEND 우선, 없으면 config.json의 STORAGE_BACKEND 사용 ("json" 기본, "sqlite" 선택 가능).
+    SQLite 파일 경로는 SQLITE_PATH로 지정하며 기본값은 data/aptitude.db
+    """
+    config = {}
+    config_path = os.path.join(BASE_DIR, 'config.json')
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as f:
+            try:
+                config = json.load(f)
+            except Exception:
+                config = {}
+    backend = os.environ.get('STORAGE_BACKEND') or config.get('STORAGE_BACKEND', 'json')
+    data_folder = os.path.join(BASE_DIR, 'data')
+    if backend == 'sqlite':
+        db_path = os.environ.get('SQLITE_PATH') or config.get('SQLITE_PATH') or os.path.join(data_folder, 'aptitude.db')
+        return DataManager(data_folder, storage=SQLiteStorage(db_path))
+    return DataManager(data_folder)
+
 # 데이터 매니저 초기화
-data_manager = DataManager()
+data_manager = create_data_manager()
 
 # 랜덤 설정 파일 경로
 RANDOM_CONFIG_FILE = os.path.join(BASE_DIR, 'data', 'random_config.json')
@@ -131,6 +163,72 @@ def save_random_config(config):
         json.dump(config, f, ensure_ascii=False, indent=2)
     print(f"설정이 {RANDOM_CONFIG_FILE}에 저장되었습니다.")
 
+# 랜덤 출제 설정 키 → 출제할 (카테고리, 유형), 출제 순서대로
+EXAM_COMPOSITION = [
+    ('java_mc_count', 'Java', '객관식'),
+    ('java_sub_count', 'Java', '주관식'),
+    ('db_mc_count', 'Database', '객관식'),
+    ('db_sub_count', 'Database', '주관식'),
+    ('ps_mc_count', '문제해결', '객관식'),
+]
+
+def draw_exam_questions(department_id, random_config=None):
+    """부서 문제 풀에서 랜덤 출제 설정 개수만큼 문제 id 추출 (여러 명을 한 번에 출제할 때는 설정을 한 번만 읽어 전달)"""
+    if random_config is None:
+        random_config = load_random_config()
+    composition = [(category, question_type, random_config.get(key, 0)) for key, category, question_type in EXAM_COMPOSITION]
+    return data_manager.draw_exam_questions(department_id, composition)
+
+# 제한 시간 종료 후 추가 시간 (클라이언트 타이머의 추가 30초와 같음), 서버 마감 = 시작 + 제한 시간 + 추가 시간
+EXAM_GRACE_SECONDS = 30
+# 마감 직전에 보낸 제출이 네트워크 지연으로 늦게 도착하는 경우를 허용하는 여유
+SUBMIT_SLACK_SECONDS = 15
+
+# 응시 화면 이벤트 채널 (keepalive, 남은 시간, 관리자 공지, 자동 종료 알림)
+event_bus = EventBus()
+# 응시 중인 모든 지원자에게 보내는 공지 채널, 지원자별 채널은 'exam:<지원자 id>'
+EXAM_BROADCAST_CHANNEL = 'exam'
+# 이벤트가 없을 때 keepalive와 남은 시간을 보내는 간격
+EXAM_EVENT_KEEPALIVE_SECONDS = 15
+# 종료 몇 초 전에 자동 공지를 보낼지
+EXAM_WARNING_SECONDS = 5 * 60
+# 관리자 대시보드 변경 피드 채널 (DataManager의 지원자/결과 변경이 발행됨)
+ADMIN_CHANGES_CHANNEL = 'admin'
+# 변경 피드 long-poll 최대 대기 시간
+ADMIN_CHANGES_MAX_WAIT = 30
+
+def attach_change_feed(manager):
+    """DataManager의 지원자/결과 변경을 관리자 변경 피드로 발행"""
+    manager.add_listener(lambda name, payload: event_bus.publish(ADMIN_CHANGES_CHANNEL, name, payload))
+
+attach_change_feed(data_manager)
+
+def finalize_expired_attempt(candidate_id, deadline):
+    """마감이 지난 응시를 마감 전까지 자동 저장된 답안으로 종료"""
+    if data_manager.finalize_attempt(candidate_id, cutoff=deadline):
+        event_bus.publish(f'exam:{candidate_id}', 'finalized', {'message': '응시 시간이 종료되어 답안이 자동 제출되었습니다.'})
+
+exam_scheduler = DeadlineScheduler(finalize_expired_attempt)
+exam_scheduler_started = False
+
+@app.before_request
+def start_exam_scheduler():
+    """진행 중인 응시의 마감을 저장된 시작/마감 시각으로 다시 등록하고 자동 종료 스케줄러 시작 (워커 프로세스마다 한 번)
+    
+    마감 힙은 프로세스 메모리에만 있으므로 워커가 (재)시작되면 저장소에서 다시 구성해야 한다.
+    gunicorn은 gunicorn.conf.py의 post_worker_init에서 요청을 기다리지 않고 바로 호출하고,
+    python app.py로 실행하면 첫 요청 때 호출된다.
+    """
+    global exam_scheduler_started
+    if exam_scheduler_started:
+        return
+    exam_scheduler_started = True
+    for candidate, result in data_manager.get_candidates_with_results():
+        deadline = candidate.deadline_timestamp()
+        if deadline is not None and result is None:
+            exam_scheduler.schedule(candidate.id, deadline)
+    exam_scheduler.start()
+
 def allowed_file(filename):
     """허용된 파일 확장자인지 확인"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -152,12 +250,9 @@ def register():
     if request.method == 'POST':
         name = request.form.get('name')
         if name:
-            candidates = data_manager.get_all_candidates()
-            matched = None
-            for candidate in candidates:
-                if candidate.name == name:
-                    matched = candidate
-                    break
+            # 이름 인덱스로 조회 (동명이인이면 먼저 등록된 지원자)
+            matches = data_manager.get_candidates_by_name(name)
+            matched = matches[0] if matches else None
             if not matched:
                 return render_template('register.html', error="사전에 등록된 이름이 아닙니다. 관리자에게 문의하세요.")
             today = datetime.now().strftime('%Y-%m-%d')
@@ -201,35 +296,8 @@ def test_start():
     # -------------------------------------------------------------
     # 지원자에게 할당된 문제가 없는 경우에만 새로 할당
     if not candidate.selected_questions:
-        all_questions = data_manager.load_questions()
-        department_questions = [q for q in all_questions if candidate.department_id in q.department_ids]
-        
-        # 카테고리별 문제 분류
-        java_mc = [q for q in department_questions if q.category == 'Java' and q.type == '객관식']
-        java_sub = [q for q in department_questions if q.category == 'Java' and q.type == '주관식']
-        db_mc = [q for q in department_questions if q.category == 'Database' and q.type == '객관식']
-        db_sub = [q for q in department_questions if q.category == 'Database' and q.type == '주관식']
-        ps_mc = [q for q in department_questions if q.category == '문제해결' and q.type == '객관식']
-        
-        # 출제 개수 설정값 적용 (기본값 0으로 설정)
-        random_config = load_random_config()
-        java_mc_count = random_config.get('java_mc_count', 0)
-        java_sub_count = random_config.get('java_sub_count', 0)
-        db_mc_count = random_config.get('db_mc_count', 0)
-        db_sub_count = random_config.get('db_sub_count', 0)
-        ps_mc_count = random_config.get('ps_mc_count', 0)
-        
-        import random
-        selected_java_mc = random.sample(java_mc, min(len(java_mc), java_mc_count))
-        selected_java_sub = random.sample(java_sub, min(len(java_sub), java_sub_count))
-        selected_db_mc = random.sample(db_mc, min(len(db_mc), db_mc_count))
-        selected_db_sub = random.sample(db_sub, min(len(db_sub), db_sub_count))
-        selected_ps_mc = random.sample(ps_mc, min(len(ps_mc), ps_mc_count))
-        
-        selected_ids = ([q.id for q in selected_java_mc] + [q.id for q in selected_java_sub] + 
-                       [q.id for q in selected_db_mc] + [q.id for q in selected_db_sub] + 
-                       [q.id for q in selected_ps_mc])
-        candidate.selected_questions = selected_ids
+        # 부서별 출제 풀에서 설정 개수만큼 추출 (기본값 0개)
+        candidate.selected_questions = draw_exam_questions(candidate.department_id)
         data_manager.update_candidate(candidate)
 
     # 평가 시간 및 기타 정보 설정
@@ -249,11 +317,57 @@ def technical_test():
     candidate = data_manager.get_candidate(session['candidate_id'])
     if not candidate:
         return redirect(url_for('register'))
+    # 이미 제출했거나 마감되어 자동 종료된 경우
+    if data_manager.get_result(candidate.id):
+        return redirect(url_for('result'))
+    
+    # 처음 응시 화면을 열 때 서버 기준 시작/마감 시각 기록 (새로고침해도 시간이 다시 시작되지 않음)
+    if not candidate.test_started_at:
+        candidate.start_test(grace_seconds=EXAM_GRACE_SECONDS)
+        data_manager.update_candidate(candidate)
+        exam_scheduler.schedule(candidate.id, candidate.deadline_timestamp())
+    # 클라이언트 타이머는 서버 마감 기준 남은 시간으로 표시
+    remaining = max(0, int(candidate.deadline_timestamp() - time.time()))
     
     # 선택된 문제 또는 전체 문제를 가져옴
     questions = data_manager.get_candidate_questions(session['candidate_id'])
+    # 새로고침/재접속 시 자동 저장된 답안 복원
+    saved_answers = data_manager.load_answer_draft(candidate.id)
     
-    return render_template('technical_test.html', questions=questions, time_limit=candidate.test_duration * 60, candidate=candidate)
+    return render_template('technical_test.html', questions=questions, time_limit=candidate.test_duration * 60, candidate=candidate, saved_answers=saved_answers,
+                           remaining_seconds=max(0, remaining - EXAM_GRACE_SECONDS), grace_seconds=min(remaining, EXAM_GRACE_SECONDS))
+
+# 자동 저장 답안 하나의 최대 길이
+AUTOSAVE_MAX_ANSWER_LENGTH = 20000
+
+@app.route('/api/autosave', methods=['POST'])
+def autosave_answers():
+    """응시 중 답안 자동 저장 (바뀐 문제의 답안만 받아 지원자별 로그에 추가)"""
+    if 'candidate_id' not in session:
+        return jsonify(success=False, message='세션이 만료되었습니다.'), 400
+    candidate_id = session['candidate_id']
+    data = request.get_json(silent=True) or {}
+    answers = data.get('answers')
+    if not isinstance(answers, dict):
+        return jsonify(success=False, message='답안 형식이 올바르지 않습니다.'), 400
+    candidate = data_manager.get_candidate(candidate_id)
+    if not candidate:
+        return jsonify(success=False, message='지원자 정보를 찾을 수 없습니다.'), 400
+    if data_manager.get_result(candidate_id):
+        return jsonify(success=False, message='이미 제출된 평가입니다.'), 409
+    deadline = candidate.deadline_timestamp()
+    if deadline is not None and time.time() > deadline:
+        return jsonify(success=False, message='응시 시간이 종료되었습니다.'), 409
+    # 출제된 문제의 답안만 저장 (출제 문제가 없으면 전체 문제 대상)
+    selected = set(candidate.selected_questions or [])
+    deltas = {}
+    for question_id, answer in answers.items():
+        if not isinstance(answer, str) or len(answer) > AUTOSAVE_MAX_ANSWER_LENGTH:
+            return jsonify(success=False, message='답안 형식이 올바르지 않습니다.'), 400
+        if not selected or question_id in selected:
+            deltas[question_id] = answer
+    data_manager.save_answer_draft(candidate_id, deltas)
+    return jsonify(success=True, saved=len(deltas))
 
 @app.route('/submit_answers', methods=['POST'])
 def submit_answers():
@@ -261,23 +375,20 @@ def submit_answers():
     if 'candidate_id' not in session:
         return jsonify({'error': '세션이 만료되었습니다.'}), 400
     candidate_id = session['candidate_id']
-    # 답안 수집
+    # 제출된 폼의 답안 수집
     answers = {}
     for key, value in request.form.items():
         if key.startswith('question_'):
             question_id = key.replace('question_', '')
             answers[question_id] = value
-    # 평가 결과 생성
-    result = TestResult(candidate_id)
-    for question_id, answer in answers.items():
-        result.add_answer(question_id, answer)
-    # 모든 문제 로드하여 점수 계산
-    all_questions = data_manager.load_questions()
-    result.calculate_score(all_questions)
-    # 결과 저장
-    data_manager.save_result(result)
-    # 순위 계산
-    data_manager.calculate_ranks()
+    # 서버 마감(+네트워크 여유)이 지난 제출은 폼 답안을 버리고 마감 전 자동 저장 답안만 채점
+    candidate = data_manager.get_candidate(candidate_id)
+    deadline = candidate.deadline_timestamp() if candidate else None
+    if deadline is not None and time.time() > deadline + SUBMIT_SLACK_SECONDS:
+        answers = None
+    # 자동 저장된 답안 위에 제출 답안을 덮어써 채점·저장 (이미 자동 종료되었으면 아무것도 하지 않음)
+    data_manager.finalize_attempt(candidate_id, answers, cutoff=deadline)
+    exam_scheduler.cancel(candidate_id)
     # 세션 정리
     session.pop('technical_answers', None)
     session.pop('current_step', None)
@@ -296,14 +407,8 @@ def result():
     if not candidate or not result:
         return redirect(url_for('register'))
     
-    # 전체 결과에서 순위 정보 업데이트
-    all_results = data_manager.get_all_results()
-    all_results.sort(key=lambda x: x.total_score, reverse=True)
-    
-    for i, r in enumerate(all_results):
-        if r.candidate_id == candidate_id:
-            result.rank = i + 1
-            break
+    # 순위 구조에서 현재 순위만 조회 (전체 결과를 정렬하지 않음)
+    result.rank = data_manager.get_result_rank(candidate_id)
     
     return render_template('result.html', candidate=candidate, result=result)
 
@@ -311,24 +416,16 @@ def result():
 @admin_login_required
 def admin():
     """관리자 페이지 - 대시보드"""
-    candidates = data_manager.get_all_candidates()
-    results = data_manager.get_all_results()
+    # 화면 데이터를 읽기 전의 변경 피드 커서 (이후 변경분은 페이지에서 /admin/api/changes로 받음)
+    change_seq = event_bus.last_seq
+    # 지원자-결과 조인을 한 번에 가져옴 (결과마다 지원자를 다시 조회하지 않음)
+    candidates_with_results = data_manager.get_candidates_with_results()
+    candidates = [c for c, _ in candidates_with_results]
     departments = data_manager.load_departments()
     departments_dict = [dept.to_dict() for dept in departments]
     
     # 모든 문제 로드 (기술 문제 + 문제해결 문제)
-    all_questions = []
-    
-    # 기술 문제 로드
-    technical_questions = data_manager.load_questions()
-    for q in technical_questions:
-        all_questions.append(q.to_dict())
-    
-    # 문제해결 문제 로드
-    questions_data = data_manager._load_json(data_manager.questions_file)
-    problem_solving_questions = questions_data.get("problem_solving_questions", [])
-    for q in problem_solving_questions:
-        all_questions.append(q)
+    all_questions = [q.to_dict() for q in data_manager.load_questions()]
     
     unassigned_questions = [q for q in all_questions if not q.get('department_ids') or len(q.get('department_ids', [])) == 0]
     
@@ -341,221 +438,184 @@ def admin():
         else:
             c.created_at_formatted = "N/A"
     total_candidates = len(candidates)
+    # 순위 순서로 정렬 (상위 5명 목록이 순위 순서를 전제로 함)
+    completed = sorted(((c, r) for c, r in candidates_with_results if r), key=lambda pair: pair[1].rank)
+    # 부서별/응시일별 순위 (전체 결과를 다시 정렬하지 않고 코호트 순위에서 조회)
+    cohort_ranks = data_manager.get_cohort_ranks([c.id for c, _ in completed])
     candidate_results = {}
-    for result in results:
-        candidate = data_manager.get_candidate(result.candidate_id)
-        if candidate:
-            candidate_results[result.candidate_id] = {
-                'candidate': candidate,
-                'result': result
-            }
+    for candidate, result in completed:
+        candidate_results[candidate.id] = {
+            'candidate': candidate,
+            'result': result,
+            **cohort_ranks[candidate.id]
+        }
     # candidates를 dict 리스트로 변환
     candidates_dict = [c.to_dict() for c in candidates]
     # created_at_formatted도 dict에 추가
     for i, c in enumerate(candidates):
         candidates_dict[i]['created_at_formatted'] = c.created_at_formatted
-    return render_template('admin.html', candidates=candidates_dict, candidate_results=candidate_results, departments=departments_dict, unassigned_questions=unassigned_questions, questions=all_questions)
+    return render_template('admin.html', candidates=candidates_dict, candidate_results=candidate_results, departments=departments_dict, unassigned_questions=unassigned_questions, questions=all_questions, change_seq=change_seq)
 
 @app.route('/admin/candidate/delete/<candidate_id>', methods=['DELETE'])
 def delete_candidate(candidate_id):
-    """지원자 삭제"""
+    """지원자 삭제 (응시 중이면 자동 종료 예약과 자동 저장 답안도 함께 제거)"""
+    exam_scheduler.cancel(candidate_id)
     data_manager.delete_candidate(candidate_id)
     data_manager.delete_result(candidate_id)
+    data_manager.clear_answer_draft(candidate_id)
     return jsonify(success=True, message="지원자가 삭제되었습니다.")
 
+# 문제 관리 페이지당 문제 수
+QUESTION_PAGE_SIZE = 50
+
 @app.route('/admin/questions')
 def question_manage():
-    """문제 관리 페이지"""
-    technical_questions = data_manager.load_questions()
-    # 문제해결 문제도 로드
-    questions_data = data_manager._load_json(data_manager.questions_file)
-    problem_solving_questions = questions_data.get("problem_solving_questions", [])
-    departments = data_manager.load_departments()
-    
-    # 부서별 문제 통계 계산
-    department_stats = {}
-    unassigned_count = 0
-    
-    # 기술 문제 통계 계산
-    for question in technical_questions:
-        department_ids = getattr(question, 'department_ids', [])
-        if not department_ids:
-            unassigned_count += 1
-        else:
-            for dept_id in department_ids:
-                if dept_id not in department_stats:
-                    department_stats[dept_id] = 0
-                department_stats[dept_id] += 1
+    """문제 관리 페이지 (검색어/카테고리/부서 필터와 페이지 나눔은 검색 색인으로 서버에서 처리)"""
+    query = request.args.get('q', '').strip()
+    category = request.args.get('category', '')
+    department = request.args.get('department', 'all')
+    filters = {}
+    if category:
+        filters['category'] = category
+    if department == 'unassigned':
+        filters['department_id'] = UNASSIGNED
+    elif department != 'all':
+        filters['department_id'] = department
+    view, facets = data_manager.search_questions(query, filters)
     
-    # 문제해결 문제 통계 계산 (문제해결 문제는 딕셔너리 형태)
-    for question in problem_solving_questions:
-        department_ids = question.get('department_ids', [])
-        if not department_ids:
-            unassigned_count += 1
-        else:
-            for dept_id in department_ids:
-                if dept_id not in department_stats:
-                    department_stats[dept_id] = 0
-                department_stats[dept_id] += 1
+    total = len(view)
+    pages = max((total + QUESTION_PAGE_SIZE - 1) // QUESTION_PAGE_SIZE, 1)
+    page = min(max(request.args.get('page', default=1, type=int), 1), pages)
+    page_questions = [q for _, q in view.items[(page - 1) * QUESTION_PAGE_SIZE:page * QUESTION_PAGE_SIZE]]
+    technical_questions = [q for q in page_questions if q.category != '문제해결']
+    # 문제해결 문제 (템플릿에서는 딕셔너리 형태로 사용)
+    problem_solving_questions = [q.to_dict() for q in page_questions if q.category == '문제해결']
+    departments = data_manager.load_departments()
     
-    # 부서 이름과 함께 통계 정보 생성
-    department_info = []
-    for dept in departments:
-        count = department_stats.get(dept.id, 0)
-        department_info.append({
-            'id': dept.id,
-            'name': dept.name,
-            'count': count
-        })
+    # 부서별 문제 수 (부서 필터를 뺀 나머지 조건 기준)
+    department_counts = facets['department_id']
+    department_info = [
+        {'id': dept.id, 'name': dept.name, 'count': department_counts.get(dept.id, 0)}
+        for dept in departments
+    ]
     
     return render_template('question_manage.html', 
                          technical_questions=technical_questions, 
                          problem_solving_questions=problem_solving_questions,
                          departments=departments,
                          department_info=department_info,
-                         unassigned_count=unassigned_count)
+                         unassigned_count=department_counts.get(UNASSIGNED, 0),
+                         total=total,
+                         page=page,
+                         pages=pages,
+                         query=query,
+                         category=category,
+                         department=department)
 
 @app.route('/admin/questions/add', methods=['POST'])
 def add_question():
     try:
         data = request.get_json()
         
-        # 카테고리별로 다른 처리
+        # 카테고리별로 다른 ID 접두어 사용 (기술 문제: tech_, 문제해결 문제: ps_)
         if data['category'] in ['Java', 'Database']:
-            # 기술 문제 처리
-            questions_data = data_manager._load_json(data_manager.questions_file)
-            existing_questions = questions_data["technical_questions"]
-            new_id = f"tech_{len(existing_questions) + 1}"
-            question_data = {
-                'id': new_id,
-                'category': data['category'],
-                'type': data['type'],
-                'difficulty': data['difficulty'],
-                'question': data['question'],
-                'points': int(data['points']),
-                # 부서 ID를 리스트로 저장 (없으면 빈 리스트)
-                'department_ids': [data.get('department_id', 'dept_1')] if data.get('department_id') else []
-            }
-            if data['type'] == '객관식':
-                question_data['options'] = data['options']
-                question_data['correct_answer'] = data['correct_answer']
-            else:
-                question_data['keywords'] = data['keywords']
-                question_data['correct_answer'] = data['correct_answer']
-            
-            questions_data["technical_questions"].append(question_data)
-            data_manager._save_json(data_manager.questions_file, questions_data)
-            
+            prefix = 'tech'
         elif data['category'] == '문제해결':
-            # 문제해결 문제 처리
-            questions_data = data_manager._load_json(data_manager.questions_file)
-            # problem_solving_questions 키가 없으면 생성
-            if "problem_solving_questions" not in questions_data:
-                questions_data["problem_solving_questions"] = []
-            
-            existing_questions = questions_data["problem_solving_questions"]
-            new_id = f"ps_{len(existing_questions) + 1}"
-            question_data = {
-                'id': new_id,
-                'category': data['category'],
-                'type': data['type'],
-                'difficulty': data['difficulty'],
-                'question': data['question'],
-                'points': int(data['points']),
-                # 부서 ID를 리스트로 저장 (없으면 빈 리스트)
-                'department_ids': [data.get('department_id', 'dept_1')] if data.get('department_id') else []
-            }
-            if data['type'] == '객관식':
-                question_data['options'] = data['options']
-                question_data['correct_answer'] = data['correct_answer']
-            else:
-                question_data['keywords'] = data['keywords']
-                question_data['correct_answer'] = data['correct_answer']
-            
-            questions_data["problem_solving_questions"].append(question_data)
-            data_manager._save_json(data_manager.questions_file, questions_data)
-            
+            prefix = 'ps'
         else:
             return jsonify({'success': False, 'message': '지원하지 않는 카테고리입니다. Java, Database, 문제해결 중 선택해주세요.'})
         
+        all_questions = data_manager.load_questions()
+        existing_ids = {q.id for q in all_questions}
+        same_section_count = sum(1 for q in all_questions if (q.category == '문제해결') == (prefix == 'ps'))
+        # 삭제된 문제가 있으면 개수 기반 ID가 겹칠 수 있으므로 빈 번호를 찾음
+        number = same_section_count + 1
+        while f"{prefix}_{number}" in existing_ids:
+            number += 1
+        new_id = f"{prefix}_{number}"
+        question_data = {
+            'id': new_id,
+            'category': data['category'],
+            'type': data['type'],
+            'difficulty': data['difficulty'],
+            'question': data['question'],
+            'points': int(data['points']),
+            # 부서 ID를 리스트로 저장 (없으면 빈 리스트)
+            'department_ids': [data.get('department_id', 'dept_1')] if data.get('department_id') else []
+        }
+        if data['type'] == '객관식':
+            question_data['options'] = data['options']
+            question_data['correct_answer'] = data['correct_answer']
+        else:
+            question_data['keywords'] = data['keywords']
+            question_data['correct_answer'] = data['correct_answer']
+        
+        data_manager.save_question(Question.from_dict(question_data))
         return jsonify({'success': True, 'message': '문제가 추가되었습니다.'})
         
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
+@app.route('/admin/questions/import', methods=['POST'])
+@admin_login_required
+def import_question_file():
+    """문제 은행 파일(JSON Lines/CSV/XLSX) 일괄 가져오기
+    
+    행 단위로 검증/중복 제거 후 묶음으로 저장하고, 처리 속도와 행별 오류를 보고한다.
+    update=true이면 이미 있는 id의 문제를 파일 내용으로 수정 (기본은 건너뜀)
+    """
+    upload = request.files.get('file')
+    if not upload or not upload.filename:
+        return jsonify(success=False, message="가져올 파일을 선택해주세요.")
+    update_existing = request.form.get('update', '').lower() in ('1', 'true', 'on')
+    try:
+        report = import_questions(data_manager, iter_question_rows(upload.stream, upload.filename),
+                                  update_existing=update_existing)
+    except ValueError as e:
+        return jsonify(success=False, message=str(e))
+    message = (f"{report['rows']}행 처리: 추가 {report['imported']}건, 수정 {report['updated']}건, "
+               f"중복 {report['duplicates']}건, 실패 {report['failed']}건 ({report['rows_per_sec']}행/초)")
+    return jsonify(success=report['failed'] == 0, message=message, report=report)
+
 @app.route('/admin/questions/edit/<question_id>', methods=['PUT'])
 def edit_question(question_id):
     try:
         data = request.get_json()
-        questions_data = data_manager._load_json(data_manager.questions_file)
-        
-        # 기술 문제에서 찾기
-        for question in questions_data["technical_questions"]:
-            if question['id'] == question_id:
-                question.update({
-                    'category': data['category'],
-                    'type': data['type'],
-                    'difficulty': data['difficulty'],
-                    'question': data['question'],
-                    'points': int(data['points']),
-                    # 부서 ID를 리스트로 저장 (없으면 빈 리스트)
-                    'department_ids': [data.get('department_id', 'dept_1')] if data.get('department_id') else []
-                })
-                if data['type'] == '객관식':
-                    question['options'] = data['options']
-                    question['correct_answer'] = data['correct_answer']
-                else:
-                    question['keywords'] = data['keywords']
-                    question['correct_answer'] = data['correct_answer']
-                data_manager._save_json(data_manager.questions_file, questions_data)
-                return jsonify({'success': True, 'message': '문제가 수정되었습니다.'})
+        question = data_manager.get_question(question_id)
+        if not question:
+            return jsonify({'success': False, 'message': '문제를 찾을 수 없습니다.'})
         
-        # 문제해결 문제에서 찾기
-        problem_solving_questions = questions_data.get("problem_solving_questions", [])
-        for question in problem_solving_questions:
-            if question['id'] == question_id:
-                question.update({
-                    'category': data['category'],
-                    'type': data['type'],
-                    'difficulty': data['difficulty'],
-                    'question': data['question'],
-                    'points': int(data['points']),
-                    # 부서 ID를 리스트로 저장 (없으면 빈 리스트)
-                    'department_ids': [data.get('department_id', 'dept_1')] if data.get('department_id') else []
-                })
-                if data['type'] == '객관식':
-                    question['options'] = data['options']
-                    question['correct_answer'] = data['correct_answer']
-                else:
-                    question['keywords'] = data['keywords']
-                    question['correct_answer'] = data['correct_answer']
-                data_manager._save_json(data_manager.questions_file, questions_data)
-                return jsonify({'success': True, 'message': '문제가 수정되었습니다.'})
+        # 캐시된 객체를 공유하므로 입력값 검증/변환이 끝난 뒤에 값을 바꿈
+        points = int(data['points'])
+        if data['type'] == '객관식':
+            options, keywords = data['options'], question.keywords
+        else:
+            options, keywords = question.options, data['keywords']
+        correct_answer = data['correct_answer']
         
-        return jsonify({'success': False, 'message': '문제를 찾을 수 없습니다.'})
+        question.category = data['category']
+        question.type = data['type']
+        question.difficulty = data['difficulty']
+        # 설명이 문제 내용과 같았던 경우(별도 설명 없음)에는 함께 갱신
+        if question.description == question.question:
+            question.description = data['question']
+        question.question = data['question']
+        question.points = points
+        # 부서 ID를 리스트로 저장 (없으면 빈 리스트)
+        question.department_ids = [data.get('department_id', 'dept_1')] if data.get('department_id') else []
+        question.options = options
+        question.keywords = keywords
+        question.correct_answer = correct_answer
+        data_manager.save_question(question)
+        return jsonify({'success': True, 'message': '문제가 수정되었습니다.'})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
 @app.route('/admin/questions/delete/<question_id>', methods=['DELETE'])
 def delete_question(question_id):
     try:
-        questions_data = data_manager._load_json(data_manager.questions_file)
-        
-        # 기술 문제에서 찾기
-        for i, question in enumerate(questions_data["technical_questions"]):
-            if question['id'] == question_id:
-                del questions_data["technical_questions"][i]
-                data_manager._save_json(data_manager.questions_file, questions_data)
-                return jsonify({'success': True, 'message': '문제가 삭제되었습니다.'})
-        
-        # 문제해결 문제에서 찾기
-        problem_solving_questions = questions_data.get("problem_solving_questions", [])
-        for i, question in enumerate(problem_solving_questions):
-            if question['id'] == question_id:
-                del questions_data["problem_solving_questions"][i]
-                data_manager._save_json(data_manager.questions_file, questions_data)
-                return jsonify({'success': True, 'message': '문제가 삭제되었습니다.'})
-        
+        if data_manager.delete_question(question_id):
+            return jsonify({'success': True, 'message': '문제가 삭제되었습니다.'})
         return jsonify({'success': False, 'message': '문제를 찾을 수 없습니다.'})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
@@ -563,93 +623,169 @@ def delete_question(question_id):
 @app.route('/admin/questions/edit/<question_id>', methods=['GET'])
 def edit_question_page(question_id):
     """문제 편집 페이지"""
-    questions_data = data_manager._load_json(data_manager.questions_file)
+    all_questions = data_manager.load_questions()
     departments = data_manager.load_departments()  # 부서 리스트 추가
     # 카테고리 목록 동적 추출
-    category_set = set()
-    for q in questions_data.get('technical_questions', []):
-        if q.get('category'):
-            category_set.add(q['category'])
-    for q in questions_data.get('problem_solving_questions', []):
-        if q.get('category'):
-            category_set.add(q['category'])
-    category_list = sorted(category_set)
-    # 기술 문제에서 찾기
-    for question in questions_data["technical_questions"]:
-        if question['id'] == question_id:
-            return render_template('question_edit.html', question=question, departments=departments, category_list=category_list)
-    # 문제해결 문제에서 찾기
-    problem_solving_questions = questions_data.get("problem_solving_questions", [])
-    for question in problem_solving_questions:
-        if question['id'] == question_id:
-            return render_template('question_edit.html', question=question, departments=departments, category_list=category_list)
+    category_list = sorted({q.category for q in all_questions if q.category})
+    question = data_manager.get_question(question_id)
+    if question:
+        return render_template('question_edit.html', question=question.to_dict(), departments=departments, category_list=category_list)
     return redirect(url_for('question_manage'))
-
 @app.route('/logout')
 def logout():
     """로그아웃 - 세션 클리어"""
     session.clear()
     return redirect(url_for('index'))
 
-@app.route('/api/questions')
-def api_questions():
-    """문제 데이터 API"""
-    all_questions = []
+def conditional_response(version, build):
+    """데이터 버전에서 만든 ETag가 If-None-Match와 같으면 본문 없이 304, 아니면 build()의 응답에 ETag를 붙여 반환
     
-    # 기술 문제 로드
-    technical_questions = data_manager.load_questions()
-    for q in technical_questions:
-        all_questions.append({
-            'id': q.id,
-            'category': q.category,
-            'type': q.type,
-            'difficulty': q.difficulty,
-            'question': q.question,
-            'options': q.options,
-            'correct_answer': q.correct_answer,
-            'keywords': q.keywords,
-            'points': q.points,
-            # department_ids를 항상 문자열 배열로 변환
-            'department_ids': [str(did) for did in getattr(q, 'department_ids', [])]
-        })
+    Cache-Control: no-cache로 브라우저가 매번 재검증하게 하므로 바뀐 데이터를 놓치지 않는다.
+    """
+    etag = hashlib.sha256(repr(version).encode('utf-8')).hexdigest()[:32]
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = build()
+        if isinstance(response, tuple):
+            # 오류 응답에는 ETag를 붙이지 않음
+            return response
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+# 목록 API 페이지 크기
+LISTING_DEFAULT_LIMIT = 50
+LISTING_MAX_LIMIT = 500
+# 필터가 아닌 목록 API 쿼리 파라미터
+LISTING_PARAMS = {'sort', 'fields', 'limit', 'cursor'}
+
+def listing_response(kind, default_sort, serialize):
+    """목록 API 공통 처리 (필터/정렬/필드 선택/커서 페이지네이션)
     
-    # 문제해결 문제 로드
-    questions_data = data_manager._load_json(data_manager.questions_file)
-    problem_solving_questions = questions_data.get("problem_solving_questions", [])
-    for q in problem_solving_questions:
-        all_questions.append({
-            'id': q['id'],
-            'category': q['category'],
-            'type': q['type'],
-            'difficulty': q['difficulty'],
-            'question': q['question'],
-            'options': q.get('options', []),
-            'correct_answer': q['correct_answer'],
-            'keywords': q.get('keywords', []),
-            'points': q['points'],
-            # department_ids를 항상 문자열 배열로 변환
-            'department_ids': [str(did) for did in q.get('department_ids', [])]
-        })
+    쿼리 파라미터:
+    - 필드=값: 필터 (예: department_id=..., category=Java)
+    - sort: 정렬 필드 (앞에 -를 붙이면 내림차순)
+    - fields: 응답에 포함할 필드 (쉼표 구분)
+    - limit, cursor: 페이지 조회. 응답은 {"items": [...], "next_cursor": ..., "total": n}이고
+      다음 페이지는 next_cursor를 cursor로 넘겨 조회. 둘 다 없으면 전체 목록을 배열로 반환
+    serialize는 항목 목록을 응답용 dict 목록으로 바꾸는 함수
+    """
+    filters = {key: value for key, value in request.args.items() if key not in LISTING_PARAMS}
+    sort = request.args.get('sort') or default_sort
+    descending = sort.startswith('-')
+    fields = [f.strip() for f in request.args.get('fields', '').split(',') if f.strip()]
+    try:
+        view = data_manager.get_listing(kind, filters, sort.lstrip('-'))
+        after = decode_cursor(request.args['cursor'], sort) if request.args.get('cursor') else None
+    except ValueError as e:
+        return jsonify(success=False, message=str(e)), 400
     
-    return jsonify(all_questions)
+    if 'limit' not in request.args and 'cursor' not in request.args:
+        items = view.items[::-1] if descending else view.items
+        return jsonify([project(record, fields) for record in serialize(items)])
+    limit = min(max(request.args.get('limit', default=LISTING_DEFAULT_LIMIT, type=int), 1), LISTING_MAX_LIMIT)
+    items, next_key = view.page(after, limit, descending)
+    return jsonify(
+        items=[project(record, fields) for record in serialize(items)],
+        next_cursor=encode_cursor(sort, next_key) if next_key is not None else None,
+        total=len(view)
+    )
+
+def question_summary(q):
+    return {
+        'id': q.id,
+        'category': q.category,
+        'type': q.type,
+        'difficulty': q.difficulty,
+        'question': q.question,
+        'options': q.options,
+        'correct_answer': q.correct_answer,
+        'keywords': q.keywords,
+        'points': q.points,
+        # department_ids를 항상 문자열 배열로 변환
+        'department_ids': [str(did) for did in getattr(q, 'department_ids', [])]
+    }
+
+@app.route('/api/questions')
+def api_questions():
+    """문제 데이터 API (department_id/category/type/difficulty 필터, 정렬, 페이지 조회)"""
+    return conditional_response(
+        data_manager.data_version('questions'),
+        lambda: listing_response('questions', 'id', lambda questions: [question_summary(q) for q in questions])
+    )
+
+# 문제 검색 API 기본 페이지 크기
+SEARCH_DEFAULT_LIMIT = 20
+
+def question_search_filters(args):
+    """쿼리 파라미터에서 검색 필터 추출 (department_id가 빈 값이면 부서 미지정 문제)"""
+    return {field: args[field] for field in FACET_FIELDS if field in args}
+
+@app.route('/api/questions/search')
+def api_questions_search():
+    """문제 전문 검색 API (관련도 순)
+
+    쿼리 파라미터:
+    - q: 검색어 (문제/설명/보기/키워드/SQL, 한글은 두 글자 단위로 찾으므로 조사가 붙어도 검색됨)
+    - category/type/difficulty/department_id: 필터
+    - limit, cursor: 페이지 조회 (다음 페이지는 next_cursor를 cursor로 넘겨 조회)
+    응답: {"items": [... score 포함], "next_cursor": ..., "total": n, "facets": {필드: {값: 문제 수}}}
+    """
+    def build():
+        query = request.args.get('q', '').strip()
+        # 커서는 같은 검색어로만 이어서 조회할 수 있음
+        sort = f"search:{query}"
+        limit = min(max(request.args.get('limit', default=SEARCH_DEFAULT_LIMIT, type=int), 1), LISTING_MAX_LIMIT)
+        try:
+            view, facets = data_manager.search_questions(query, question_search_filters(request.args))
+            after = decode_cursor(request.args['cursor'], sort) if request.args.get('cursor') else None
+        except ValueError as e:
+            return jsonify(success=False, message=str(e)), 400
+        pairs, next_key = view.page(after, limit)
+        return jsonify(
+            items=[dict(question_summary(q), score=round(score, 4)) for score, q in pairs],
+            next_cursor=encode_cursor(sort, next_key) if next_key is not None else None,
+            total=len(view),
+            facets=facets
+        )
+    return conditional_response(data_manager.data_version('questions'), build)
 
 @app.route('/api/departments')
 def api_departments():
     """부서 목록 API"""
-    departments = data_manager.load_departments()
-    return jsonify([{'id': dept.id, 'name': dept.name} for dept in departments])
+    return conditional_response(
+        data_manager.data_version('departments'),
+        lambda: jsonify([{'id': dept.id, 'name': dept.name} for dept in data_manager.load_departments()])
+    )
 
 @app.route('/api/candidates')
 def api_candidates():
-    """지원자 목록 API"""
-    candidates = data_manager.get_all_candidates()
-    return jsonify([c.to_dict() for c in candidates])
+    """지원자 목록 API (department_id/access_date 필터, 정렬, 페이지 조회)"""
+    return conditional_response(
+        data_manager.data_version('candidates'),
+        lambda: listing_response('candidates', 'created_at', lambda candidates: [c.to_dict() for c in candidates])
+    )
+
+def result_summaries(pairs):
+    """(지원자, 결과) 목록 → 지원자 이름/부서, 부서별/응시일별 순위를 포함한 결과 dict 목록"""
+    cohort_ranks = data_manager.get_cohort_ranks([c.id for c, _ in pairs])
+    return [
+        dict(r.to_dict(), candidate_name=c.name, department_id=c.department_id, access_date=c.access_date,
+             **cohort_ranks[c.id])
+        for c, r in pairs
+    ]
 
 @app.route('/api/results')
 def api_results():
-    """평가 결과 목록 API"""
-    results = data_manager.get_all_results()
-    return jsonify([r.to_dict() for r in results])
+    """평가 결과 목록 API (지원자 이름/부서, 부서별/응시일별 순위 포함)
+    
+    기본 정렬은 전체 순위. department_id 또는 access_date를 주면 해당 코호트의 결과만 반환
+    """
+    return conditional_response(
+        data_manager.data_version('candidates', 'results'),
+        lambda: listing_response('results', 'rank', result_summaries)
+    )
 
 @app.route('/api/random_questions', methods=['GET'])
 def api_random_questions_get():
@@ -702,38 +838,73 @@ def admin_answer_detail(candidate_id):
     if not candidate or not result:
         return redirect(url_for('admin'))
     
-    # 모든 문제 로드 (기술 + 문제해결)
-    all_questions = data_manager.load_questions()
-    
-    # 지원자에게 출제된 문제가 있으면 해당 문제만, 없으면 모든 문제 사용
-    selected_ids = getattr(candidate, 'selected_questions', [])
-    if selected_ids:
-        selected_questions = [q for q in all_questions if q.id in selected_ids]
-    else:
-        # 선택된 문제가 없으면 모든 문제 사용
-        selected_questions = all_questions
+    # 지원자에게 출제된 문제가 있으면 해당 문제만 출제 순서대로, 없으면 모든 문제 사용
+    selected_questions = data_manager.get_candidate_questions(candidate_id)
     
     # 답변 매핑 - 출제된 문제에 대해서만 처리
     answers = []
     for question in selected_questions:
         answer = result.answers.get(question.id, '')
         if answer:
+            # 제출 시 저장된 채점 상세 사용 (정답표가 바뀐 문제만 다시 채점)
+            grading = result.get_grading(question)
             answers.append({
                 'question': question,
                 'answer': answer,
-                'is_correct': question.is_correct(answer),
-                'answered': True
+                'is_correct': grading['correct'],
+                'answered': True,
+                'points': grading['points'],
+                # 주관식은 어떤 채점 키워드가 답안에 들어 있었는지 표시
+                'matched_keywords': grading['matched_keywords']
             })
         else:
             answers.append({
                 'question': question,
                 'answer': '',
                 'is_correct': False,
-                'answered': False
+                'answered': False,
+                'points': 0,
+                'matched_keywords': []
             })
     
     return render_template('admin_answer_detail.html', candidate=candidate, result=result, answers=answers)
 
+@app.route('/admin/results/export')
+@admin_login_required
+def export_results():
+    """평가 결과 내보내기 (format=csv|xlsx, department_id/access_date 필터, 순위 순서)
+    
+    CSV는 view=summary(지원자별 요약, 기본) 또는 view=questions(문항별 채점) 중 하나를,
+    XLSX는 두 시트를 모두 담는다.
+    """
+    export_format = request.args.get('format', 'csv')
+    view = request.args.get('view', 'summary')
+    if export_format not in ('csv', 'xlsx') or view not in ('summary', 'questions'):
+        return jsonify(success=False, message="format은 csv/xlsx, view는 summary/questions 중 하나여야 합니다."), 400
+    if export_format == 'xlsx' and results_export.Workbook is None:
+        return jsonify(success=False, message="XLSX 파일을 만들려면 openpyxl을 설치해야 합니다."), 400
+    filters = {field: request.args[field] for field in ('department_id', 'access_date') if request.args.get(field)}
+    # 정렬된 뷰는 캐시된 목록이므로 내보내는 동안 데이터가 바뀌어도 요청 시점의 목록을 그대로 사용
+    pairs = data_manager.get_listing('results', filters, 'rank').items
+    department_names = {d.id: d.name for d in data_manager.load_departments()}
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    if export_format == 'csv':
+        make_rows = results_export.summary_rows if view == 'summary' else results_export.question_rows
+        body = results_export.iter_csv(make_rows(data_manager, pairs, department_names))
+        mimetype = 'text/csv; charset=utf-8'
+        filename = f'results_{view}_{stamp}.csv'
+    else:
+        body = results_export.iter_xlsx([
+            ('결과 요약', results_export.summary_rows(data_manager, pairs, department_names)),
+            ('문항별 채점', results_export.question_rows(data_manager, pairs, department_names)),
+        ])
+        mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        filename = f'results_{stamp}.xlsx'
+    response = Response(body, mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
 @app.route('/admin/candidate/add', methods=['POST'])
 def add_candidate():
     """관리자가 지원자 사전 등록"""
@@ -751,36 +922,81 @@ def add_candidate():
     # 부서 미지정 시 기본 부서 할당
     if not candidate.department_id:
         candidate.department_id = 'dept_1'
-    all_questions = data_manager.load_questions()
-    department_questions = [q for q in all_questions if candidate.department_id in q.department_ids]
-    # 카테고리별 문제 분류
-    java_mc = [q for q in department_questions if q.category == 'Java' and q.type == '객관식']
-    java_sub = [q for q in department_questions if q.category == 'Java' and q.type == '주관식']
-    db_mc = [q for q in department_questions if q.category == 'Database' and q.type == '객관식']
-    db_sub = [q for q in department_questions if q.category == 'Database' and q.type == '주관식']
-    ps_mc = [q for q in department_questions if q.category == '문제해결' and q.type == '객관식']
-    # 출제 개수 설정값 적용
-    random_config = load_random_config()
-    java_mc_count = random_config.get('java_mc_count', 0)
-    java_sub_count = random_config.get('java_sub_count', 0)
-    db_mc_count = random_config.get('db_mc_count', 0)
-    db_sub_count = random_config.get('db_sub_count', 0)
-    ps_mc_count = random_config.get('ps_mc_count', 0)
-    import random
-    selected_java_mc = random.sample(java_mc, min(len(java_mc), java_mc_count))
-    selected_java_sub = random.sample(java_sub, min(len(java_sub), java_sub_count))
-    selected_db_mc = random.sample(db_mc, min(len(db_mc), db_mc_count))
-    selected_db_sub = random.sample(db_sub, min(len(db_sub), db_sub_count))
-    selected_ps_mc = random.sample(ps_mc, min(len(ps_mc), ps_mc_count))
-    selected_ids = ([q.id for q in selected_java_mc] + [q.id for q in selected_java_sub] + 
-                   [q.id for q in selected_db_mc] + [q.id for q in selected_db_sub] + 
-                   [q.id for q in selected_ps_mc])
-    candidate.selected_questions = selected_ids
+    candidate.selected_questions = draw_exam_questions(candidate.department_id)
     # --------------------------------------------------------
     data_manager.save_candidate(candidate)
     
     return jsonify(success=True, message="지원자가 등록되었습니다.", candidate=candidate.to_dict())
 
+# 일괄 등록 CSV 헤더(한글) → 필드 이름
+BULK_CANDIDATE_COLUMNS = {
+    '이름': 'name',
+    '접속가능일': 'access_date',
+    '부서': 'department',
+    '평가시간': 'test_duration',
+}
+
+@app.route('/admin/candidate/bulk_add', methods=['POST'])
+@admin_login_required
+def bulk_add_candidates():
+    """관리자가 지원자 여러 명을 한 번에 사전 등록 (CSV 파일 또는 JSON 목록)
+    
+    행마다 name, access_date, department(부서 id 또는 이름), test_duration을 받고,
+    문제는 캐시된 출제 풀에서 뽑아 전체를 한 번에 저장한 뒤 행별 처리 결과를 반환한다.
+    """
+    upload = request.files.get('file')
+    if upload:
+        text = io.TextIOWrapper(upload.stream, encoding='utf-8-sig')
+        rows = [{BULK_CANDIDATE_COLUMNS.get(k.strip(), k.strip()): (v or '').strip() for k, v in row.items() if k}
+                for row in csv.DictReader(text)]
+    else:
+        data = request.get_json(silent=True)
+        rows = data.get('candidates') if isinstance(data, dict) else data
+        if not isinstance(rows, list):
+            return jsonify(success=False, message="CSV 파일 또는 지원자 목록(JSON)을 보내야 합니다.")
+    
+    departments = data_manager.load_departments()
+    department_ids = {d.id for d in departments}
+    department_by_name = {d.name: d.id for d in departments}
+    # 출제 설정은 한 번만 읽어 모든 지원자에게 사용
+    random_config = load_random_config()
+    
+    candidates = []
+    statuses = []
+    for row_number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            statuses.append({'row': row_number, 'success': False, 'message': "행 형식이 올바르지 않습니다."})
+            continue
+        name = str(row.get('name') or '').strip()
+        access_date = str(row.get('access_date') or '').strip()
+        department = str(row.get('department') or row.get('department_id') or '').strip()
+        if not name or not access_date:
+            statuses.append({'row': row_number, 'success': False, 'message': "이름과 접속 가능 날짜를 모두 입력해야 합니다."})
+            continue
+        try:
+            test_duration = int(row.get('test_duration') or 10)
+        except (TypeError, ValueError):
+            statuses.append({'row': row_number, 'success': False, 'message': "평가 시간은 숫자여야 합니다."})
+            continue
+        # 부서 미지정 시 기본 부서 할당, 부서는 id 또는 이름으로 지정
+        if not department:
+            department_id = 'dept_1'
+        elif department in department_ids:
+            department_id = department
+        elif department in department_by_name:
+            department_id = department_by_name[department]
+        else:
+            statuses.append({'row': row_number, 'success': False, 'message': f"존재하지 않는 부서입니다: {department}"})
+            continue
+        candidate = Candidate(name=name, access_date=access_date, test_duration=test_duration, department_id=department_id)
+        candidate.selected_questions = draw_exam_questions(department_id, random_config)
+        candidates.append(candidate)
+        statuses.append({'row': row_number, 'success': True, 'candidate_id': candidate.id, 'name': name})
+    
+    data_manager.save_candidates(candidates)
+    failed = len(statuses) - len(candidates)
+    return jsonify(success=failed == 0, message=f"{len(candidates)}명 등록, {failed}건 실패", results=statuses)
+
 @app.route('/api/check_name', methods=['POST'])
 def check_name():
     """이름 검증 API - 사전 등록된 이름인지 확인"""
@@ -791,14 +1007,9 @@ def check_name():
         if not name:
             return jsonify({'valid': False, 'message': '이름을 입력해주세요.'})
         
-        # 모든 지원자 목록에서 이름 확인
-        candidates = data_manager.get_all_candidates()
-        matched_candidate = None
-        
-        for candidate in candidates:
-            if candidate.name == name:
-                matched_candidate = candidate
-                break
+        # 이름 인덱스에서 확인 (동명이인이면 먼저 등록된 지원자)
+        matches = data_manager.get_candidates_by_name(name)
+        matched_candidate = matches[0] if matches else None
         
         if matched_candidate:
             # 접속 가능 날짜 확인
@@ -845,10 +1056,12 @@ def edit_candidate(candidate_id):
         candidate = data_manager.get_candidate(candidate_id)
         if not candidate:
             return jsonify(success=False, message="지원자를 찾을 수 없습니다.")
+        # 캐시된 객체를 공유하므로 형 변환이 실패하기 전에는 값을 바꾸지 않음
+        test_duration = int(test_duration)
         # 입력값으로 갱신
         candidate.name = name
         candidate.access_date = access_date
-        candidate.test_duration = int(test_duration)
+        candidate.test_duration = test_duration
         candidate.department_id = department_id
         # 저장
         updated_candidate = data_manager.update_candidate(candidate)
@@ -862,16 +1075,11 @@ def edit_candidate(candidate_id):
 @app.route('/admin/match')
 def candidate_question_match():
     """지원자와 문제를 수동으로 매칭하는 페이지"""
-    all_candidates = data_manager.get_all_candidates()
     all_questions = data_manager.load_questions()
     all_departments = data_manager.load_departments()
-    all_results = data_manager.get_all_results()
     
-    # 평가완료된 지원자 ID 목록 생성
-    completed_candidate_ids = {result.candidate_id for result in all_results}
-    
-    # 평가 미완료 지원자만 필터링
-    incomplete_candidates = [c for c in all_candidates if c.id not in completed_candidate_ids]
+    # 평가 미완료 지원자만 필터링 (지원자-결과 조인 한 번으로 처리)
+    incomplete_candidates = [c for c, r in data_manager.get_candidates_with_results() if r is None]
     
     # 부서 이름을 id에 매핑시켜두면 템플릿에서 사용하기 편리함
     department_map = {d.id: d.name for d in all_departments}
@@ -910,14 +1118,9 @@ def add_department():
         return jsonify(success=False, message="이미 존재하는 부서명입니다."), 409
     department = Department(name)
     data_manager.save_department(department)
-    # 선택된 문제들 부서 할당
+    # 선택된 문제들 부서 할당 (할당된 문제만 저장)
     if assign_questions:
-        questions = data_manager.load_questions()
-        for q in questions:
-            if q.id in assign_questions:
-                if department.id not in q.department_ids:
-                    q.department_ids.append(department.id)
-        data_manager.save_all_questions(questions)
+        data_manager.add_department_questions(department.id, assign_questions)
     return jsonify(success=True, message="부서가 추가되었습니다.", department=department.to_dict())
 
 @app.route('/admin/departments/assign_questions', methods=['POST'])
@@ -927,6 +1130,8 @@ def assign_questions_to_department():
     department_id = data.get('department_id')
     question_ids = data.get('question_ids', [])
     filter_conditions = data.get('filter_conditions', {})  # 필터 조건 추가
+    if not isinstance(filter_conditions, dict):
+        filter_conditions = {}
     
     if not department_id:
         return jsonify(success=False, message="부서를 선택해야 합니다."), 400
@@ -935,55 +1140,29 @@ def assign_questions_to_department():
     if isinstance(question_ids, str):
         question_ids = [question_ids]
     
-    questions = data_manager.load_questions()
+    # 필터 조건이 있으면 조건에 맞는 문제만 할당/해제 대상 (화면에 보이는 문제만 바뀌도록)
+    department_filter = filter_conditions.get('department')
+    category = filter_conditions.get('category')
+    question_type = filter_conditions.get('type')
     
-    # 필터 조건에 맞는 문제들만 처리
-    filtered_questions = []
-    for q in questions:
-        # 부서 필터 로직
-        dept_match = True
-        if filter_conditions.get('department') == 'unassigned':
-            # 미지정 필터: 미지정 문제만
-            dept_match = (not q.department_ids or len(q.department_ids) == 0)
-        elif filter_conditions.get('department') == 'current':
-            # 현재 부서 필터: 해당 부서 문제만
-            dept_match = (q.department_ids and department_id in q.department_ids)
-        elif filter_conditions.get('department') and filter_conditions.get('department') not in ['all', 'current', 'unassigned']:
-            # 특정 부서 필터: 해당 부서 문제만
-            dept_match = (q.department_ids and filter_conditions.get('department') in q.department_ids)
-        
-        # 카테고리 필터
-        category_match = not filter_conditions.get('category') or q.category == filter_conditions.get('category')
-        
-        # 유형 필터
-        type_match = not filter_conditions.get('type') or q.type == filter_conditions.get('type')
-        
-        if dept_match and category_match and type_match:
-            filtered_questions.append(q)
+    def in_scope(q):
+        if department_filter == 'unassigned' and q.department_ids:
+            return False
+        if department_filter == 'current' and department_id not in q.department_ids:
+            return False
+        if department_filter not in (None, '', 'all', 'current', 'unassigned') and department_filter not in q.department_ids:
+            return False
+        if category and q.category != category:
+            return False
+        if question_type and q.type != question_type:
+            return False
+        return True
     
-    # 디버깅 로그
-    print(f"부서 ID: {department_id}")
-    print(f"선택된 문제 수: {len(question_ids)}")
-    print(f"필터 조건: {filter_conditions}")
-    print(f"필터링된 문제 수: {len(filtered_questions)}")
-    print(f"필터링된 문제 ID들: {[q.id for q in filtered_questions]}")
-    
-    # 필터링된 문제들만 처리
-    for q in filtered_questions:
-        # 현재 부서에 할당할 문제들
-        if q.id in question_ids:
-            # 해당 부서가 이미 할당되어 있지 않으면 추가
-            if department_id not in q.department_ids:
-                q.department_ids.append(department_id)
-                print(f"문제 {q.id}를 부서 {department_id}에 할당")
-        # 현재 부서에서 해제할 문제들 (question_ids에 없는 문제들)
-        elif department_id in q.department_ids and q.id not in question_ids:
-            # 해당 부서에서 제거
-            q.department_ids.remove(department_id)
-            print(f"문제 {q.id}를 부서 {department_id}에서 해제")
-    
-    data_manager.save_all_questions(questions)
-    return jsonify(success=True, message="문제 할당이 성공적으로 업데이트되었습니다.")
+    changes = data_manager.assign_department_questions(
+        department_id, question_ids, scope=in_scope if (department_filter or category or question_type) else None
+    )
+    return jsonify(success=True, message="문제 할당이 성공적으로 업데이트되었습니다.",
+                   added=changes['added'], removed=changes['removed'])
 
 @app.route('/admin/departments/delete/<department_id>', methods=['DELETE'])
 def delete_department_route(department_id):
@@ -998,15 +1177,10 @@ def delete_department_route(department_id):
 def unassign_question_department(question_id):
     """문제의 부서 할당만 해제하는 API"""
     try:
-        questions = data_manager.load_questions()
-        found = False
-        for q in questions:
-            if q.id == question_id:
-                q.department_ids = []
-                found = True
-                break
-        if found:
-            data_manager.save_all_questions(questions)
+        question = data_manager.get_question(question_id)
+        if question:
+            question.department_ids = []
+            data_manager.save_question(question)
             return jsonify({'success': True, 'message': '문제의 부서 할당이 해제되었습니다.'})
         else:
             return jsonify({'success': False, 'message': '문제를 찾을 수 없습니다.'})
@@ -1017,16 +1191,13 @@ def unassign_question_department(question_id):
 
 @app.route('/api/random_config', methods=['GET'])
 def get_random_config():
-    config = load_random_config()
-    print(f"API 호출 - 반환할 설정: {config}")  # 디버깅 로그
-    response = jsonify(config)
-    # 완전한 캐시 방지 헤더 추가
-    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate, max-age=0, private'
-    response.headers['Pragma'] = 'no-cache'
-    response.headers['Expires'] = '-1'
-    response.headers['Last-Modified'] = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
-    response.headers['ETag'] = str(hash(str(config)))  # 고유 ETag 추가
-    return response
+    """랜덤 출제 개수 설정 (설정 파일이 바뀌지 않았으면 304)"""
+    try:
+        stat = os.stat(RANDOM_CONFIG_FILE)
+        version = ('random_config', stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    except OSError:
+        version = ('random_config', None)
+    return conditional_response(version, lambda: jsonify(load_random_config()))
 
 @app.route('/api/random_config', methods=['POST'])
 def set_random_config():
@@ -1267,13 +1438,153 @@ def migrate_questions_department_ids():
     else:
         print('변경사항 없음. 이미 최신 구조입니다.')
 
+@app.route('/admin/cache_stats', methods=['GET'])
+@admin_login_required
+def get_cache_stats():
+    """데이터 캐시 적중/미적중 통계 API"""
+    return jsonify(data_manager.get_cache_stats())
+
+@app.route('/admin/results/regrade', methods=['POST'])
+@admin_login_required
+def regrade_all_results():
+    """현재 정답표로 전체 결과 재채점 (정답 수정 후 사용, 단계별 소요 시간 보고)"""
+    report = data_manager.regrade_all_results()
+    message = (f"{report['results']}건 재채점 완료 (점수 변경 {report['changed']}건, "
+               f"문항 채점 상세 갱신 {report['gradings_refreshed']}건, {report['engine']} 채점 {report['score_ms']}ms, 저장 {report['write_ms']}ms)")
+    return jsonify(success=True, message=message, report=report)
+
 @app.route('/api/ping')
 def api_ping():
     """
     클라이언트에서 서버 연결 유지를 위해 주기적으로 호출하는 핑 엔드포인트
+    (응시 화면은 /api/exam/events SSE 채널을 사용, 하위 호환용으로 유지)
     """
     return 'pong', 200
 
+@app.route('/api/exam/events')
+def exam_events():
+    """응시 화면용 SSE 채널
+    
+    요청을 반복하는 폴링 대신 연결 하나를 유지하며 다음 이벤트를 보낸다.
+    - time: 서버 마감 기준 남은 시간 (접속 시, keepalive 때마다)
+    - notice: 관리자 공지, 종료 5분 전 자동 공지
+    - finalized: 마감으로 자동 제출됨
+    재접속(Last-Event-ID 헤더가 있는 경우) 시에만 그 이후의 공지를 이어서 보내고,
+    처음 접속한 연결은 접속 이후 발행된 이벤트만 받는다.
+    """
+    if 'candidate_id' not in session:
+        return jsonify(success=False, message='세션이 만료되었습니다.'), 400
+    candidate = data_manager.get_candidate(session['candidate_id'])
+    if not candidate:
+        return jsonify(success=False, message='지원자 정보를 찾을 수 없습니다.'), 400
+    candidate_id = candidate.id
+    deadline = candidate.deadline_timestamp()
+    channels = [EXAM_BROADCAST_CHANNEL, f'exam:{candidate_id}']
+    try:
+        last_seq = int(request.headers['Last-Event-ID'])
+    except (KeyError, ValueError):
+        last_seq = None
+    
+    def time_event():
+        remaining = max(0, int(deadline - time.time())) if deadline is not None else None
+        return f"event: time\ndata: {json.dumps({'remaining': remaining})}\n\n"
+    
+    def stream():
+        # 처음 접속이면 지난 공지는 다시 보내지 않도록 구독 직전의 순번부터 이어서 보냄
+        sent_seq = event_bus.last_seq if last_seq is None else last_seq
+        # 먼저 구독한 뒤 놓친 공지를 보내고, 큐에 중복으로 들어온 이벤트는 순번으로 건너뜀
+        with event_bus.subscribe(channels) as subscription:
+            yield "retry: 5000\n\n"
+            yield time_event()
+            for event in event_bus.since(sent_seq, channels)[0] or []:
+                sent_seq = event.seq
+                yield event.to_sse()
+                if event.name == 'finalized':
+                    return
+            warned = deadline is None or deadline - time.time() <= EXAM_WARNING_SECONDS
+            while True:
+                timeout = EXAM_EVENT_KEEPALIVE_SECONDS
+                if not warned:
+                    timeout = max(0, min(timeout, deadline - EXAM_WARNING_SECONDS - time.time()))
+                event = subscription.get(timeout=timeout)
+                if event is not None:
+                    if event.seq > sent_seq:
+                        sent_seq = event.seq
+                        yield event.to_sse()
+                    if event.name == 'finalized':
+                        return
+                    continue
+                if not warned and deadline - time.time() <= EXAM_WARNING_SECONDS:
+                    warned = True
+                    notice = {'message': f'종료 {EXAM_WARNING_SECONDS // 60}분 전입니다.'}
+                    yield f"event: notice\ndata: {json.dumps(notice, ensure_ascii=False)}\n\n"
+                yield ": keepalive\n\n"
+                yield time_event()
+    
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+def candidate_status(candidate, result):
+    """대시보드 표시용 응시 상태 (completed / in_progress / registered)"""
+    if result:
+        return 'completed'
+    return 'in_progress' if candidate.test_started_at else 'registered'
+
+@app.route('/admin/api/dashboard')
+@admin_login_required
+def admin_dashboard_snapshot():
+    """실시간 대시보드 초기 데이터 (이후 변경분은 seq를 커서로 /admin/api/changes에서 조회)"""
+    # 데이터를 읽기 전에 커서를 잡아야 그 사이의 변경을 놓치지 않음 (중복 적용은 무해)
+    seq = event_bus.last_seq
+    candidates = []
+    for candidate, result in data_manager.get_candidates_with_results():
+        candidates.append({
+            'id': candidate.id,
+            'name': candidate.name,
+            'department_id': candidate.department_id,
+            'access_date': candidate.access_date,
+            'status': candidate_status(candidate, result),
+            'total_score': result.total_score if result else None,
+            'rank': result.rank if result else None
+        })
+    return jsonify(seq=seq, candidates=candidates)
+
+@app.route('/admin/api/changes')
+@admin_login_required
+def admin_changes():
+    """since 이후의 지원자/결과 변경분 (long-poll: 변경이 없으면 wait초까지 대기)
+    
+    reset이 true이면 변경분 보관 범위를 벗어난 것이므로 /admin/api/dashboard를 다시 조회해야 한다.
+    """
+    since = request.args.get('since', default=0, type=int)
+    wait = min(max(request.args.get('wait', default=0, type=float), 0), ADMIN_CHANGES_MAX_WAIT)
+    channels = [ADMIN_CHANGES_CHANNEL]
+    events, seq = event_bus.since(since, channels)
+    if events == [] and wait > 0:
+        # 구독한 뒤 다시 확인해야 조회와 대기 사이에 발행된 변경을 놓치지 않음
+        with event_bus.subscribe(channels) as subscription:
+            events, seq = event_bus.since(since, channels)
+            if events == [] and subscription.get(timeout=wait) is not None:
+                events, seq = event_bus.since(since, channels)
+    if events is None:
+        return jsonify(seq=seq, reset=True, changes=[])
+    return jsonify(seq=seq, reset=False, changes=[
+        {'seq': event.seq, 'event': event.name, 'data': event.data} for event in events
+    ])
+
+@app.route('/admin/exam/broadcast', methods=['POST'])
+@admin_login_required
+def exam_broadcast():
+    """응시 중인 지원자에게 공지 전송 (candidate_id를 주면 해당 지원자에게만)"""
+    data = request.get_json(silent=True) or {}
+    message = (data.get('message') or '').strip()
+    if not message:
+        return jsonify(success=False, message="공지 내용을 입력해주세요.")
+    candidate_id = data.get('candidate_id')
+    channel = f'exam:{candidate_id}' if candidate_id else EXAM_BROADCAST_CHANNEL
+    event_bus.publish(channel, 'notice', {'message': message})
+    return jsonify(success=True, message="공지가 전송되었습니다.")
+
 @app.route('/admin/api_keys', methods=['GET'])
 def get_api_keys():
     config_path = os.path.join(BASE_DIR, 'config.json')
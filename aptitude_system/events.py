@@ -0,0 +1,105 @@
+"""
+프로세스 내 이벤트 버스 (SSE 스트림용)
+
+발행된 이벤트에는 전역 순번(seq)을 붙이고 최근 이벤트를 일정 개수 보관해,
+재접속한 클라이언트가 마지막으로 받은 순번(Last-Event-ID) 이후 이벤트를 이어서 받을 수 있게 한다.
+구독자는 채널별 큐로 이벤트를 받으므로 대기 중인 연결은 큐에서 잠들어 있을 뿐 요청을 반복하지 않는다.
+
+이벤트는 같은 프로세스의 구독자에게만 전달된다. 여러 워커로 실행하면 다른 워커에서 발행된 공지/변경 피드를
+받지 못하므로, SSE 스트림과 변경 피드를 쓰는 앱은 반드시 비동기 워커 하나로 서비스한다.
+(예: gunicorn -k gevent -w 1 app:app)
+"""
+
+import json
+import queue
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class Event:
+    def __init__(self, seq: int, channel: str, name: str, data):
+        self.seq = seq
+        self.channel = channel
+        self.name = name
+        self.data = data
+
+    def to_sse(self) -> str:
+        """SSE 전송 형식 (id/event/data)"""
+        return f"id: {self.seq}\nevent: {self.name}\ndata: {json.dumps(self.data, ensure_ascii=False)}\n\n"
+
+
+class Subscription:
+    """구독 중인 채널의 이벤트를 받는 큐 (with 블록을 벗어나면 구독 해제)"""
+
+    def __init__(self, bus: 'EventBus', channels: Iterable[str]):
+        self.bus = bus
+        self.channels = set(channels)
+        self.queue: 'queue.Queue[Event]' = queue.Queue()
+
+    def get(self, timeout: float = None) -> Optional[Event]:
+        """다음 이벤트 (timeout 동안 없으면 None)"""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    """채널 기반 발행/구독"""
+
+    def __init__(self, history: int = 1000):
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._history: deque = deque(maxlen=history)
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def publish(self, channel: str, name: str, data=None) -> int:
+        """채널에 이벤트 발행 후 순번 반환"""
+        with self._lock:
+            self._seq += 1
+            event = Event(self._seq, channel, name, data)
+            self._history.append(event)
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.queue.put(event)
+        return event.seq
+
+    def subscribe(self, channels: Iterable[str]) -> Subscription:
+        subscription = Subscription(self, channels)
+        with self._lock:
+            for channel in subscription.channels:
+                self._subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscribers.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[channel]
+
+    def since(self, seq: int, channels: Iterable[str]) -> Tuple[Optional[List[Event]], int]:
+        """(seq 이후 보관 중인 채널 이벤트, 현재 마지막 순번)
+        
+        보관 범위를 벗어나 일부가 빠졌으면 이벤트 대신 None. 마지막 순번은 같은 잠금 안에서 읽으므로
+        다음 조회의 커서로 쓰면 그 사이 발행된 이벤트를 놓치지 않는다.
+        """
+        channels = set(channels)
+        with self._lock:
+            if self._history and seq < self._history[0].seq - 1:
+                return None, self._seq
+            events = [event for event in self._history if event.seq > seq and event.channel in channels]
+            return events, self._seq
@@ -0,0 +1,87 @@
+"""
+응시 마감 스케줄러
+
+응시 마감 시각을 힙(마감 시각 순)으로 관리하고, 백그라운드 스레드가 가장 이른 마감까지만 잠들었다가
+마감이 지난 응시를 콜백으로 자동 종료한다. 전체 지원자를 주기적으로 훑지 않는다.
+마감이 바뀌거나 취소된 응시의 힙 항목은 지우지 않고 꺼낼 때 건너뛴다.
+
+힙은 프로세스 메모리에만 있으므로 워커가 시작될 때 저장된 응시 시작/마감 시각으로 다시 구성하고
+(app.start_exam_scheduler), 다른 워커에서 시작된 응시는 예약되지 않으므로 앱은 워커 하나로 실행한다.
+"""
+
+import heapq
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class DeadlineScheduler:
+    """마감 시각 순 힙 기반 자동 종료 스케줄러
+
+    on_expire(candidate_id, deadline)는 마감이 지난 응시마다 한 번 호출된다.
+    여러 워커 프로세스가 각자 스케줄러를 돌려도 되도록 콜백은 중복 호출에 안전해야 한다.
+    """
+
+    def __init__(self, on_expire: Callable[[str, float], None]):
+        self.on_expire = on_expire
+        self._heap: List[Tuple[float, str]] = []
+        # 지원자 id → 현재 유효한 마감 (힙에 남은 예전 항목과 구분)
+        self._deadlines: Dict[str, float] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, candidate_id: str, deadline: float):
+        """응시 마감 등록 (이미 있으면 새 마감으로 교체)"""
+        with self._condition:
+            self._deadlines[candidate_id] = deadline
+            heapq.heappush(self._heap, (deadline, candidate_id))
+            # 가장 이른 마감이 바뀌었을 수 있으므로 대기 중인 스레드를 깨움
+            self._condition.notify()
+
+    def cancel(self, candidate_id: str):
+        """제출 완료 등으로 더 이상 자동 종료할 필요가 없는 응시 제거"""
+        with self._condition:
+            self._deadlines.pop(candidate_id, None)
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._deadlines)
+
+    def _pop_expired(self, now: float) -> List[Tuple[str, float]]:
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, candidate_id = heapq.heappop(self._heap)
+            if self._deadlines.get(candidate_id) == deadline:
+                del self._deadlines[candidate_id]
+                expired.append((candidate_id, deadline))
+        return expired
+
+    def run_pending(self, now: float = None) -> List[str]:
+        """마감이 지난 응시를 모두 종료하고 종료한 지원자 id 목록 반환"""
+        with self._condition:
+            expired = self._pop_expired(time.time() if now is None else now)
+        for candidate_id, deadline in expired:
+            try:
+                self.on_expire(candidate_id, deadline)
+            except Exception as e:
+                print(f"응시 자동 종료 실패 ({candidate_id}): {e}")
+        return [candidate_id for candidate_id, _ in expired]
+
+    def start(self):
+        """백그라운드 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="exam-deadline-scheduler", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                # 취소된 항목이 맨 앞에 쌓여 있으면 먼저 정리
+                while self._heap and self._deadlines.get(self._heap[0][1]) != self._heap[0][0]:
+                    heapq.heappop(self._heap)
+                timeout = self._heap[0][0] - time.time() if self._heap else None
+                if timeout is None or timeout > 0:
+                    self._condition.wait(timeout)
+            self.run_pending()
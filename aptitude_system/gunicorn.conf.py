@@ -0,0 +1,17 @@
+"""
+gunicorn 설정 (gunicorn -c gunicorn.conf.py app:app)
+
+응시 이벤트(SSE)/관리자 변경 피드는 프로세스 내 이벤트 버스로, 응시 마감 자동 종료는 프로세스 내 스케줄러로
+동작하므로 비동기 워커 하나로 실행한다.
+"""
+
+bind = "0.0.0.0:5000"
+worker_class = "gevent"
+workers = 1
+worker_connections = 1000
+
+
+def post_worker_init(worker):
+    """워커가 뜨자마자 저장된 응시 시작/마감 시각으로 자동 종료 스케줄러를 다시 구성 (첫 요청을 기다리지 않음)"""
+    from app import start_exam_scheduler
+    start_exam_scheduler()
@@ -0,0 +1,79 @@
+"""
+목록 API용 정렬 뷰/커서 페이지네이션/필드 선택
+
+필터·정렬 조합마다 항목을 (정렬 값, id) 순서로 한 번만 정렬해 두고(SortedView),
+페이지는 커서(마지막으로 본 항목의 정렬 값과 id) 다음 위치를 이진 탐색으로 찾아 잘라낸다.
+커서는 위치가 아니라 값이므로 페이지를 넘기는 사이 항목이 추가/삭제되어도 중복·누락이 없다.
+"""
+
+import base64
+import bisect
+import json
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def sort_value(value):
+    """None이 섞여 있어도 비교할 수 있는 정렬 값 (None은 맨 뒤)"""
+    return (value is None, value if value is not None else 0)
+
+
+def _as_tuple(value):
+    """JSON에서 리스트로 바뀐 키를 다시 튜플로 (중첩 포함)"""
+    if isinstance(value, list):
+        return tuple(_as_tuple(v) for v in value)
+    return value
+
+
+def encode_cursor(sort: str, key: Tuple) -> str:
+    """정렬 기준과 마지막 항목의 키를 URL에 넣을 수 있는 문자열로"""
+    payload = json.dumps({"s": sort, "k": key}, ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple:
+    """encode_cursor의 역 (형식이 잘못되었거나 다른 정렬 기준의 커서면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        key = _as_tuple(payload["k"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+    if payload.get("s") != sort:
+        raise ValueError("커서의 정렬 기준이 요청과 다릅니다.")
+    return key
+
+
+def project(record: Dict, fields: Optional[Iterable[str]]) -> Dict:
+    """요청한 필드만 남김 (fields가 없으면 전체)"""
+    if not fields:
+        return record
+    return {field: record[field] for field in fields if field in record}
+
+
+class SortedView:
+    """항목을 (정렬 값, id) 오름차순으로 정렬해 둔 목록"""
+
+    def __init__(self, items: Iterable, value_of: Callable, id_of: Callable):
+        pairs = sorted(
+            (((sort_value(value_of(item)), id_of(item)), item) for item in items),
+            key=lambda pair: pair[0]
+        )
+        self.keys: List[Tuple] = [key for key, _ in pairs]
+        self.items: List = [item for _, item in pairs]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def page(self, after: Optional[Tuple], limit: int, descending: bool = False) -> Tuple[List, Optional[Tuple]]:
+        """after 키 다음부터 limit개와 다음 페이지 커서 키 (마지막 페이지면 None)"""
+        if not descending:
+            start = 0 if after is None else bisect.bisect_right(self.keys, after)
+            end = min(start + limit, len(self.keys))
+            items = self.items[start:end]
+            next_key = self.keys[end - 1] if items and end < len(self.keys) else None
+        else:
+            end = len(self.keys) if after is None else bisect.bisect_left(self.keys, after)
+            start = max(end - limit, 0)
+            items = self.items[start:end][::-1]
+            next_key = self.keys[start] if items and start > 0 else None
+        return items, next_key
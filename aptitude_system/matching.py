@@ -0,0 +1,86 @@
+"""
+주관식 채점용 키워드 매처
+
+문제의 키워드들을 Aho-Corasick 오토마톤으로 한 번 컴파일해 두고,
+답안은 정규화 후 한 번만 훑어서 어떤 키워드가 들어 있는지 찾는다.
+
+정규화 (키워드와 답안에 똑같이 적용):
+- NFKC: 전각 문자 → 반각, 초성/중성/종성으로 분리된 자모(NFD) → 조합된 한글 음절
+  (호환용 자모로 풀어 쓴 글자 "ㅇㅣㄴ"은 음절로 조합되지 않으므로 "인"과 다르게 봄)
+- 대소문자 구분 없음 (casefold)
+- 공백 제거 ("GROUP BY"와 "groupby"를 같은 것으로 봄)
+"""
+
+import unicodedata
+from collections import deque
+from typing import Dict, List, Set
+
+
+def normalize_text(text) -> str:
+    """키워드/답안 비교용 정규화 (NFKC + casefold + 공백 제거)"""
+    text = unicodedata.normalize("NFKC", str(text or "")).casefold()
+    return "".join(text.split())
+
+
+class KeywordMatcher:
+    """키워드 목록을 컴파일한 Aho-Corasick 매처 (같은 키워드가 중복되면 각각 따로 셈)"""
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = list(keywords)
+        # 상태별 전이/실패 링크/출력(키워드 인덱스 목록)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        # 정규화하면 빈 문자열이 되는 키워드는 항상 포함된 것으로 봄 (빈 문자열 in 답안 == True)
+        self._always: List[int] = []
+        for i, keyword in enumerate(self.keywords):
+            pattern = normalize_text(keyword)
+            if pattern:
+                self._add(pattern, i)
+            else:
+                self._always.append(i)
+        self._build()
+
+    def _add(self, pattern: str, keyword_index: int):
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(keyword_index)
+
+    def _build(self):
+        """너비 우선으로 실패 링크를 만들고 출력 목록을 실패 링크 쪽 것과 합침"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def match_indices(self, answer) -> Set[int]:
+        """답안에 포함된 키워드의 인덱스 집합"""
+        found = set(self._always)
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for ch in normalize_text(answer):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def matched_keywords(self, answer) -> List[str]:
+        """답안에 포함된 키워드 (원래 키워드 순서)"""
+        found = self.match_indices(answer)
+        return [keyword for i, keyword in enumerate(self.keywords) if i in found]
@@ -1,9 +1,20 @@
+import bisect
+import hashlib
 import json
+import random
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import wraps
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 import os
 
+import scoring
+from listing import SortedView
+from matching import KeywordMatcher, normalize_text
+from search import QuestionSearchIndex
+from storage import AnswerDraftLog, JsonFileStorage
+
 # BASE_DIR: models.py가 아닌 app.py 기준의 절대경로를 사용
 try:
     from app import BASE_DIR
@@ -23,6 +34,20 @@ class Candidate:
         self.test_duration = test_duration  # 분 단위, 기본 10분
         self.selected_questions = selected_questions or []  # 출제할 문제 ID 목록
         self.department_id = department_id # 부서 ID 추가
+        self.test_started_at = None  # 응시 시작 시각 (서버 기준)
+        self.test_deadline = None  # 응시 마감 시각 (서버 기준, 제한 시간 + 추가 시간)
+    
+    def start_test(self, grace_seconds: int = 0):
+        """응시 시작 시각과 마감 시각 기록"""
+        now = datetime.now()
+        self.test_started_at = now.isoformat()
+        self.test_deadline = (now + timedelta(minutes=int(self.test_duration), seconds=grace_seconds)).isoformat()
+    
+    def deadline_timestamp(self) -> Optional[float]:
+        """응시 마감 시각 (epoch 초, 아직 시작하지 않았으면 None)"""
+        if not self.test_deadline:
+            return None
+        return datetime.fromisoformat(self.test_deadline).timestamp()
     
     def to_dict(self) -> Dict:
         """지원자 정보를 딕셔너리로 변환"""
@@ -35,7 +60,9 @@ class Candidate:
             "access_date": self.access_date,
             "test_duration": self.test_duration,
             "selected_questions": self.selected_questions,
-            "department_id": self.department_id
+            "department_id": self.department_id,
+            "test_started_at": self.test_started_at,
+            "test_deadline": self.test_deadline
         }
     
     @classmethod
@@ -53,6 +80,8 @@ class Candidate:
         )
         # id 필드를 명시적으로 설정 (JSON에서 로드할 때 필요)
         candidate.id = data["id"]
+        candidate.test_started_at = data.get("test_started_at")
+        candidate.test_deadline = data.get("test_deadline")
         return candidate
 
 class Department:
@@ -93,16 +122,59 @@ class Question:
         else:
             self.department_ids = list(department_ids)
     
+    @property
+    def keyword_matcher(self) -> KeywordMatcher:
+        """키워드를 컴파일한 매처 (키워드 목록이 바뀌면 다시 컴파일)"""
+        keywords = tuple(self.keywords)
+        cached = getattr(self, '_keyword_matcher', None)
+        if cached is None or cached[0] != keywords:
+            cached = self._keyword_matcher = (keywords, KeywordMatcher(list(keywords)))
+        return cached[1]
+    
+    def matched_keywords(self, answer: str) -> List[str]:
+        """주관식 답안에 포함된 채점 키워드 목록"""
+        return self.keyword_matcher.matched_keywords(answer)
+    
+    @property
+    def answer_key_hash(self) -> str:
+        """채점에 영향을 주는 정답 정보(유형/정답/키워드/배점)의 해시 (저장된 채점 결과 무효화 판단용)"""
+        key = json.dumps([self.type, self.correct_answer, self.keywords, self.points], ensure_ascii=False)
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    
+    @property
+    def content_hash(self) -> str:
+        """문제 내용(카테고리/유형/문제/보기/정답/키워드)의 해시 (공백/대소문자 차이는 무시, 가져오기 중복 판단용)"""
+        key = json.dumps([
+            self.category, self.type, normalize_text(self.question),
+            [normalize_text(o) for o in self.options], normalize_text(self.correct_answer),
+            sorted(normalize_text(k) for k in self.keywords)
+        ], ensure_ascii=False)
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+    
+    def grade(self, answer: str) -> Dict:
+        """답안 채점 상세 (정답 여부, 획득 점수, 답안에 포함된 채점 키워드, 정답표 해시)"""
+        matched_keywords = []
+        if self.type == "주관식":
+            found = self.keyword_matcher.match_indices(answer)
+            matched_keywords = [kw for i, kw in enumerate(self.keywords) if i in found]
+            correct = len(found) >= len(self.keywords) * 0.6
+        else:
+            correct = self.is_correct(answer)
+        return {
+            "correct": correct,
+            "points": (self.points or 0) if correct else 0,
+            "matched_keywords": matched_keywords,
+            "key": self.answer_key_hash
+        }
+    
     def is_correct(self, answer: str) -> bool:
         """답안이 정답인지 확인"""
         if self.type == "객관식":
             return answer == self.correct_answer
         elif self.type == "주관식":
-            # 키워드 매칭 기반 채점
-            answer_lower = answer.lower()
-            correct_keywords = [kw.lower() for kw in self.keywords]
-            matched_keywords = sum(1 for kw in correct_keywords if kw in answer_lower)
-            return matched_keywords >= len(correct_keywords) * 0.6  # 60% 이상 매칭 시 정답
+            # 키워드 매칭 기반 채점 (답안을 한 번만 훑어 모든 키워드를 찾음)
+            matched_keywords = len(self.keyword_matcher.match_indices(answer))
+            return matched_keywords >= len(self.keywords) * 0.6  # 60% 이상 매칭 시 정답
         return False
 
     def to_dict(self) -> Dict:
@@ -157,6 +229,7 @@ class TestResult:
         }
         self.total_score = 0
         self.rank = 0
+        self.grading = {}  # 문제ID: 채점 상세 (Question.grade 결과)
     
     def add_answer(self, question_id: str, answer: str):
         """답안 추가"""
@@ -169,8 +242,9 @@ class TestResult:
         
         for question in questions:
             if question.id in self.answers:
-                answer = self.answers[question.id]
-                if question.is_correct(answer):
+                # 문항별 채점 상세도 함께 저장 (답안 상세 페이지에서 다시 채점하지 않도록)
+                grading = self.grading[question.id] = question.grade(self.answers[question.id])
+                if grading["correct"]:
                     if question.category in ["Java", "Database"]:
                         technical_score += question.points
                     elif question.category == "문제해결":
@@ -180,6 +254,17 @@ class TestResult:
         self.scores["problem_solving"] = problem_solving_score
         self.total_score = technical_score + problem_solving_score
     
+    def get_grading(self, question: Question) -> Dict:
+        """저장된 문항 채점 상세 (없거나 그 문제의 정답표가 바뀐 경우에만 다시 채점)
+        
+        다시 채점한 값은 반환만 하고 결과에 기록하지 않는다. 결과 객체는 캐시에 있어 여러 요청이
+        함께 읽으므로, 조회 중에 고치면 저장된 데이터와 달라지고 동시 요청끼리 경합한다.
+        """
+        grading = self.grading.get(question.id)
+        if grading is None or grading.get("key") != question.answer_key_hash:
+            grading = question.grade(self.answers.get(question.id, ''))
+        return grading
+    
     def to_dict(self) -> Dict:
         """결과를 딕셔너리로 변환"""
         return {
@@ -188,7 +273,8 @@ class TestResult:
             "answers": self.answers,
             "scores": self.scores,
             "total_score": self.total_score,
-            "rank": self.rank
+            "rank": self.rank,
+            "grading": self.grading
         }
     
     @classmethod
@@ -203,153 +289,859 @@ class TestResult:
             result.scores["problem_solving"] = 0
         result.total_score = data["total_score"]
         result.rank = data["rank"]
+        result.grading = data.get("grading", {})
         return result
 
-class DataManager:
-    """데이터 관리를 담당하는 클래스"""
+class CandidateIndex:
+    """지원자 목록과 id/이름 해시 인덱스 (로드 시 구축, 저장/수정/삭제 시 증분 갱신)"""
+    
+    def __init__(self, candidates: List[Candidate]):
+        self.by_id: Dict[str, Candidate] = {}  # 삽입 순서 = 파일 순서
+        self.by_name: Dict[str, List[Candidate]] = {}
+        self._indexed_names: Dict[str, str] = {}  # id: 인덱싱 당시 이름 (객체가 직접 수정된 경우 대비)
+        for candidate in candidates:
+            self.put(candidate)
+    
+    def all(self) -> List[Candidate]:
+        return list(self.by_id.values())
+    
+    def put(self, candidate: Candidate):
+        """지원자 추가 또는 교체 (기존 위치 유지)"""
+        old_name = self._indexed_names.get(candidate.id)
+        old_candidate = self.by_id.get(candidate.id)
+        self.by_id[candidate.id] = candidate
+        bucket = self.by_name.get(old_name, []) if old_name is not None else []
+        if old_name == candidate.name and old_candidate in bucket:
+            bucket[bucket.index(old_candidate)] = candidate
+        else:
+            self._unindex_name(candidate.id, old_name)
+            self.by_name.setdefault(candidate.name, []).append(candidate)
+        self._indexed_names[candidate.id] = candidate.name
+    
+    def remove(self, candidate_id: str) -> Optional[Candidate]:
+        candidate = self.by_id.pop(candidate_id, None)
+        if candidate is not None:
+            self._unindex_name(candidate_id, self._indexed_names.pop(candidate_id, None))
+        return candidate
+    
+    def _unindex_name(self, candidate_id: str, name: Optional[str]):
+        bucket = self.by_name.get(name)
+        if not bucket:
+            return
+        bucket[:] = [c for c in bucket if c.id != candidate_id]
+        if not bucket:
+            del self.by_name[name]
+
+class _RankNode:
+    """ScoreRanking 트립 노드 (size: 이 노드를 루트로 하는 서브트리의 항목 수)"""
+    
+    __slots__ = ("key", "result", "priority", "size", "left", "right")
+    
+    def __init__(self, key: Tuple[float, int], result: TestResult):
+        self.key = key
+        self.result = result
+        self.priority = random.random()
+        self.size = 1
+        self.left: Optional['_RankNode'] = None
+        self.right: Optional['_RankNode'] = None
+    
+    def update(self) -> '_RankNode':
+        self.size = 1 + (self.left.size if self.left else 0) + (self.right.size if self.right else 0)
+        return self
+
+class ScoreRanking:
+    """총점 순위를 유지하는 order-statistic 트리 (서브트리 크기를 둔 트립)
+    
+    (-총점, 저장 순번) 키 순서로 항목을 두고, 노드마다 서브트리 항목 수를 기록해
+    추가/삭제/순위 조회를 기대 O(log n)에 처리한다 (정렬 리스트처럼 원소를 밀고 당기지 않음).
+    동점이면 먼저 저장된 결과가 앞 순위.
+    """
+    
+    def __init__(self, items: Iterable[Tuple[Tuple[float, int], TestResult]] = ()):
+        """items: 처음 넣을 (키, 결과) 목록 (하나씩 add하지 않고 정렬 후 균형 트리로 한 번에 구성)"""
+        nodes = [_RankNode(key, result) for key, result in sorted(items, key=lambda item: item[0])]
+        self._root = self._build(nodes, 0, len(nodes))
+        # 위쪽 노드일수록 높은 우선순위를 주어 트립의 힙 조건을 맞춤
+        priorities = sorted((node.priority for node in nodes), reverse=True)
+        level = [self._root] if self._root else []
+        i = 0
+        while level:
+            next_level = []
+            for node in level:
+                node.priority = priorities[i]
+                i += 1
+                next_level.extend(child for child in (node.left, node.right) if child is not None)
+            level = next_level
+    
+    @classmethod
+    def _build(cls, nodes: List[_RankNode], start: int, end: int) -> Optional[_RankNode]:
+        if start >= end:
+            return None
+        mid = (start + end) // 2
+        node = nodes[mid]
+        node.left = cls._build(nodes, start, mid)
+        node.right = cls._build(nodes, mid + 1, end)
+        return node.update()
+    
+    def __len__(self) -> int:
+        return self._root.size if self._root else 0
+    
+    @classmethod
+    def _split(cls, node: Optional[_RankNode], key) -> Tuple[Optional[_RankNode], Optional[_RankNode]]:
+        """(key보다 작은 키의 트리, key 이상인 키의 트리)"""
+        if node is None:
+            return None, None
+        if node.key < key:
+            node.right, right = cls._split(node.right, key)
+            return node.update(), right
+        left, node.left = cls._split(node.left, key)
+        return left, node.update()
+    
+    @classmethod
+    def _merge(cls, left: Optional[_RankNode], right: Optional[_RankNode]) -> Optional[_RankNode]:
+        """left의 모든 키가 right의 키보다 작은 두 트리를 합침"""
+        if left is None or right is None:
+            return left or right
+        if left.priority > right.priority:
+            left.right = cls._merge(left.right, right)
+            return left.update()
+        right.left = cls._merge(left, right.left)
+        return right.update()
+    
+    def add(self, key: Tuple[float, int], result: TestResult):
+        left, right = self._split(self._root, key)
+        self._root = self._merge(self._merge(left, _RankNode(key, result)), right)
+    
+    def discard(self, key: Tuple[float, int]):
+        # 루트에서 key까지 내려간 경로의 크기만 다시 계산
+        path = []
+        node = self._root
+        while node is not None and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return
+        merged = self._merge(node.left, node.right)
+        if not path:
+            self._root = merged
+        elif path[-1].left is node:
+            path[-1].left = merged
+        else:
+            path[-1].right = merged
+        for ancestor in reversed(path):
+            ancestor.update()
+    
+    def rank_of(self, key: Tuple[float, int]) -> int:
+        """키의 순위 (1부터, key보다 앞선 항목 수 + 1)"""
+        rank = 1
+        node = self._root
+        while node is not None:
+            if node.key < key:
+                rank += 1 + (node.left.size if node.left else 0)
+                node = node.right
+            else:
+                node = node.left
+        return rank
+    
+    def top(self, k: int = None) -> List[TestResult]:
+        """상위 k개 결과 (k가 없으면 전체를 순위 순으로)"""
+        limit = len(self) if k is None else k
+        results: List[TestResult] = []
+        stack: List[_RankNode] = []
+        node = self._root
+        while (stack or node is not None) and len(results) < limit:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            results.append(node.result)
+            node = node.right
+        return results
+
+class ResultIndex:
+    """평가 결과 목록과 지원자 id 해시 인덱스 (같은 지원자의 결과가 여럿이면 첫 번째를 가리킴)
+    
+    순위는 ScoreRanking으로 결과 추가/삭제 때마다 갱신하고, 결과 객체의 rank 속성은
+    전체 목록이 필요할 때(refresh_ranks)만 한 번에 다시 채운다.
+    결과는 저장 순번 → 결과 dict에 저장 순서대로 두므로 교체/삭제 시 목록을 훑지 않는다.
+    """
+    
+    def __init__(self, results: List[TestResult]):
+        # 저장 순번 → 결과 (삽입 순서가 저장 순서, 교체해도 순번과 위치는 유지)
+        self._by_seq: Dict[int, TestResult] = {}
+        self.by_candidate: Dict[str, TestResult] = {}
+        # 지원자별 순위 키 목록 (by_candidate가 가리키는 결과의 키가 첫 번째)
+        self._rank_keys: Dict[str, List[Tuple[float, int]]] = {}
+        entries = []
+        for seq, result in enumerate(results):
+            key = (-result.total_score, seq)
+            self._by_seq[seq] = result
+            self.by_candidate.setdefault(result.candidate_id, result)
+            self._rank_keys.setdefault(result.candidate_id, []).append(key)
+            entries.append((key, result))
+        self._next_seq = len(entries)
+        self.ranking = ScoreRanking(entries)
+        self._ranks_dirty = True
+        self.refresh_ranks()
+    
+    def _add_rank(self, result: TestResult, seq: int = None) -> Tuple[float, int]:
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        key = (-result.total_score, seq)
+        self.ranking.add(key, result)
+        self._by_seq[seq] = result
+        return key
+    
+    @property
+    def results(self) -> List[TestResult]:
+        """저장 순서대로의 결과 목록"""
+        return list(self._by_seq.values())
+    
+    def put(self, result: TestResult):
+        """결과 추가 (같은 지원자의 결과가 이미 있으면 교체, 동점 순번은 기존 결과의 것을 유지)"""
+        existing = self.by_candidate.get(result.candidate_id)
+        if existing is not None:
+            keys = self._rank_keys[result.candidate_id]
+            self.ranking.discard(keys[0])
+            keys[0] = self._add_rank(result, seq=keys[0][1])
+        else:
+            self._rank_keys[result.candidate_id] = [self._add_rank(result)]
+        self.by_candidate[result.candidate_id] = result
+        result.rank = self.ranking.rank_of(self._rank_keys[result.candidate_id][0])
+        self._ranks_dirty = True
+    
+    def rank_of(self, candidate_id: str) -> Optional[int]:
+        """지원자의 현재 순위 (결과가 없으면 None)"""
+        keys = self._rank_keys.get(candidate_id)
+        return self.ranking.rank_of(keys[0]) if keys else None
+    
+    def top_k(self, k: int) -> List[TestResult]:
+        """총점 상위 k개 결과"""
+        return self.ranking.top(k)
+    
+    def rank_key(self, candidate_id: str) -> Optional[Tuple[float, int]]:
+        """지원자 결과의 순위 키 (코호트 순위도 같은 키를 사용해 동점 처리 기준을 맞춤)"""
+        keys = self._rank_keys.get(candidate_id)
+        return keys[0] if keys else None
+    
+    def refresh_ranks(self):
+        """모든 결과 객체의 rank 속성을 현재 순위로 갱신 (변경이 있었을 때만, 정렬 없이 한 번 순회)"""
+        if not self._ranks_dirty:
+            return
+        for i, result in enumerate(self.ranking.top()):
+            result.rank = i + 1
+        self._ranks_dirty = False
+    
+    def remove(self, candidate_id: str) -> bool:
+        if candidate_id not in self.by_candidate:
+            return False
+        for key in self._rank_keys.pop(candidate_id):
+            self.ranking.discard(key)
+            del self._by_seq[key[1]]
+        del self.by_candidate[candidate_id]
+        self._ranks_dirty = True
+        return True
+
+class CohortRankings:
+    """부서별/응시일별(코호트) 총점 순위
+    
+    코호트마다 ScoreRanking을 두고, 지원자가 어느 코호트에 어떤 키로 들어가 있는지 기억해
+    결과 저장이나 지원자 부서/응시일 변경 시 해당 지원자만 빼고 다시 넣는다.
+    """
+    
+    # 순위 이름 → 코호트를 나누는 지원자 필드
+    FIELDS = {"department": "department_id", "date": "access_date"}
     
     def __init__(self):
-        # 항상 app.py 기준의 절대경로로 data 폴더 지정
-        self.data_folder = os.path.join(BASE_DIR, "data")
-        self.candidates_file = os.path.join(self.data_folder, "candidates.json")
-        self.results_file = os.path.join(self.data_folder, "results.json")
-        self.questions_file = os.path.join(self.data_folder, "questions.json")
-        self.departments_file = os.path.join(self.data_folder, "departments.json")
-        self._ensure_data_files()
-    
-    def _ensure_data_files(self):
-        """데이터 파일들이 존재하는지 확인하고 없으면 생성"""
-        os.makedirs(self.data_folder, exist_ok=True)
-        if not os.path.exists(self.candidates_file):
-            self._save_json(self.candidates_file, [])
-        if not os.path.exists(self.questions_file):
-            self._save_json(self.questions_file, {"technical_questions": []})
-        if not os.path.exists(self.results_file):
-            self._save_json(self.results_file, [])
-        if not os.path.exists(self.departments_file):
-            self._save_json(self.departments_file, {"departments": []})
-    
-    def _load_json(self, filename: str):
-        """JSON 파일 로드"""
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            if filename == self.departments_file:
-                return {"departments": []}
-            if filename == self.questions_file:
-                return {"technical_questions": []}
-            return []
+        self.rankings: Dict[Tuple[str, str], ScoreRanking] = {}
+        # 지원자 id → (들어가 있는 코호트 목록, 순위 키)
+        self._placed: Dict[str, Tuple[List[Tuple[str, str]], Tuple[float, int]]] = {}
+    
+    def place(self, candidate: Candidate, result: Optional[TestResult], key: Optional[Tuple[float, int]]):
+        """지원자의 코호트 순위 갱신 (결과가 없으면 순위에서 제외)"""
+        self.remove(candidate.id)
+        if result is None or key is None:
+            return
+        cohorts = [(field, getattr(candidate, field) or '') for field in self.FIELDS.values()]
+        for cohort in cohorts:
+            self.rankings.setdefault(cohort, ScoreRanking()).add(key, result)
+        self._placed[candidate.id] = (cohorts, key)
+    
+    def remove(self, candidate_id: str):
+        cohorts, key = self._placed.pop(candidate_id, ([], None))
+        for cohort in cohorts:
+            ranking = self.rankings[cohort]
+            ranking.discard(key)
+            if not len(ranking):
+                del self.rankings[cohort]
+    
+    def ranks_of(self, candidate_id: str) -> Dict[str, Optional[int]]:
+        """{"department_rank": n, "date_rank": n} 형태의 코호트별 순위 (결과가 없으면 None)"""
+        cohorts, key = self._placed.get(candidate_id, (None, None))
+        ranks = {}
+        for i, name in enumerate(self.FIELDS):
+            ranks[f"{name}_rank"] = self.rankings[cohorts[i]].rank_of(key) if cohorts else None
+        return ranks
+    
+    def top(self, field: str, value: str, k: int = None) -> List[TestResult]:
+        """코호트 안의 결과를 순위 순서로 (k가 있으면 상위 k개)"""
+        ranking = self.rankings.get((field, value or ''))
+        return ranking.top(k) if ranking else []
+
+class QuestionPools:
+    """(부서 id, 카테고리, 유형)별 문제 id 풀과 부서 → 문제 id 역색인
+    
+    문제 목록이 바뀔 때만 다시 구성하고(부서 할당 변경은 assign/unassign으로 증분 반영),
+    시험 출제는 전체 문제를 거르지 않고 풀에서 바로 뽑는다.
+    """
+    
+    def __init__(self, questions: List[Question]):
+        self.pools: Dict[Tuple[str, str, str], List[str]] = {}
+        self.by_department: Dict[str, Set[str]] = {}
+        for question in questions:
+            for department_id in question.department_ids or []:
+                self.assign(question, department_id)
+    
+    def assign(self, question: Question, department_id: str):
+        self.pools.setdefault((department_id, question.category, question.type), []).append(question.id)
+        self.by_department.setdefault(department_id, set()).add(question.id)
+    
+    def unassign(self, question: Question, department_id: str):
+        pool = self.pools.get((department_id, question.category, question.type))
+        if pool and question.id in pool:
+            pool.remove(question.id)
+        ids = self.by_department.get(department_id)
+        if ids is not None:
+            ids.discard(question.id)
+    
+    def department_questions(self, department_id: str) -> Set[str]:
+        """부서에 할당된 문제 id (복사본)"""
+        return set(self.by_department.get(department_id, ()))
+    
+    def draw(self, department_id: str, composition: List[Tuple[str, str, int]]) -> List[str]:
+        """(카테고리, 유형, 개수) 구성 순서대로 풀에서 랜덤 추출 (풀이 모자라면 있는 만큼)"""
+        selected = []
+        for category, question_type, count in composition:
+            pool = self.pools.get((department_id, category, question_type), [])
+            selected.extend(random.sample(pool, min(len(pool), count)))
+        return selected
+
+# 목록 API에서 필터/정렬할 수 있는 필드 (종류 → 필드 → 항목에서 값을 꺼내는 함수)
+# 결과 목록의 항목은 (Candidate, TestResult) 쌍
+LISTING_FIELDS = {
+    "candidates": {
+        "department_id": lambda c: c.department_id,
+        "access_date": lambda c: c.access_date,
+        "name": lambda c: c.name,
+        "created_at": lambda c: c.created_at,
+    },
+    "results": {
+        "department_id": lambda pair: pair[0].department_id,
+        "access_date": lambda pair: pair[0].access_date,
+        "candidate_name": lambda pair: pair[0].name,
+        "total_score": lambda pair: pair[1].total_score,
+        "test_date": lambda pair: pair[1].test_date,
+    },
+    "questions": {
+        "department_id": lambda q: q.department_ids or [],
+        "category": lambda q: q.category,
+        "type": lambda q: q.type,
+        "difficulty": lambda q: q.difficulty,
+        "points": lambda q: q.points,
+        "id": lambda q: q.id,
+    },
+}
+# 값이 여러 개라 필터에만 쓸 수 있는 필드
+LISTING_MULTI_VALUED = {"questions": {"department_id"}}
+# 정렬에만 쓸 수 있는 가상 필드 (결과 목록의 전체 순위)
+LISTING_RANK_SORT = "rank"
+# 캐시해 둘 필터/정렬 조합 수 (넘치면 비움)
+LISTING_VIEW_CACHE_SIZE = 64
+
+def _field_matches(value, expected: str) -> bool:
+    """필터 값 비교 (문자열로 비교, 여러 값 필드는 하나라도 같으면 일치)"""
+    if isinstance(value, (list, tuple)):
+        return any(_field_matches(v, expected) for v in value)
+    return ('' if value is None else str(value)) == expected
+
+def write_locked(method):
+    """저장소 쓰기 잠금 안에서 실행 (최신 데이터 확인 → 수정 → 기록이 다른 워커와 겹치지 않도록)"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.storage.lock():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+class DataManager:
+    """데이터 관리를 담당하는 클래스
+    
+    저장소(storage)에서 읽은 지원자/결과/문제/부서 객체를 메모리에 캐시하고,
+    저장소의 시그니처(JSON 파일은 mtime/크기/inode, SQLite는 버전)가 바뀐 경우에만 다시 읽는다.
+    캐시된 객체는 여러 요청이 공유하므로 수정 후에는 반드시 저장 메서드를 호출해야 한다.
+    """
+    
+    def __init__(self, data_folder: str = None, storage=None):
+        # 기본값은 항상 app.py 기준의 절대경로로 data 폴더 지정
+        self.data_folder = data_folder or os.path.join(BASE_DIR, "data")
+        # 저장소 미지정 시 data/*.json 파일 사용
+        self.storage = storage or JsonFileStorage(self.data_folder)
+        # 응시 중 자동 저장 답안은 저장소 종류와 관계없이 지원자별 로그 파일에 기록
+        self.answer_drafts = AnswerDraftLog(os.path.join(self.data_folder, "in_progress"))
+        # 데이터 종류별 캐시: {kind: (저장소 시그니처, 파싱된 객체)}
+        self._cache = {}
+        self.cache_stats = {"hits": 0, "misses": 0}
+        # 코호트 순위: (구성에 사용한 지원자 인덱스, 결과 인덱스, CohortRankings)
+        self._cohorts = None
+        # 출제용 문제 풀: (구성에 사용한 문제 목록, QuestionPools)
+        self._pools = None
+        # 문제 id 맵: (구성에 사용한 문제 목록, {id: Question})
+        self._question_map = None
+        # 문제 검색 역색인: (구성에 사용한 문제 목록, QuestionSearchIndex)
+        self._search_index = None
+        # 지원자/결과 변경 알림을 받을 함수 목록 (listener(이벤트 이름, 내용))
+        self._listeners: List[Callable[[str, Dict], None]] = []
+        # 데이터 종류별 버전 (저장소에서 다시 읽거나 변경을 기록할 때마다 증가)
+        self._versions: Dict[str, int] = {}
+        # 저장소 시그니처가 없을 때 버전을 프로세스별로 구분하기 위한 id
+        self._instance_id = uuid.uuid4().hex
+        # 목록 API 뷰: {(종류, 필터, 정렬): (구성 당시 버전, SortedView)}
+        self._views: Dict[Tuple, Tuple[Tuple[int, ...], SortedView]] = {}
+    
+    def _load_cached(self, kind: str, parser):
+        """저장소가 바뀌지 않았으면 메모리에 있는 파싱 결과를, 바뀌었으면 다시 읽어 파싱한 결과를 반환"""
+        signature = self.storage.signature(kind)
+        cached = self._cache.get(kind)
+        if cached is not None and signature is not None and cached[0] == signature:
+            self.cache_stats["hits"] += 1
+            return cached[1]
+        self.cache_stats["misses"] += 1
+        self._bump_version(kind)
+        value = parser(self.storage.load(kind))
+        if signature is not None:
+            self._cache[kind] = (signature, value)
+        return value
+    
+    def _commit_cached(self, kind: str, records: Callable[[], List[Dict]], value, upserts: List[Dict] = None, deletes: List[str] = None):
+        """저장소에 변경 내용을 기록한 뒤 메모리의 객체/인덱스를 새 시그니처로 캐시에 다시 등록
+        
+        records는 전체 레코드를 만드는 함수(저장소가 전체 기록이 필요할 때만 호출),
+        upserts/deletes는 변경된 레코드만 (행 단위/저널 기록이 가능한 저장소용)
+        """
+        # 같은 크기로 같은 시각에 덮어쓰는 경우도 있으므로 시그니처 비교에 맡기지 않고 직접 무효화
+        self._cache.pop(kind, None)
+        self._bump_version(kind)
+        signature = self.storage.write(kind, records, upserts=upserts, deletes=deletes)
+        if signature is not None:
+            self._cache[kind] = (signature, value)
+    
+    def _bump_version(self, kind: str):
+        self._versions[kind] = self._versions.get(kind, 0) + 1
+    
+    def data_version(self, *kinds: str) -> Tuple:
+        """조건부 요청(ETag)용 데이터 버전
+        
+        저장소 시그니처는 기록할 때마다 바뀌고 모든 워커가 같은 값을 보므로 그대로 버전으로 쓰고,
+        시그니처가 없으면(파일이 아직 없는 경우 등) 이 프로세스의 변경 카운터로 대신한다.
+        """
+        return (self.storage.name,) + tuple(
+            (kind, self.storage.signature(kind) or (self._instance_id, self._versions.get(kind, 0)))
+            for kind in kinds
+        )
+    
+    def get_cache_stats(self) -> Dict:
+        """캐시 적중/미적중 횟수 조회"""
+        hits = self.cache_stats["hits"]
+        misses = self.cache_stats["misses"]
+        total = hits + misses
+        return {
+            "backend": self.storage.name,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+            "cached": sorted(self._cache)
+        }
+    
+    def add_listener(self, listener: Callable[[str, Dict], None]):
+        """지원자/결과 변경 알림 구독 (실시간 대시보드 변경 피드용)
+        
+        이벤트: candidate / candidate_deleted / candidates_reset, result / result_deleted / results_reset
+        """
+        self._listeners.append(listener)
+    
+    def _notify(self, name: str, payload: Dict):
+        for listener in self._listeners:
+            try:
+                listener(name, payload)
+            except Exception as e:
+                print(f"변경 알림 처리 실패 ({name}): {e}")
+    
+    def _notify_changes(self, kind: str, upserts: List, deletes: Optional[List[str]], summarize: Callable):
+        """저장된 변경분을 알림으로 전달 (전체 기록이면 *_reset 하나만)"""
+        if not self._listeners:
+            return
+        singular = kind[:-1]
+        if upserts is None and deletes is None:
+            self._notify(f"{kind}_reset", {})
+            return
+        for record in upserts or []:
+            self._notify(singular, summarize(record))
+        for key in deletes or []:
+            self._notify(f"{singular}_deleted", {"id": key})
+    
+    def _candidate_index(self) -> CandidateIndex:
+        return self._load_cached(
+            "candidates",
+            lambda records: CandidateIndex([Candidate.from_dict(c) for c in records])
+        )
+    
+    def _result_index(self) -> ResultIndex:
+        return self._load_cached(
+            "results",
+            lambda records: ResultIndex([TestResult.from_dict(r) for r in records])
+        )
+    
+    def _commit_candidates(self, index: CandidateIndex, upserts: List[Candidate] = None, deletes: List[str] = None):
+        self._commit_cached(
+            "candidates", lambda: [c.to_dict() for c in index.all()], index,
+            upserts=[c.to_dict() for c in upserts] if upserts is not None else None,
+            deletes=deletes
+        )
+        self._notify_changes("candidates", upserts, deletes, lambda c: {
+            "id": c.id, "name": c.name, "department_id": c.department_id, "access_date": c.access_date,
+            "test_started_at": c.test_started_at, "test_deadline": c.test_deadline
+        })
+    
+    def _commit_results(self, index: ResultIndex, upserts: List[TestResult] = None, deletes: List[str] = None):
+        self._commit_cached(
+            "results", lambda: [r.to_dict() for r in index.results], index,
+            upserts=[r.to_dict() for r in upserts] if upserts is not None else None,
+            deletes=deletes
+        )
+        self._notify_changes("results", upserts, deletes, lambda r: {
+            "id": r.candidate_id, "total_score": r.total_score, "scores": r.scores, "rank": r.rank, "test_date": r.test_date
+        })
+    
+    def _cohort_rankings(self) -> CohortRankings:
+        """부서별/응시일별 순위 (지원자나 결과를 저장소에서 다시 읽은 경우에만 새로 구성)"""
+        candidates = self._candidate_index()
+        results = self._result_index()
+        if self._cohorts is None or self._cohorts[0] is not candidates or self._cohorts[1] is not results:
+            cohorts = CohortRankings()
+            for candidate in candidates.all():
+                cohorts.place(candidate, results.by_candidate.get(candidate.id), results.rank_key(candidate.id))
+            self._cohorts = (candidates, results, cohorts)
+        return self._cohorts[2]
+    
+    def _update_cohorts(self, candidate_id: str):
+        """변경된 지원자 한 명의 코호트 순위만 갱신 (아직 구성 전이면 다음 조회 때 구성)"""
+        if self._cohorts is None:
+            return
+        candidates, results, cohorts = self._cohorts
+        candidate = candidates.by_id.get(candidate_id)
+        if candidate is None:
+            cohorts.remove(candidate_id)
+        else:
+            cohorts.place(candidate, results.by_candidate.get(candidate_id), results.rank_key(candidate_id))
+    
+    def _cached_questions(self) -> List[Question]:
+        # 기술 문제와 문제해결 문제 모두 로드
+        return self._load_cached("questions", lambda records: [Question.from_dict(q) for q in records])
+    
+    def _commit_questions(self, questions: List[Question], upserts: List[Question] = None, deletes: List[str] = None,
+                          pools_updated: bool = False):
+        # 문제 목록은 제자리에서 수정되므로 목록이 같은 객체여도 출제 풀은 다시 구성 (이미 증분 반영한 경우 제외)
+        if not pools_updated:
+            self._pools = None
+        # id 맵/검색 색인은 변경된 문제만 반영 (전체 기록이거나 다른 목록으로 만들어졌으면 다시 구성)
+        full_write = upserts is None and deletes is None
+        if full_write or self._question_map is None or self._question_map[0] is not questions:
+            self._question_map = None
+        else:
+            by_id = self._question_map[1]
+            for question_id in deletes or []:
+                by_id.pop(question_id, None)
+            for question in upserts or []:
+                by_id[question.id] = question
+        if full_write or self._search_index is None or self._search_index[0] is not questions:
+            self._search_index = None
+        else:
+            search_index = self._search_index[1]
+            for question_id in deletes or []:
+                search_index.remove(question_id)
+            for question in upserts or []:
+                search_index.put(question)
+        self._commit_cached(
+            "questions", lambda: [q.to_dict() for q in questions], questions,
+            upserts=[q.to_dict() for q in upserts] if upserts is not None else None,
+            deletes=deletes
+        )
+    
+    def _question_pools(self) -> QuestionPools:
+        """출제용 문제 풀 (문제를 저장소에서 다시 읽었거나 수정한 경우에만 새로 구성)"""
+        questions = self._cached_questions()
+        if self._pools is None or self._pools[0] is not questions:
+            self._pools = (questions, QuestionPools(questions))
+        return self._pools[1]
+    
+    def _questions_by_id(self) -> Dict[str, Question]:
+        """문제 id → Question 맵 (문제를 다시 읽었거나 수정한 경우에만 새로 구성)"""
+        questions = self._cached_questions()
+        if self._question_map is None or self._question_map[0] is not questions:
+            by_id = {}
+            for question in questions:
+                by_id.setdefault(question.id, question)
+            self._question_map = (questions, by_id)
+        return self._question_map[1]
+    
+    def _question_search_index(self) -> QuestionSearchIndex:
+        """문제 검색 역색인 (문제를 다시 읽은 경우에만 새로 구성, 문제 저장/삭제는 증분 반영)"""
+        questions = self._cached_questions()
+        if self._search_index is None or self._search_index[0] is not questions:
+            self._search_index = (questions, QuestionSearchIndex(questions))
+        return self._search_index[1]
     
-    def _save_json(self, filename: str, data):
-        """JSON 파일 저장"""
-        dir_name = os.path.dirname(filename)
-        if dir_name and not os.path.exists(dir_name):
-            os.makedirs(dir_name)
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _cached_departments(self) -> List[Department]:
+        return self._load_cached("departments", lambda records: [Department.from_dict(d) for d in records])
     
+    @write_locked
     def save_candidate(self, candidate: Candidate):
         """지원자 정보 저장"""
-        candidates = self._load_json(self.candidates_file)
-        candidates.append(candidate.to_dict())
-        self._save_json(self.candidates_file, candidates)
+        index = self._candidate_index()
+        index.put(candidate)
+        self._commit_candidates(index, upserts=[candidate])
+        self._update_cohorts(candidate.id)
+    
+    @write_locked
+    def save_candidates(self, candidates: List[Candidate]):
+        """여러 지원자를 한 번에 저장 (인덱스에 모두 반영한 뒤 저장소에는 한 번만 기록)"""
+        if not candidates:
+            return
+        index = self._candidate_index()
+        for candidate in candidates:
+            index.put(candidate)
+        self._commit_candidates(index, upserts=candidates)
+        for candidate in candidates:
+            self._update_cohorts(candidate.id)
     
     def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
         """지원자 정보 조회"""
-        candidates = self._load_json(self.candidates_file)
-        for candidate_data in candidates:
-            if candidate_data["id"] == candidate_id:
-                return Candidate.from_dict(candidate_data)
-        return None
+        return self._candidate_index().by_id.get(candidate_id)
+    
+    def get_candidates_by_name(self, name: str) -> List[Candidate]:
+        """이름으로 지원자 조회 (동명이인이 있으면 등록 순서대로 모두 반환)"""
+        return list(self._candidate_index().by_name.get(name, []))
     
     def get_all_candidates(self) -> List[Candidate]:
         """모든 지원자 정보 조회"""
-        candidates = self._load_json(self.candidates_file)
-        return [Candidate.from_dict(data) for data in candidates]
+        return self._candidate_index().all()
+    
+    def save_answer_draft(self, candidate_id: str, answers: Dict[str, str]):
+        """응시 중 바뀐 답안 자동 저장 (지원자별 로그에 변경분만 추가, 전체 쓰기 잠금 불필요)"""
+        if answers:
+            self.answer_drafts.append(candidate_id, answers)
     
+    def load_answer_draft(self, candidate_id: str, until: float = None) -> Dict[str, str]:
+        """자동 저장된 답안 (문제ID: 마지막 답안, until을 주면 그 시각까지 저장된 것만)"""
+        return self.answer_drafts.load(candidate_id, until=until)
+    
+    def clear_answer_draft(self, candidate_id: str):
+        """최종 제출 후 자동 저장 로그 삭제"""
+        self.answer_drafts.clear(candidate_id)
+    
+    @write_locked
+    def finalize_attempt(self, candidate_id: str, submitted_answers: Dict[str, str] = None,
+                         cutoff: float = None) -> Optional[TestResult]:
+        """응시 종료: 자동 저장 답안(cutoff 시각까지) 위에 제출된 답안을 덮어써 채점·저장
+        
+        제출과 마감 자동 종료가 겹쳐도 한 번만 처리되도록 결과가 이미 있으면 아무것도 하지 않고 None 반환
+        (응시 중 삭제된 지원자도 결과를 남기지 않도록 None 반환)
+        """
+        if self.get_candidate(candidate_id) is None or self.get_result(candidate_id) is not None:
+            return None
+        answers = self.load_answer_draft(candidate_id, until=cutoff)
+        answers.update(submitted_answers or {})
+        result = TestResult(candidate_id)
+        for question_id, answer in answers.items():
+            result.add_answer(question_id, answer)
+        result.calculate_score(self.load_questions())
+        self.save_result(result)
+        self.clear_answer_draft(candidate_id)
+        return result
+    
+    @write_locked
     def save_result(self, result: TestResult):
-        """평가 결과 저장"""
-        results = self._load_json(self.results_file)
-        results.append(result.to_dict())
-        self._save_json(self.results_file, results)
+        """평가 결과 저장 (같은 지원자의 결과가 있으면 교체)"""
+        index = self._result_index()
+        index.put(result)
+        self._commit_results(index, upserts=[result])
+        self._update_cohorts(result.candidate_id)
+    
+    @write_locked
+    def regrade_all_results(self, use_numpy: bool = None) -> Dict:
+        """현재 정답표로 모든 결과의 점수와 문항별 채점 상세를 한 번에 다시 계산하고 순위를 다시 구성한 뒤 일괄 저장 (소요 시간 보고서 반환)"""
+        results = self.get_all_results()
+        report = scoring.regrade(results, self.load_questions(), use_numpy=use_numpy)
+        started = time.perf_counter()
+        index = ResultIndex(results)
+        self._commit_results(index)
+        report["write_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return report
     
     def get_result(self, candidate_id: str) -> Optional[TestResult]:
         """평가 결과 조회"""
-        results = self._load_json(self.results_file)
-        for result_data in results:
-            if result_data["candidate_id"] == candidate_id:
-                return TestResult.from_dict(result_data)
-        return None
+        return self._result_index().by_candidate.get(candidate_id)
     
     def get_all_results(self) -> List[TestResult]:
         """모든 결과 정보 조회"""
-        results = self._load_json(self.results_file)
-        return [TestResult.from_dict(data) for data in results]
+        index = self._result_index()
+        index.refresh_ranks()
+        return index.results
+    
+    def get_result_rank(self, candidate_id: str) -> Optional[int]:
+        """지원자의 현재 총점 순위 (전체 정렬 없이 조회, 결과가 없으면 None)"""
+        return self._result_index().rank_of(candidate_id)
+    
+    def get_top_results(self, k: int) -> List[TestResult]:
+        """총점 상위 k개 결과"""
+        index = self._result_index()
+        index.refresh_ranks()
+        return index.top_k(k)
+    
+    def get_cohort_ranks(self, candidate_ids: List[str]) -> Dict[str, Dict[str, Optional[int]]]:
+        """지원자별 부서/응시일 순위 조회 ({id: {"department_rank": n, "date_rank": n}}, 결과가 없으면 None)"""
+        cohorts = self._cohort_rankings()
+        return {candidate_id: cohorts.ranks_of(candidate_id) for candidate_id in candidate_ids}
+    
+    def get_cohort_results(self, field: str, value: str, k: int = None) -> List[TestResult]:
+        """부서(department_id) 또는 응시일(access_date) 코호트의 결과를 순위 순서로 조회"""
+        cohorts = self._cohort_rankings()
+        self._result_index().refresh_ranks()
+        return cohorts.top(field, value, k)
+    
+    def get_candidates_with_results(self) -> List[Tuple[Candidate, Optional[TestResult]]]:
+        """지원자와 평가 결과를 한 번에 조인 (지원자 등록 순서, 결과가 없으면 None)"""
+        index = self._result_index()
+        index.refresh_ranks()
+        results_by_candidate = index.by_candidate
+        return [(c, results_by_candidate.get(c.id)) for c in self._candidate_index().all()]
+    
+    def get_listing(self, kind: str, filters: Dict[str, str], sort: str) -> SortedView:
+        """목록 API용 필터링/정렬된 뷰 (candidates / results / questions)
+        
+        같은 필터/정렬 조합은 해당 데이터가 바뀔 때까지 캐시한 뷰를 그대로 사용한다.
+        sort는 LISTING_FIELDS의 필드 이름 (결과 목록은 전체 순위 "rank"도 가능),
+        알 수 없는 필드면 ValueError
+        """
+        fields = LISTING_FIELDS[kind]
+        for field in filters:
+            if field not in fields:
+                raise ValueError(f"필터할 수 없는 필드입니다: {field}")
+        sortable = sort in fields and sort not in LISTING_MULTI_VALUED.get(kind, ())
+        if not sortable and not (kind == "results" and sort == LISTING_RANK_SORT):
+            raise ValueError(f"정렬할 수 없는 필드입니다: {sort}")
+        
+        # 원본을 먼저 읽어야 저장소에서 다시 읽은 경우 버전이 올라간 뒤에 비교함
+        if kind == "candidates":
+            items, id_of, depends = self._candidate_index().all(), (lambda c: c.id), ("candidates",)
+        elif kind == "results":
+            items, id_of, depends = self._listing_results(filters), (lambda pair: pair[0].id), ("candidates", "results")
+        else:
+            items, id_of, depends = self._cached_questions(), (lambda q: q.id), ("questions",)
+        version = tuple(self._versions.get(k, 0) for k in depends)
+        view_key = (kind, tuple(sorted(filters.items())), sort)
+        cached = self._views.get(view_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        matched = [item for item in items if all(_field_matches(fields[f](item), v) for f, v in filters.items())]
+        if sort == LISTING_RANK_SORT and kind == "results":
+            index = self._result_index()
+            value_of = lambda pair: index.rank_key(pair[0].id)
+        else:
+            value_of = fields[sort]
+        view = SortedView(matched, value_of, id_of)
+        if len(self._views) >= LISTING_VIEW_CACHE_SIZE:
+            self._views.clear()
+        self._views[view_key] = (version, view)
+        return view
+    
+    def _listing_results(self, filters: Dict[str, str]) -> List[Tuple[Candidate, TestResult]]:
+        """결과 목록 원본 (부서/응시일 필터가 있으면 해당 코호트 순위에서 바로 가져옴)"""
+        index = self._result_index()
+        index.refresh_ranks()
+        candidates = self._candidate_index().by_id
+        for field in CohortRankings.FIELDS.values():
+            if field in filters:
+                cohort = self._cohort_rankings().top(field, filters[field])
+                return [(candidates[r.candidate_id], r) for r in cohort if r.candidate_id in candidates]
+        return [(c, r) for c, r in self.get_candidates_with_results() if r]
+    
+    def search_questions(self, query: str, filters: Dict[str, str] = None) -> Tuple[SortedView, Dict[str, Dict[str, int]]]:
+        """문제 전문 검색 (관련도 순, 동점이면 문제 은행 순으로 정렬된 (점수, Question) 뷰, 패싯 필드별 값 개수)
+        
+        filters: category / type / difficulty / department_id (department_id가 ""이면 미지정 문제),
+        알 수 없는 필드면 ValueError
+        """
+        index = self._question_search_index()
+        scores, facets = index.search(query, filters)
+        by_id = self._questions_by_id()
+        matched = [(score, by_id[question_id]) for question_id, score in scores.items() if question_id in by_id]
+        # 점수가 같으면(검색어가 없으면 모두) 문제 은행 순서대로
+        return SortedView(matched, lambda pair: -pair[0], lambda pair: index.order_of(pair[1].id)), facets
     
     def load_questions(self) -> List[Question]:
         """문제 데이터 로드 (기술 문제 + 문제해결 문제)"""
         try:
-            with open(self.questions_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # 기술 문제와 문제해결 문제 모두 로드
-            technical_questions_data = data.get("technical_questions", [])
-            problem_solving_questions_data = data.get("problem_solving_questions", [])
-            
-            all_questions_data = technical_questions_data + problem_solving_questions_data
-            
-            return [Question.from_dict(q) for q in all_questions_data]
-        except (FileNotFoundError, json.JSONDecodeError):
+            return list(self._cached_questions())
+        except json.JSONDecodeError:
             return []
     
     def calculate_ranks(self):
-        """순위 계산 및 업데이트"""
-        results = self.get_all_results()
-        
-        # 총점 기준으로 정렬
-        results.sort(key=lambda x: x.total_score, reverse=True)
+        """순위 계산 및 업데이트
         
-        # 순위 부여
-        for i, result in enumerate(results):
-            result.rank = i + 1
-        
-        # 업데이트된 결과 저장
-        updated_results = [result.to_dict() for result in results]
-        self._save_json(self.results_file, updated_results)
+        순위는 결과 목록에서 파생되는 값이므로 메모리에서만 다시 계산한다.
+        (저장소에는 다음 스냅샷 압축 시 함께 기록됨)
+        결과 저장/삭제 시 순위 구조가 이미 갱신되므로, 결과 객체의 rank 속성만 채운다.
+        """
+        self._result_index().refresh_ranks()
     
+    @write_locked
     def delete_candidate(self, candidate_id: str):
         """지원자 삭제"""
-        candidates = self._load_json(self.candidates_file)
-        candidates = [c for c in candidates if c["id"] != candidate_id]
-        self._save_json(self.candidates_file, candidates)
+        index = self._candidate_index()
+        if index.remove(candidate_id) is not None:
+            self._commit_candidates(index, deletes=[candidate_id])
+            self._update_cohorts(candidate_id)
     
+    @write_locked
     def delete_result(self, candidate_id: str):
         """평가 결과 삭제"""
-        results = self._load_json(self.results_file)
-        results = [r for r in results if r["candidate_id"] != candidate_id]
-        self._save_json(self.results_file, results)
+        index = self._result_index()
+        if index.remove(candidate_id):
+            self._commit_results(index, deletes=[candidate_id])
+            self._update_cohorts(candidate_id)
     
+    @write_locked
     def update_candidate(self, updated_candidate: Candidate):
         """지원자 정보 수정 (수정된 Candidate 객체를 통째로 받아 처리)"""
-        candidates = self._load_json(self.candidates_file)
+        index = self._candidate_index()
         # 해당 id를 가진 지원자 데이터를 찾아 교체
-        for i, candidate in enumerate(candidates):
-            if candidate["id"] == updated_candidate.id:
-                candidates[i] = updated_candidate.to_dict()
-                break
-        self._save_json(self.candidates_file, candidates)
+        if updated_candidate.id in index.by_id:
+            index.put(updated_candidate)
+            self._commit_candidates(index, upserts=[updated_candidate])
+            self._update_cohorts(updated_candidate.id)
         return updated_candidate
     
+    @write_locked
     def update_candidate_contact_info(self, candidate_id: str, email: str, phone: str):
         """지원자 연락처 정보 업데이트 (이메일, 핸드폰번호)"""
-        candidates = self._load_json(self.candidates_file)
-        for candidate in candidates:
-            if candidate["id"] == candidate_id:
-                candidate["email"] = email
-                candidate["phone"] = phone
-                break
-        self._save_json(self.candidates_file, candidates)
+        index = self._candidate_index()
+        candidate = index.by_id.get(candidate_id)
+        if candidate:
+            candidate.email = email
+            candidate.phone = phone
+            self._commit_candidates(index, upserts=[candidate])
     
     def get_candidate_questions(self, candidate_id: str) -> List[Question]:
         """지원자에게 할당된 문제 목록을 반환"""
@@ -357,32 +1149,35 @@ class DataManager:
         if not candidate:
             return []
         
-        all_questions = self.load_questions()
-        
-        # 선택된 문제가 있으면 해당 문제들만 반환
+        # 선택된 문제가 있으면 id 맵에서 해당 문제들만 출제 순서대로 반환 (문제 은행 크기와 무관)
         if candidate.selected_questions:
+            try:
+                questions_by_id = self._questions_by_id()
+            except json.JSONDecodeError:
+                return []
             selected_questions = []
-            for question in all_questions:
-                if question.id in candidate.selected_questions:
+            seen = set()
+            for question_id in candidate.selected_questions:
+                question = questions_by_id.get(question_id)
+                if question is not None and question_id not in seen:
+                    seen.add(question_id)
                     selected_questions.append(question)
             return selected_questions
         
         # 선택된 문제가 없으면 전체 문제 반환
-        return all_questions
+        return self.load_questions()
     
+    @write_locked
     def set_candidate_questions(self, candidate_id: str, question_ids: List[str]):
         """지원자 출제 문제 설정"""
-        candidates = self._load_json(self.candidates_file)
-        for candidate in candidates:
-            if candidate["id"] == candidate_id:
-                candidate["selected_questions"] = question_ids
-                break
-        self._save_json(self.candidates_file, candidates)
+        index = self._candidate_index()
+        candidate = index.by_id.get(candidate_id)
+        if candidate:
+            candidate.selected_questions = question_ids
+            self._commit_candidates(index, upserts=[candidate])
     
     def get_random_questions(self, count: int = 10, category: str = None) -> List[str]:
         """지정된 카테고리 또는 전체에서 랜덤으로 문제 ID 목록 반환"""
-        import random
-        
         all_questions = self.load_questions()
         
         if category:
@@ -395,47 +1190,132 @@ class DataManager:
             
         return [q.id for q in random.sample(filtered_questions, count)]
     
+    def draw_exam_questions(self, department_id: str, composition: List[Tuple[str, str, int]]) -> List[str]:
+        """부서 문제 풀에서 (카테고리, 유형, 개수) 구성대로 랜덤 출제한 문제 id 목록"""
+        try:
+            return self._question_pools().draw(department_id, composition)
+        except json.JSONDecodeError:
+            return []
+    
     def get_questions_by_category(self, category: str) -> List[Question]:
         """카테고리별 문제 조회"""
         all_questions = self.load_questions()
         return [q for q in all_questions if q.category == category]
+    
+    def get_question(self, question_id: str) -> Optional[Question]:
+        """문제 조회"""
+        try:
+            return self._questions_by_id().get(question_id)
+        except json.JSONDecodeError:
+            return None
+    
+    @write_locked
+    def save_question(self, question: Question):
+        """문제 추가 또는 수정 (같은 id가 있으면 교체, 저장소에는 이 문제만 기록)"""
+        self._put_questions([question])
+    
+    @write_locked
+    def save_questions(self, questions: List[Question]):
+        """여러 문제를 한 번에 추가/수정 (저장소에는 변경된 문제만 한 번에 기록)"""
+        if questions:
+            self._put_questions(questions)
+    
+    def _put_questions(self, changed: List[Question]):
+        questions = self._cached_questions()
+        by_id = self._questions_by_id()
+        positions = None
+        for question in changed:
+            existing = by_id.get(question.id)
+            if existing is None:
+                if positions is not None:
+                    positions[id(question)] = len(questions)
+                questions.append(question)
+            elif existing is not question:
+                # 캐시된 객체를 직접 수정한 경우가 아니면 같은 자리에 교체 (위치는 교체가 있을 때만 한 번 계산)
+                if positions is None:
+                    positions = {id(q): i for i, q in enumerate(questions)}
+                i = positions.pop(id(existing))
+                questions[i] = question
+                positions[id(question)] = i
+            by_id[question.id] = question
+        self._commit_questions(questions, upserts=list(changed))
+    
+    @write_locked
+    def delete_question(self, question_id: str) -> bool:
+        """문제 삭제 (삭제할 문제가 없으면 False, 저장소에는 삭제 항목만 기록)"""
+        questions = self._cached_questions()
+        if question_id not in self._questions_by_id():
+            return False
+        questions[:] = [q for q in questions if q.id != question_id]
+        self._commit_questions(questions, deletes=[question_id])
+        return True
 
     # 부서 관리 메서드
     def load_departments(self) -> List[Department]:
-        data = self._load_json(self.departments_file)
-        return [Department.from_dict(d) for d in data.get("departments", [])]
+        return list(self._cached_departments())
 
+    @write_locked
     def save_department(self, department: Department):
-        data = self._load_json(self.departments_file)
-        data["departments"].append(department.to_dict())
-        self._save_json(self.departments_file, data)
+        departments = self.load_departments() + [department]
+        self._commit_cached(
+            "departments", lambda: [d.to_dict() for d in departments], departments,
+            upserts=[department.to_dict()]
+        )
 
+    @write_locked
     def delete_department(self, department_id: str):
-        data = self._load_json(self.departments_file)
-        data["departments"] = [d for d in data["departments"] if d["id"] != department_id]
-        self._save_json(self.departments_file, data)
-        # 연관된 문제들의 department_ids에서 해당 부서 제거
-        questions = self.load_questions()
-        for q in questions:
-            if department_id in q.department_ids:
-                q.department_ids.remove(department_id)
-        self.save_all_questions(questions)
+        departments = [d for d in self.load_departments() if d.id != department_id]
+        self._commit_cached(
+            "departments", lambda: [d.to_dict() for d in departments], departments,
+            deletes=[department_id]
+        )
+        # 연관된 문제들의 department_ids에서 해당 부서 제거 (역색인으로 찾은 문제만 저장)
+        self._set_department_questions(department_id, ())
 
-    def save_all_questions(self, questions: List[Question]):
-        """모든 문제 정보를 파일에 저장 (기술 문제 + 문제해결 문제)"""
-        # 기존 데이터 로드
-        try:
-            with open(self.questions_file, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            existing_data = {"technical_questions": [], "problem_solving_questions": []}
-        
-        # 카테고리별로 분류
-        technical_questions = [q.to_dict() for q in questions if q.category in ["Java", "Database"]]
-        problem_solving_questions = [q.to_dict() for q in questions if q.category == "문제해결"]
+    @write_locked
+    def assign_department_questions(self, department_id: str, question_ids: Iterable[str],
+                                    scope: Callable[[Question], bool] = None) -> Dict[str, int]:
+        """부서에 할당된 문제를 question_ids로 맞춤 (scope가 있으면 scope에 해당하는 문제만 추가/해제)
         
-        question_data = {
-            "technical_questions": technical_questions,
-            "problem_solving_questions": problem_solving_questions
-        }
-        self._save_json(self.questions_file, question_data) 
\ No newline at end of file
+        반환: {"added": 추가한 문제 수, "removed": 해제한 문제 수}
+        """
+        return self._set_department_questions(department_id, question_ids, scope)
+    
+    @write_locked
+    def add_department_questions(self, department_id: str, question_ids: Iterable[str]) -> int:
+        """부서에 문제 추가 할당 (기존 할당은 유지, 새로 할당한 문제 수 반환)"""
+        current = self._question_pools().department_questions(department_id)
+        return self._set_department_questions(department_id, current | set(question_ids))["added"]
+    
+    def _set_department_questions(self, department_id: str, question_ids: Iterable[str],
+                                  scope: Callable[[Question], bool] = None) -> Dict[str, int]:
+        """부서 → 문제 id 역색인과의 집합 차이로 추가/해제할 문제만 찾아 변경된 문제만 저장"""
+        by_id = self._questions_by_id()
+        pools = self._question_pools()
+        current = pools.department_questions(department_id)
+        wanted = {question_id for question_id in question_ids if question_id in by_id}
+        if scope is not None:
+            # 추가/해제 대상을 모두 정한 뒤에 수정해야 scope 판단이 수정 전 상태 기준으로 이루어짐
+            wanted = {question_id for question_id in wanted if scope(by_id[question_id])}
+            current = {question_id for question_id in current if scope(by_id[question_id])}
+        added = []
+        for question_id in wanted - current:
+            question = by_id[question_id]
+            question.department_ids.append(department_id)
+            pools.assign(question, department_id)
+            added.append(question)
+        removed = []
+        for question_id in current - wanted:
+            question = by_id[question_id]
+            if department_id in question.department_ids:
+                question.department_ids.remove(department_id)
+            pools.unassign(question, department_id)
+            removed.append(question)
+        if added or removed:
+            self._commit_questions(self._cached_questions(), upserts=added + removed, pools_updated=True)
+        return {"added": len(added), "removed": len(removed)}
+    
+    @write_locked
+    def save_all_questions(self, questions: List[Question]):
+        """모든 문제 정보를 저장 (기술 문제 + 문제해결 문제, 기존 섹션 유지)"""
+        self._commit_questions(list(questions))
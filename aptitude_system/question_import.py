@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+문제 은행 일괄 가져오기 (JSON Lines / CSV / XLSX)
+
+파일을 한 행씩 읽어 Question 형식으로 검증하고, id와 내용 해시로 중복을 걸러
+batch_size개씩 모아 저장한다. 파일 전체를 메모리에 올리지 않으므로 큰 문제 은행도 일정한 메모리로 처리한다.
+
+열(헤더): id, category, type, difficulty, question, options, correct_answer, keywords, points,
+department_ids, description, sql (한국어 헤더도 가능, IMPORT_COLUMNS 참고)
+- options: "|"로 구분 (또는 JSON 배열)
+- keywords, department_ids: ","로 구분 (또는 JSON 배열), 부서는 id 또는 이름
+- id가 없으면 내용 해시로 만든다 (같은 파일을 다시 가져와도 같은 id)
+
+사용법:
+    python question_import.py bank.jsonl
+    python question_import.py bank.xlsx --update
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterator, Optional, Tuple
+
+try:
+    from openpyxl import load_workbook
+except ImportError:  # XLSX 가져오기에만 필요
+    load_workbook = None
+
+from models import Question
+
+QUESTION_TYPES = ("객관식", "주관식")
+
+# 한국어 헤더 → 필드 이름
+IMPORT_COLUMNS = {
+    '문제ID': 'id',
+    '카테고리': 'category',
+    '유형': 'type',
+    '난이도': 'difficulty',
+    '문제': 'question',
+    '보기': 'options',
+    '정답': 'correct_answer',
+    '키워드': 'keywords',
+    '배점': 'points',
+    '부서': 'department_ids',
+    '설명': 'description',
+}
+
+# 한 번에 저장할 문제 수
+IMPORT_BATCH_SIZE = 500
+# 보고서에 담을 최대 행 오류 수 (나머지는 개수만 셈)
+MAX_REPORTED_ERRORS = 200
+
+
+def _cell(value):
+    """셀 값 정리 (엑셀의 정수형 실수 3.0 → 3)"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _text(value) -> str:
+    value = _cell(value)
+    return '' if value is None else str(value).strip()
+
+
+def _points(value) -> int:
+    """배점 (비어 있으면 기본 1, 0은 그대로, 숫자가 아니거나 소수면 ValueError)"""
+    raw = _cell(value)
+    if isinstance(raw, str):
+        raw = raw.strip()
+    if raw in (None, ''):
+        return 1
+    try:
+        number = raw if isinstance(raw, int) else float(raw)
+    except (TypeError, ValueError):
+        raise ValueError(f"배점은 숫자여야 합니다: {_text(value)}")
+    if isinstance(number, float) and not number.is_integer():
+        raise ValueError(f"배점은 정수여야 합니다: {_text(value)}")
+    return int(number)
+
+
+def _list_field(value, separator: str):
+    """구분자로 나뉜 문자열 또는 JSON 배열 → 문자열 목록"""
+    if isinstance(value, list):
+        items = value
+    else:
+        text = _text(value)
+        if not text:
+            return []
+        items = None
+        if text.startswith('['):
+            try:
+                parsed = json.loads(text)
+                items = parsed if isinstance(parsed, list) else None
+            except json.JSONDecodeError:
+                items = None
+        if items is None:
+            items = text.split(separator)
+    return [_text(item) for item in items if _text(item)]
+
+
+def _normalize_header(name) -> str:
+    name = _text(name)
+    return IMPORT_COLUMNS.get(name, name)
+
+
+def iter_question_rows(stream, filename: str) -> Iterator[Tuple[int, object]]:
+    """파일 형식(확장자)에 맞게 (행 번호, 행 dict)를 하나씩 반환
+
+    JSON으로 읽을 수 없는 줄은 행 dict 대신 ValueError를 반환하므로 가져오기는 다음 행으로 계속 진행한다.
+    지원하지 않는 형식이면 ValueError
+    """
+    extension = os.path.splitext(filename or '')[1].lower()
+    if extension in ('.jsonl', '.ndjson'):
+        text = io.TextIOWrapper(stream, encoding='utf-8-sig')
+        for row_number, line in enumerate(text, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield row_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield row_number, ValueError(f"JSON 형식이 올바르지 않습니다: {e.msg}")
+    elif extension == '.csv':
+        text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+        reader = csv.reader(text)
+        header = [_normalize_header(name) for name in next(reader, [])]
+        for values in reader:
+            if any(_text(v) for v in values):
+                yield reader.line_num, dict(zip(header, values))
+    elif extension == '.xlsx':
+        if load_workbook is None:
+            raise ValueError("XLSX 파일을 읽으려면 openpyxl을 설치해야 합니다.")
+        workbook = load_workbook(stream, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [_normalize_header(name) for name in next(rows, ())]
+            for row_number, values in enumerate(rows, start=2):
+                if any(_text(v) for v in values):
+                    yield row_number, dict(zip(header, values))
+        finally:
+            workbook.close()
+    else:
+        raise ValueError("지원하지 않는 파일 형식입니다. (.jsonl, .csv, .xlsx)")
+
+
+def build_question(row: Dict, department_ids, department_by_name: Dict[str, str]) -> Question:
+    """행을 검증해 Question으로 변환 (id가 없으면 None으로 두고, 잘못된 값이 있으면 ValueError)"""
+    category = _text(row.get('category'))
+    question_type = _text(row.get('type'))
+    text = _text(row.get('question'))
+    if not category:
+        raise ValueError("카테고리가 비어 있습니다.")
+    if question_type not in QUESTION_TYPES:
+        raise ValueError(f"유형은 객관식 또는 주관식이어야 합니다: {question_type or '(비어 있음)'}")
+    if not text:
+        raise ValueError("문제 내용이 비어 있습니다.")
+    points = _points(row.get('points'))
+    if points < 0:
+        raise ValueError("배점은 0 이상이어야 합니다.")
+
+    options = _list_field(row.get('options'), '|')
+    keywords = _list_field(row.get('keywords'), ',')
+    correct_answer = _text(row.get('correct_answer')) or None
+    if question_type == '객관식':
+        if len(options) < 2:
+            raise ValueError("객관식 문제에는 보기가 2개 이상 필요합니다.")
+        if correct_answer not in options:
+            raise ValueError(f"정답이 보기에 없습니다: {correct_answer or '(비어 있음)'}")
+    elif not keywords:
+        raise ValueError("주관식 문제에는 채점 키워드가 필요합니다.")
+
+    departments = []
+    for department in _list_field(row.get('department_ids'), ','):
+        if department in department_ids:
+            departments.append(department)
+        elif department in department_by_name:
+            departments.append(department_by_name[department])
+        else:
+            raise ValueError(f"존재하지 않는 부서입니다: {department}")
+
+    return Question(
+        id=_text(row.get('id')) or None,
+        category=category,
+        type=question_type,
+        difficulty=_text(row.get('difficulty')),
+        question=text,
+        options=options,
+        correct_answer=correct_answer,
+        keywords=keywords,
+        points=points,
+        department_ids=departments,
+        sql=_text(row.get('sql')),
+        description=_text(row.get('description')) or None
+    )
+
+
+def import_questions(data_manager, rows: Iterator[Tuple[int, object]], update_existing: bool = False,
+                     batch_size: int = IMPORT_BATCH_SIZE) -> Dict:
+    """행을 검증/중복 제거해 batch_size개씩 저장하고 처리 보고서를 반환
+
+    - 이미 있는 id: update_existing이면 파일 내용으로 수정, 아니면 중복으로 건너뜀
+    - 내용 해시가 다른 id의 문제(기존 또는 같은 파일 안)와 같으면 중복으로 건너뜀
+    """
+    started = time.perf_counter()
+    departments = data_manager.load_departments()
+    department_ids = {d.id for d in departments}
+    department_by_name = {d.name: d.id for d in departments}
+    existing_ids = set()
+    # 내용 해시 → 그 내용을 가진 문제 id
+    owners: Dict[str, str] = {}
+    for question in data_manager.load_questions():
+        existing_ids.add(question.id)
+        owners.setdefault(question.content_hash, question.id)
+    seen_ids = set()
+
+    report = {"rows": 0, "imported": 0, "updated": 0, "duplicates": 0, "failed": 0, "batches": 0, "errors": []}
+    batch = []
+
+    def fail(row_number: int, message: str):
+        report["failed"] += 1
+        if len(report["errors"]) < MAX_REPORTED_ERRORS:
+            report["errors"].append({"row": row_number, "message": message})
+
+    def flush():
+        if batch:
+            data_manager.save_questions(batch)
+            report["batches"] += 1
+            batch.clear()
+
+    for row_number, row in rows:
+        report["rows"] += 1
+        if isinstance(row, Exception):
+            fail(row_number, str(row))
+            continue
+        if not isinstance(row, dict):
+            fail(row_number, "행 형식이 올바르지 않습니다.")
+            continue
+        try:
+            question = build_question(row, department_ids, department_by_name)
+        except ValueError as e:
+            fail(row_number, str(e))
+            continue
+
+        content_hash = question.content_hash
+        if question.id is None:
+            prefix = 'ps' if question.category == '문제해결' else 'tech'
+            question.id = f"{prefix}_{content_hash[:12]}"
+        owner = owners.get(content_hash)
+        if question.id in seen_ids or (owner is not None and owner != question.id):
+            report["duplicates"] += 1
+            continue
+        if question.id in existing_ids:
+            if not update_existing:
+                report["duplicates"] += 1
+                continue
+            report["updated"] += 1
+        else:
+            report["imported"] += 1
+        seen_ids.add(question.id)
+        owners[content_hash] = question.id
+        batch.append(question)
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+
+    elapsed = time.perf_counter() - started
+    report["elapsed_ms"] = round(elapsed * 1000, 2)
+    report["rows_per_sec"] = round(report["rows"] / elapsed) if elapsed > 0 else report["rows"]
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='문제 은행 파일 일괄 가져오기 (.jsonl / .csv / .xlsx)')
+    parser.add_argument('path', help='가져올 파일')
+    parser.add_argument('--update', action='store_true', help='이미 있는 id의 문제를 파일 내용으로 수정')
+    parser.add_argument('--data-folder', default=None, help='data 폴더 (기본: app.py 기준 data)')
+    args = parser.parse_args()
+
+    from models import DataManager
+    data_manager = DataManager(args.data_folder)
+    try:
+        with open(args.path, 'rb') as f:
+            report = import_questions(data_manager, iter_question_rows(f, args.path), update_existing=args.update)
+    except ValueError as e:
+        print(f"가져오기 실패: {e}")
+        return 1
+    print(f"{report['rows']}행 처리: 추가 {report['imported']}건, 수정 {report['updated']}건, "
+          f"중복 {report['duplicates']}건, 실패 {report['failed']}건")
+    print(f"소요 시간: {report['elapsed_ms']}ms ({report['rows_per_sec']}행/초)")
+    for error in report['errors']:
+        print(f"  {error['row']}행: {error['message']}")
+    return 0 if report['failed'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+평가 결과 내보내기 (CSV / XLSX)
+
+결과를 한 건씩 행으로 만들어 바로 내보내므로 결과가 많아도 메모리 사용량이 일정하다.
+- CSV: 행을 만들 때마다 응답으로 흘려보내 다운로드가 바로 시작된다.
+- XLSX: openpyxl write-only 모드로 행을 임시 파일에 기록한 뒤, 완성된 파일을 조각 단위로 내보낸다.
+  (XLSX는 zip 형식이라 시트를 다 쓴 뒤에야 파일이 완성됨)
+
+문항별 정답 여부는 제출 시 저장된 채점 상세를 사용하고, 정답표가 바뀐 문제만 다시 채점한다.
+
+답안/이름 등 지원자가 입력한 문자열은 =, +, -, @ 등으로 시작하면 엑셀에서 수식으로 실행되므로
+(CSV/수식 주입) 두 형식 모두 셀에 쓰기 전에 앞에 '를 붙여 문자열로 남긴다.
+"""
+
+import csv
+import io
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+try:
+    from openpyxl import Workbook
+except ImportError:  # XLSX 내보내기에만 필요
+    Workbook = None
+
+SUMMARY_HEADER = ['순위', '이름', '이메일', '연락처', '부서', '응시일', '제출일시',
+                  '총점', '기술 점수', '문제해결 점수', '부서 순위', '응시일 순위', '정답 수', '문항 수']
+QUESTION_HEADER = ['순위', '이름', '부서', '응시일', '문제ID', '카테고리', '유형', '배점',
+                   '답안', '정답 여부', '획득 점수', '일치 키워드']
+
+# 코호트 순위를 한 번에 조회할 결과 수
+RANK_CHUNK_SIZE = 500
+# XLSX 파일을 내보낼 때 한 번에 읽는 크기
+XLSX_CHUNK_SIZE = 64 * 1024
+# 이 문자로 시작하는 문자열은 스프레드시트가 수식으로 해석할 수 있음
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def escape_formula(value):
+    """수식으로 해석될 수 있는 문자열 셀 값 앞에 '를 붙임 (숫자 등 다른 값은 그대로)"""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _question_gradings(data_manager, candidate, result) -> Iterator[Tuple[str, object, Dict]]:
+    """출제 순서대로 (문제 id, 문제 또는 None, 채점 상세 또는 None(미응답))"""
+    question_ids = candidate.selected_questions or list(result.answers)
+    for question_id in question_ids:
+        question = data_manager.get_question(question_id)
+        if question is None or not result.answers.get(question_id):
+            yield question_id, question, None
+        else:
+            yield question_id, question, result.get_grading(question)
+
+
+def _with_cohort_ranks(data_manager, pairs: List) -> Iterator[Tuple[object, object, Dict]]:
+    """(지원자, 결과, 코호트 순위)를 묶음 단위로 조회하면서 하나씩 반환"""
+    for start in range(0, len(pairs), RANK_CHUNK_SIZE):
+        chunk = pairs[start:start + RANK_CHUNK_SIZE]
+        ranks = data_manager.get_cohort_ranks([c.id for c, _ in chunk])
+        for candidate, result in chunk:
+            yield candidate, result, ranks[candidate.id]
+
+
+def summary_rows(data_manager, pairs: List, department_names: Dict[str, str]) -> Iterator[List]:
+    """지원자별 결과 요약 행 (머리행 포함)"""
+    yield SUMMARY_HEADER
+    for candidate, result, ranks in _with_cohort_ranks(data_manager, pairs):
+        gradings = [grading for _, _, grading in _question_gradings(data_manager, candidate, result)]
+        yield [
+            result.rank, candidate.name, candidate.email, candidate.phone,
+            department_names.get(candidate.department_id, candidate.department_id or ''),
+            candidate.access_date, result.test_date, result.total_score,
+            result.scores.get('technical', 0), result.scores.get('problem_solving', 0),
+            ranks['department_rank'], ranks['date_rank'],
+            sum(1 for grading in gradings if grading and grading['correct']), len(gradings)
+        ]
+
+
+def question_rows(data_manager, pairs: List, department_names: Dict[str, str]) -> Iterator[List]:
+    """지원자 x 출제 문항별 채점 행 (머리행 포함)"""
+    yield QUESTION_HEADER
+    for candidate, result in pairs:
+        department = department_names.get(candidate.department_id, candidate.department_id or '')
+        for question_id, question, grading in _question_gradings(data_manager, candidate, result):
+            yield [
+                result.rank, candidate.name, department, candidate.access_date, question_id,
+                question.category if question else '', question.type if question else '',
+                question.points if question else '',
+                result.answers.get(question_id, ''),
+                ('O' if grading['correct'] else 'X') if grading else '미응답',
+                grading['points'] if grading else 0,
+                ', '.join(grading['matched_keywords']) if grading else ''
+            ]
+
+
+def iter_csv(rows: Iterable[List]) -> Iterator[str]:
+    """행을 CSV 텍스트로 한 줄씩 (엑셀에서 한글이 깨지지 않도록 BOM으로 시작)"""
+    yield '\ufeff'
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([escape_formula(value) for value in row])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def iter_xlsx(sheets: Iterable[Tuple[str, Iterable[List]]]) -> Iterator[bytes]:
+    """(시트 이름, 행) 목록을 write-only 통합 문서로 만들어 파일 내용을 조각 단위로"""
+    if Workbook is None:
+        raise ValueError("XLSX 파일을 만들려면 openpyxl을 설치해야 합니다.")
+    workbook = Workbook(write_only=True)
+    for title, rows in sheets:
+        sheet = workbook.create_sheet(title=title)
+        for row in rows:
+            sheet.append([escape_formula(value) for value in row])
+    with tempfile.TemporaryFile() as f:
+        workbook.save(f)
+        f.seek(0)
+        while True:
+            chunk = f.read(XLSX_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
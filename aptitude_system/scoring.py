@@ -0,0 +1,151 @@
+"""
+일괄 재채점 엔진
+
+정답표를 배열로 컴파일하고 전체 결과의 답안을 (결과 수 x 문제 수) 행렬로 인코딩해
+모든 결과의 점수를 한 번에 계산한다. NumPy가 설치되어 있으면 행렬 연산으로,
+없으면 같은 컴파일 결과를 사용하는 순수 파이썬 루프로 계산한다.
+
+- 객관식: 답안/정답 문자열을 정수 코드로 바꿔 (답안 코드 == 정답 코드)로 비교
+- 주관식: 키워드 매칭은 벡터화할 수 없으므로 (문제, 답안) 조합마다 한 번씩만 채점해 행렬에 채움
+"""
+
+import time
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 파이썬 루프로 대체
+    np = None
+
+# 점수 영역 (TestResult.scores 키) → 해당 카테고리
+SCORE_BUCKETS = {
+    "technical": ("Java", "Database"),
+    "problem_solving": ("문제해결",),
+}
+
+
+class AnswerKey:
+    """채점용으로 컴파일한 정답표 (열 순서 = columns)"""
+
+    def __init__(self, questions):
+        self.questions = list(questions)
+        self.columns: Dict[str, int] = {q.id: i for i, q in enumerate(self.questions)}
+        # 답안/정답 문자열 → 정수 코드 (모든 문제가 하나의 코드표를 공유)
+        self.codes: Dict[str, int] = {}
+        # 객관식이 아닌 문제는 어떤 답안 코드와도 같지 않도록 -2
+        self.key_codes = [
+            self.encode(q.correct_answer) if q.type == "객관식" and q.correct_answer is not None else -2
+            for q in self.questions
+        ]
+        self.subjective = [i for i, q in enumerate(self.questions) if q.type == "주관식"]
+        self.bucket_points = {
+            bucket: [(q.points or 0) if q.category in categories else 0 for q in self.questions]
+            for bucket, categories in SCORE_BUCKETS.items()
+        }
+
+    def encode(self, answer) -> int:
+        return self.codes.setdefault(answer, len(self.codes))
+
+
+def _subjective_correct(key: AnswerKey, results) -> Dict[tuple, bool]:
+    """주관식 (행, 열) → 정답 여부 (같은 문제에 같은 답안은 한 번만 채점)"""
+    verdicts: Dict[tuple, bool] = {}
+    correct: Dict[tuple, bool] = {}
+    for row, result in enumerate(results):
+        for col in key.subjective:
+            question = key.questions[col]
+            answer = result.answers.get(question.id)
+            if answer is None:
+                continue
+            verdict = verdicts.get((col, answer))
+            if verdict is None:
+                verdict = verdicts[(col, answer)] = question.is_correct(answer)
+            if verdict:
+                correct[(row, col)] = True
+    return correct
+
+
+def _score_numpy(key: AnswerKey, results) -> Dict[str, List]:
+    answers = np.full((len(results), len(key.questions)), -1, dtype=np.int32)
+    for row, result in enumerate(results):
+        for question_id, answer in result.answers.items():
+            col = key.columns.get(question_id)
+            if col is not None:
+                answers[row, col] = key.encode(answer)
+    correct = answers == np.asarray(key.key_codes, dtype=np.int32)
+    for row, col in _subjective_correct(key, results):
+        correct[row, col] = True
+    return {
+        bucket: (correct @ np.asarray(points)).tolist()
+        for bucket, points in key.bucket_points.items()
+    }
+
+
+def _score_python(key: AnswerKey, results) -> Dict[str, List]:
+    subjective = _subjective_correct(key, results)
+    scores = {bucket: [0] * len(results) for bucket in key.bucket_points}
+    for row, result in enumerate(results):
+        for question_id, answer in result.answers.items():
+            col = key.columns.get(question_id)
+            if col is None:
+                continue
+            if key.key_codes[col] == key.codes.get(answer, -1) or (row, col) in subjective:
+                for bucket, points in key.bucket_points.items():
+                    scores[bucket][row] += points[col]
+    return scores
+
+
+def _refresh_gradings(key: AnswerKey, results) -> int:
+    """정답표가 바뀐 문제의 문항별 채점 상세(result.grading)를 다시 채점하고, 다시 채점한 항목 수를 반환
+    
+    같은 문제에 같은 답안은 한 번만 채점한다. 점수와 채점 상세가 서로 어긋나지 않도록 regrade에서 함께 갱신한다.
+    """
+    key_hashes = [q.answer_key_hash for q in key.questions]
+    gradings: Dict[tuple, Dict] = {}
+    refreshed = 0
+    for result in results:
+        for question_id, answer in result.answers.items():
+            col = key.columns.get(question_id)
+            if col is None:
+                continue
+            stored = result.grading.get(question_id)
+            if stored is not None and stored.get("key") == key_hashes[col]:
+                continue
+            grading = gradings.get((col, answer))
+            if grading is None:
+                grading = gradings[(col, answer)] = key.questions[col].grade(answer)
+            result.grading[question_id] = dict(grading)
+            refreshed += 1
+    return refreshed
+
+
+def regrade(results, questions, use_numpy: Optional[bool] = None) -> Dict:
+    """results의 점수(scores/total_score)와 문항별 채점 상세를 questions 정답표로 다시 계산하고 소요 시간 보고서를 반환"""
+    use_numpy = np is not None if use_numpy is None else (use_numpy and np is not None)
+    started = time.perf_counter()
+    key = AnswerKey(questions)
+    compiled = time.perf_counter()
+    scores = (_score_numpy if use_numpy else _score_python)(key, results)
+    scored = time.perf_counter()
+
+    changed = 0
+    for row, result in enumerate(results):
+        new_scores = {bucket: scores[bucket][row] for bucket in SCORE_BUCKETS}
+        total = sum(new_scores.values())
+        if new_scores != {bucket: result.scores.get(bucket, 0) for bucket in SCORE_BUCKETS} or total != result.total_score:
+            changed += 1
+        result.scores.update(new_scores)
+        result.total_score = total
+    refreshed = _refresh_gradings(key, results)
+    graded = time.perf_counter()
+
+    return {
+        "engine": "numpy" if use_numpy else "python",
+        "results": len(results),
+        "questions": len(key.questions),
+        "changed": changed,
+        "gradings_refreshed": refreshed,
+        "compile_ms": round((compiled - started) * 1000, 2),
+        "score_ms": round((scored - compiled) * 1000, 2),
+        "grading_ms": round((graded - scored) * 1000, 2),
+    }
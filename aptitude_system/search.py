@@ -0,0 +1,152 @@
+"""
+문제 은행 전문 검색 (역색인)
+
+문제/설명/보기/키워드/SQL을 토큰으로 나눠 토큰 → {문제 id: 가중치} 역색인을 만들고,
+문제가 추가/수정/삭제되면 그 문제의 항목만 갱신한다.
+
+토큰화 (색인과 검색어에 똑같이 적용):
+- NFKC 정규화 + casefold
+- 한글: 어절을 두 글자씩 겹쳐 자른 바이그램 ("인덱스를" → "인덱", "덱스", "스를"), 한 글자 어절은 그대로
+  (조사가 붙어도 "인덱스"의 바이그램이 모두 포함되므로 형태소 분석 없이 찾을 수 있음)
+- 그 밖의 문자: 단어 단위 ("GROUP BY" → "group", "by")
+
+검색은 검색어의 모든 토큰을 포함한 문제만 찾고, 토큰별 (필드 가중치 x IDF) 합으로 순위를 매긴다.
+"""
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Tuple
+
+# 색인할 필드 → 가중치 (문제 본문과 채점 키워드에 맞을수록 높은 순위)
+FIELD_WEIGHTS = (("question", 3), ("keywords", 2), ("description", 1), ("options", 1), ("sql", 1))
+# 필터/개수 집계에 쓰는 필드
+FACET_FIELDS = ("category", "type", "difficulty", "department_id")
+# 부서가 지정되지 않은 문제의 department_id 패싯 값
+UNASSIGNED = ""
+
+_TOKEN_RUN = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+
+
+def tokenize(text) -> List[str]:
+    """검색용 토큰 목록 (한글은 바이그램, 그 밖에는 단어)"""
+    text = unicodedata.normalize("NFKC", str(text or "")).casefold()
+    tokens = []
+    for run in _TOKEN_RUN.findall(text):
+        if "가" <= run[0] <= "힣" and len(run) > 1:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+class QuestionSearchIndex:
+    """문제 역색인과 패싯 값 (put/remove로 문제 하나씩 증분 갱신)"""
+
+    def __init__(self, questions=()):
+        self.postings: Dict[str, Dict[str, int]] = {}
+        # 문제 id → 색인한 토큰별 가중치 (수정/삭제 시 이 토큰들의 항목만 지움)
+        self._terms: Dict[str, Dict[str, int]] = {}
+        # 문제 id → 패싯 필드 → 값 목록
+        self._facets: Dict[str, Dict[str, List[str]]] = {}
+        # 문제 id → 문제 은행 순번 (동점 정렬 기준, 수정해도 유지되고 새 문제는 뒤에 붙음)
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        for question in questions:
+            self.put(question)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def put(self, question):
+        """문제 색인 (이미 있으면 교체)"""
+        self._unindex(question.id)
+        if question.id not in self._order:
+            self._order[question.id] = self._next_order
+            self._next_order += 1
+        weights = Counter()
+        for field, weight in FIELD_WEIGHTS:
+            value = getattr(question, field, None)
+            # 설명이 따로 없으면 문제 본문과 같으므로 중복으로 세지 않음
+            if field == "description" and value == question.question:
+                continue
+            for text in value if isinstance(value, (list, tuple)) else [value]:
+                for token in tokenize(text):
+                    weights[token] += weight
+        self._terms[question.id] = dict(weights)
+        for token, weight in weights.items():
+            self.postings.setdefault(token, {})[question.id] = weight
+        self._facets[question.id] = {
+            "category": [question.category or ""],
+            "type": [question.type or ""],
+            "difficulty": [question.difficulty or ""],
+            "department_id": list(dict.fromkeys(question.department_ids)) or [UNASSIGNED],
+        }
+
+    def remove(self, question_id: str):
+        self._unindex(question_id)
+        self._order.pop(question_id, None)
+
+    def order_of(self, question_id: str) -> int:
+        """문제 은행에서의 순번 (검색어가 없거나 점수가 같으면 이 순서로 나열)"""
+        return self._order[question_id]
+
+    def _unindex(self, question_id: str):
+        terms = self._terms.pop(question_id, None)
+        if terms is None:
+            return
+        for token in terms:
+            posting = self.postings.get(token)
+            if posting is not None:
+                posting.pop(question_id, None)
+                if not posting:
+                    del self.postings[token]
+        del self._facets[question_id]
+
+    def _scores(self, query: str) -> Dict[str, float]:
+        """검색어의 모든 토큰을 포함한 문제 id → 점수 (검색어가 비어 있으면 모든 문제, 점수 0)"""
+        tokens = set(tokenize(query))
+        if not tokens:
+            return dict.fromkeys(self._terms, 0.0)
+        postings = [self.postings.get(token) for token in tokens]
+        if any(posting is None for posting in postings):
+            return {}
+        # 가장 짧은 목록부터 교집합
+        postings.sort(key=len)
+        matched = set(postings[0])
+        for posting in postings[1:]:
+            matched.intersection_update(posting)
+            if not matched:
+                return {}
+        total = len(self._terms)
+        idf = [math.log(1 + total / len(posting)) for posting in postings]
+        return {
+            question_id: sum(posting[question_id] * weight for posting, weight in zip(postings, idf))
+            for question_id in matched
+        }
+
+    def search(self, query: str, filters: Dict[str, str] = None) -> Tuple[Dict[str, float], Dict[str, Dict[str, int]]]:
+        """(필터에 맞는 문제 id → 점수, 패싯 필드 → 값별 문제 수)
+
+        패싯 개수는 해당 필드를 제외한 나머지 필터만 적용해 센다
+        (예: 부서로 걸러도 다른 부서를 골랐을 때의 문제 수를 보여줄 수 있음).
+        """
+        filters = filters or {}
+        for field in filters:
+            if field not in FACET_FIELDS:
+                raise ValueError(f"필터할 수 없는 필드입니다: {field}")
+        scores = self._scores(query)
+        results = {}
+        facets = {field: Counter() for field in FACET_FIELDS}
+        for question_id, score in scores.items():
+            values = self._facets[question_id]
+            failed = [field for field, value in filters.items() if value not in values.get(field, ())]
+            if len(failed) > 1:
+                continue
+            for field in ([failed[0]] if failed else FACET_FIELDS):
+                for value in values[field]:
+                    facets[field][value] += 1
+            if not failed:
+                results[question_id] = score
+        return results, {field: dict(counts) for field, counts in facets.items()}
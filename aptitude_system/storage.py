@@ -0,0 +1,591 @@
+"""
+데이터 저장소(백엔드) 모듈
+
+DataManager는 메모리 캐시/인덱스를 관리하고, 실제 영속화는 이 모듈의 저장소에 맡긴다.
+모든 저장소는 같은 인터페이스를 가진다.
+
+- signature(kind): 캐시 무효화 판단용 값 (데이터가 바뀌면 값도 바뀜)
+- load(kind): 레코드(dict) 목록 로드
+- write(kind, records, upserts=None, deletes=None): 변경 내용 기록 후 새 signature 반환
+  (upserts/deletes를 주면 해당 레코드만, 둘 다 None이면 전체를 기록.
+   records는 전체 레코드 목록을 돌려주는 함수로, 전체 기록이 필요할 때만 호출된다)
+- lock(): 읽기-수정-쓰기 구간을 감싸는 프로세스/스레드 간 쓰기 잠금
+
+kind는 "candidates", "results", "questions", "departments" 중 하나이다.
+"""
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+KINDS = ("candidates", "results", "questions", "departments")
+QUESTION_SECTIONS = ("technical_questions", "problem_solving_questions")
+# 저널 항목이 이 개수 이상 쌓이면 스냅샷 파일로 압축
+JOURNAL_COMPACT_THRESHOLD = 200
+
+
+try:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+        while True:
+            try:
+                # LK_LOCK은 약 10초간 재시도 후 OSError를 내므로 잠글 때까지 반복
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """프로세스 간 배타 잠금 (잠금 파일 기반) + 같은 프로세스 내 스레드 간 재진입 잠금
+
+    멀티 워커 WSGI 서버에서 여러 프로세스가 같은 데이터 파일을 읽고-수정하고-쓰는 구간을 직렬화한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                f = open(self.path, 'a+b')
+                try:
+                    _lock_file(f)
+                except Exception:
+                    f.close()
+                    raise
+            except Exception:
+                self._thread_lock.release()
+                raise
+            self._file = f
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                _unlock_file(self._file)
+            finally:
+                self._file.close()
+                self._file = None
+        self._thread_lock.release()
+
+
+def write_json_atomic(filename: str, data):
+    """같은 폴더의 임시 파일에 기록하고 fsync한 뒤 os.replace로 교체
+
+    기록 도중 중단되거나 다른 프로세스가 동시에 읽어도 항상 이전 또는 새 내용 전체만 보인다.
+    """
+    dir_name = os.path.dirname(filename) or "."
+    os.makedirs(dir_name, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=dir_name, prefix=os.path.basename(filename) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, filename)
+    except Exception:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+
+def trim_torn_tail(f):
+    """이전 기록이 중단되어 JSONL 파일의 마지막 줄이 잘려 있으면 새 줄이 이어 붙지 않도록 잘라냄"""
+    size = f.seek(0, os.SEEK_END)
+    if size == 0:
+        return
+    f.seek(size - 1)
+    if f.read(1) == b"\n":
+        return
+    f.seek(0)
+    content = f.read()
+    f.truncate(content.rfind(b"\n") + 1)
+    f.seek(0, os.SEEK_END)
+
+
+class AnswerDraftLog:
+    """응시 중인 답안 자동 저장 로그 (지원자별 JSONL 파일)
+
+    자동 저장 요청마다 바뀐 답안만 한 줄로 덧붙이고(기존 내용은 다시 쓰지 않음),
+    최종 제출 시 처음부터 재생해 문제별 마지막 답안을 얻는다.
+    지원자마다 파일이 따로라서 다른 지원자의 저장과 잠금을 다투지 않는다.
+    자주 호출되므로 fsync는 하지 않는다 (전원 장애 시 마지막 몇 초 분량만 잃을 수 있음).
+    """
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        os.makedirs(folder, exist_ok=True)
+
+    def _path(self, candidate_id: str) -> str:
+        # 지원자 id를 파일 이름으로 쓰므로 경로 문자가 들어간 id는 거부
+        if not candidate_id or not all(ch.isalnum() or ch in "-_" for ch in candidate_id):
+            raise ValueError(f"잘못된 지원자 id: {candidate_id!r}")
+        return os.path.join(self.folder, f"{candidate_id}.jsonl")
+
+    def append(self, candidate_id: str, answers: Dict[str, str]):
+        """바뀐 답안만 로그 끝에 추가 (저장 시각 포함)"""
+        line = json.dumps({"answers": answers, "t": time.time()}, ensure_ascii=False) + "\n"
+        with open(self._path(candidate_id), 'a+b') as f:
+            # 같은 지원자의 요청이 겹쳐도(탭 두 개 등) 줄이 섞이지 않도록 파일 단위로 잠금
+            _lock_file(f)
+            try:
+                trim_torn_tail(f)
+                f.write(line.encode('utf-8'))
+                f.flush()
+            finally:
+                _unlock_file(f)
+
+    def load(self, candidate_id: str, until: float = None) -> Dict[str, str]:
+        """로그를 재생한 문제별 마지막 답안 (until을 주면 그 시각까지 저장된 것만, 로그가 없으면 빈 dict)"""
+        answers = {}
+        try:
+            f = open(self._path(candidate_id), 'rb')
+        except FileNotFoundError:
+            return answers
+        with f:
+            for raw_line in f:
+                if not raw_line.endswith(b"\n"):
+                    break  # 기록 도중 중단되어 잘린 마지막 줄
+                try:
+                    entry = json.loads(raw_line.decode('utf-8'))
+                    if until is not None and entry.get("t", 0) > until:
+                        break  # 시각 순으로 쌓이므로 이후 줄도 모두 마감 후
+                    answers.update(entry["answers"])
+                except (UnicodeDecodeError, json.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError):
+                    continue
+        return answers
+
+    def clear(self, candidate_id: str):
+        """최종 제출 후 로그 삭제"""
+        try:
+            os.remove(self._path(candidate_id))
+        except FileNotFoundError:
+            pass
+
+
+def record_key_field(kind: str) -> str:
+    """레코드를 식별하는 키 필드 (결과는 지원자 id 기준)"""
+    return "candidate_id" if kind == "results" else "id"
+
+
+def question_section(record: Dict) -> str:
+    """questions.json에서 문제가 들어갈 섹션 (문제해결 카테고리만 별도 섹션)"""
+    if record.get("category") == "문제해결":
+        return "problem_solving_questions"
+    return "technical_questions"
+
+
+class JsonFileStorage:
+    """data/*.json 파일 저장소 (기본값)
+
+    JSON 파일은 부분 갱신이 불가능하므로 write 시 기본적으로 전체를 다시 기록한다.
+    단, journaled_kinds(기본: 결과, 문제)는 변경분을 <kind>.journal.jsonl에 한 줄씩 덧붙이고,
+    저널이 compact_threshold개 이상 쌓이면 <kind>.json 스냅샷으로 압축한다.
+    로드 시에는 스냅샷 위에 저널을 재생하며, 기록 도중 중단되어 잘린 마지막 줄은 버린다.
+    모든 파일 교체는 임시 파일 + fsync + os.replace로 이루어지고, 쓰기는 data/.write.lock으로 직렬화한다.
+    """
+
+    name = "json"
+
+    def __init__(self, data_folder: str, journaled_kinds=("results", "questions"),
+                 compact_threshold: int = JOURNAL_COMPACT_THRESHOLD):
+        self.data_folder = data_folder
+        self.files = {kind: os.path.join(data_folder, f"{kind}.json") for kind in KINDS}
+        self.journals = {kind: os.path.join(data_folder, f"{kind}.journal.jsonl") for kind in journaled_kinds}
+        self.compact_threshold = compact_threshold
+        self._journal_lengths: Dict[str, int] = {}  # kind: 현재 저널 항목 수
+        # 문제 id: (questions.json 내 섹션, 그 섹션에 둘 때의 카테고리)
+        # 다시 저장할 때 원래 섹션을 유지하되, 카테고리가 바뀐 문제는 새 카테고리의 섹션으로 옮김
+        self._question_sections: Dict[str, Tuple[str, Optional[str]]] = {}
+        os.makedirs(data_folder, exist_ok=True)
+        self._lock = FileLock(os.path.join(data_folder, ".write.lock"))
+        self._ensure_data_files()
+
+    def lock(self) -> FileLock:
+        return self._lock
+
+    def _ensure_data_files(self):
+        """데이터 파일들이 존재하는지 확인하고 없으면 생성"""
+        os.makedirs(self.data_folder, exist_ok=True)
+        defaults = {
+            "candidates": [],
+            "questions": {"technical_questions": []},
+            "results": [],
+            "departments": {"departments": []},
+        }
+        with self._lock:
+            for kind, default in defaults.items():
+                if not os.path.exists(self.files[kind]):
+                    self._save_json(self.files[kind], default)
+
+    def _load_json(self, filename: str):
+        """JSON 파일 로드"""
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            if filename == self.files["departments"]:
+                return {"departments": []}
+            if filename == self.files["questions"]:
+                return {"technical_questions": []}
+            return []
+
+    def _save_json(self, filename: str, data):
+        """JSON 파일 저장 (원자적 교체)"""
+        write_json_atomic(filename, data)
+
+    def _file_signature(self, filename: str):
+        """파일 시그니처 (mtime, 크기, inode)"""
+        try:
+            stat = os.stat(filename)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def signature(self, kind: str):
+        signature = self._file_signature(self.files[kind])
+        if signature is None or kind not in self.journals:
+            return signature
+        return (signature, self._file_signature(self.journals[kind]))
+
+    def load(self, kind: str) -> List[Dict]:
+        data = self._load_json(self.files[kind])
+        if kind == "questions":
+            records = []
+            for section in QUESTION_SECTIONS:
+                for q in data.get(section, []):
+                    self._question_sections[q.get("id")] = (section, q.get("category"))
+                    records.append(q)
+        elif kind == "departments":
+            records = data.get("departments", [])
+        else:
+            records = data
+        if kind in self.journals:
+            records = self._replay_journal(kind, records)
+        return records
+
+    def write(self, kind: str, records: Callable[[], List[Dict]], upserts: Optional[List[Dict]] = None,
+              deletes: Optional[List[str]] = None):
+        if kind == "questions":
+            for record in upserts or []:
+                self._question_section(record)
+        if kind in self.journals and (upserts is not None or deletes is not None):
+            entries = [{"op": "delete", "key": key} for key in deletes or []]
+            entries += [{"op": "upsert", "record": record} for record in upserts or []]
+            self._append_journal(kind, entries)
+            if self._journal_lengths.get(kind, 0) >= self.compact_threshold:
+                self._write_snapshot(kind, records())
+            return self.signature(kind)
+        self._write_snapshot(kind, records())
+        return self.signature(kind)
+
+    def _write_snapshot(self, kind: str, records: List[Dict]):
+        """전체 레코드를 <kind>.json에 기록하고, 저널이 있으면 비움 (저널 압축)"""
+        if kind == "questions":
+            data = {section: [] for section in QUESTION_SECTIONS}
+            for q in records:
+                data[self._question_section(q)].append(q)
+        elif kind == "departments":
+            data = {"departments": records}
+        else:
+            data = records
+        self._save_json(self.files[kind], data)
+        if kind not in self.journals:
+            return
+        # 스냅샷 교체 후 저널을 비우기 전에 중단되어도, 저널의 upsert/delete는 다시 적용해도 결과가 같음
+        with open(self.journals[kind], 'w', encoding='utf-8') as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_lengths[kind] = 0
+
+    def _question_section(self, record: Dict) -> str:
+        """문제가 들어갈 섹션 (처음 보는 문제이거나 카테고리가 바뀐 문제는 카테고리로 다시 정함)"""
+        placed = self._question_sections.get(record.get("id"))
+        if placed is None or placed[1] != record.get("category"):
+            placed = self._question_sections[record.get("id")] = (question_section(record), record.get("category"))
+        return placed[0]
+
+    def _append_journal(self, kind: str, entries: List[Dict]):
+        """저널 끝에 항목 추가 (기존 파일은 다시 쓰지 않음, 쓰기 잠금 안에서 호출)"""
+        lines = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+        with open(self.journals[kind], 'a+b') as f:
+            trim_torn_tail(f)
+            f.write(lines.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_lengths[kind] = self._journal_lengths.get(kind, 0) + len(entries)
+
+    def _replay_journal(self, kind: str, records: List[Dict]) -> List[Dict]:
+        """스냅샷 레코드 위에 저널 항목을 순서대로 적용"""
+        key_field = record_key_field(kind)
+        # 삭제된 자리는 None으로 비워 두고 마지막에 한 번만 걸러냄 (삭제마다 목록을 다시 만들지 않음)
+        records: List[Optional[Dict]] = list(records)
+        positions: Dict[str, List[int]] = {}
+        for i, record in enumerate(records):
+            positions.setdefault(record.get(key_field), []).append(i)
+        count = 0
+        try:
+            f = open(self.journals[kind], 'rb')
+        except FileNotFoundError:
+            self._journal_lengths[kind] = 0
+            return records
+        with f:
+            for raw_line in f:
+                if not raw_line.endswith(b"\n"):
+                    break  # 기록 도중 중단되어 잘린 마지막 줄
+                try:
+                    entry = json.loads(raw_line.decode('utf-8'))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    continue
+                count += 1
+                if entry.get("op") == "upsert":
+                    record = entry["record"]
+                    key = record.get(key_field)
+                    if key in positions:
+                        records[positions[key][0]] = record
+                    else:
+                        positions[key] = [len(records)]
+                        records.append(record)
+                elif entry.get("op") == "delete":
+                    for i in positions.pop(entry["key"], []):
+                        records[i] = None
+        self._journal_lengths[kind] = count
+        return [record for record in records if record is not None]
+
+
+class SQLiteStorage:
+    """SQLite 저장소 (WAL 모드, 변경된 행만 기록)
+
+    각 테이블은 조회/정렬에 쓰는 컬럼에 인덱스를 두고, 레코드 전체는 data 컬럼에 JSON으로 보관한다.
+    문제-부서 매핑은 question_departments 테이블이 기준이다.
+    versions 테이블의 kind별 버전은 쓰기 트랜잭션마다 1씩 증가하며 캐시 무효화에 사용된다.
+    """
+
+    name = "sqlite"
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS versions (
+        kind TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS candidates (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        access_date TEXT,
+        department_id TEXT,
+        data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_candidates_name ON candidates(name);
+    CREATE INDEX IF NOT EXISTS idx_candidates_access_date ON candidates(access_date);
+    CREATE INDEX IF NOT EXISTS idx_candidates_department ON candidates(department_id);
+    CREATE TABLE IF NOT EXISTS results (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        candidate_id TEXT NOT NULL,
+        test_date TEXT,
+        total_score INTEGER,
+        data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_results_candidate ON results(candidate_id);
+    CREATE INDEX IF NOT EXISTS idx_results_score ON results(total_score);
+    CREATE TABLE IF NOT EXISTS questions (
+        id TEXT PRIMARY KEY,
+        category TEXT,
+        type TEXT,
+        difficulty TEXT,
+        data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_questions_category_type ON questions(category, type);
+    CREATE TABLE IF NOT EXISTS question_departments (
+        question_id TEXT NOT NULL,
+        department_id TEXT NOT NULL,
+        PRIMARY KEY (question_id, department_id)
+    );
+    CREATE INDEX IF NOT EXISTS idx_question_departments_department ON question_departments(department_id);
+    CREATE TABLE IF NOT EXISTS departments (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL
+    );
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        dir_name = os.path.dirname(db_path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        # sqlite3 연결은 스레드 간 공유하지 않음
+        self._local = threading.local()
+        # 트랜잭션은 행 단위 쓰기만 보호하므로, DataManager의 읽기-수정-쓰기 구간은 별도 잠금으로 직렬화
+        self._lock = FileLock(db_path + ".lock")
+        conn = self._connect()
+        conn.executescript(self.SCHEMA)
+        conn.executemany("INSERT OR IGNORE INTO versions(kind, version) VALUES (?, 0)", [(k,) for k in KINDS])
+
+    def lock(self) -> FileLock:
+        return self._lock
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def signature(self, kind: str):
+        row = self._connect().execute("SELECT version FROM versions WHERE kind = ?", (kind,)).fetchone()
+        return row[0] if row else None
+
+    def load(self, kind: str) -> List[Dict]:
+        conn = self._connect()
+        if kind == "candidates":
+            rows = conn.execute("SELECT data FROM candidates ORDER BY rowid")
+            return [json.loads(data) for (data,) in rows]
+        if kind == "results":
+            rows = conn.execute("SELECT data FROM results ORDER BY seq")
+            return [json.loads(data) for (data,) in rows]
+        if kind == "questions":
+            department_ids: Dict[str, List[str]] = {}
+            for question_id, department_id in conn.execute(
+                    "SELECT question_id, department_id FROM question_departments ORDER BY rowid"):
+                department_ids.setdefault(question_id, []).append(department_id)
+            records = []
+            for question_id, data in conn.execute("SELECT id, data FROM questions ORDER BY rowid"):
+                record = json.loads(data)
+                record["department_ids"] = department_ids.get(question_id, [])
+                records.append(record)
+            return records
+        if kind == "departments":
+            rows = conn.execute("SELECT id, name FROM departments ORDER BY rowid")
+            return [{"id": dept_id, "name": name} for dept_id, name in rows]
+        raise ValueError(f"알 수 없는 데이터 종류입니다: {kind}")
+
+    def write(self, kind: str, records: Callable[[], List[Dict]], upserts: Optional[List[Dict]] = None,
+              deletes: Optional[List[str]] = None):
+        with self._transaction() as conn:
+            if upserts is None and deletes is None:
+                self._replace_all(conn, kind, records())
+            else:
+                for key in deletes or []:
+                    self._delete(conn, kind, key)
+                for record in upserts or []:
+                    self._upsert(conn, kind, record)
+            conn.execute("UPDATE versions SET version = version + 1 WHERE kind = ?", (kind,))
+            return conn.execute("SELECT version FROM versions WHERE kind = ?", (kind,)).fetchone()[0]
+
+    def _replace_all(self, conn: sqlite3.Connection, kind: str, records: List[Dict]):
+        conn.execute(f"DELETE FROM {kind}")
+        if kind == "questions":
+            conn.execute("DELETE FROM question_departments")
+        if kind == "results":
+            # 같은 지원자의 결과가 여럿이어도 그대로 보존
+            conn.executemany(
+                "INSERT INTO results(test_date, total_score, data, candidate_id) VALUES (?, ?, ?, ?)",
+                [(r.get("test_date"), r.get("total_score"), json.dumps(r, ensure_ascii=False), r["candidate_id"])
+                 for r in records])
+            return
+        for record in records:
+            self._upsert(conn, kind, record)
+
+    def _delete(self, conn: sqlite3.Connection, kind: str, key: str):
+        if kind == "results":
+            conn.execute("DELETE FROM results WHERE candidate_id = ?", (key,))
+            return
+        conn.execute(f"DELETE FROM {kind} WHERE id = ?", (key,))
+        if kind == "questions":
+            conn.execute("DELETE FROM question_departments WHERE question_id = ?", (key,))
+
+    def _upsert(self, conn: sqlite3.Connection, kind: str, record: Dict):
+        data = json.dumps(record, ensure_ascii=False)
+        if kind == "candidates":
+            conn.execute(
+                "INSERT INTO candidates(id, name, access_date, department_id, data) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET name = excluded.name, access_date = excluded.access_date, "
+                "department_id = excluded.department_id, data = excluded.data",
+                (record["id"], record["name"], record.get("access_date"), record.get("department_id"), data))
+        elif kind == "results":
+            params = (record.get("test_date"), record.get("total_score"), data, record["candidate_id"])
+            updated = conn.execute(
+                "UPDATE results SET test_date = ?, total_score = ?, data = ? WHERE candidate_id = ?", params)
+            if updated.rowcount == 0:
+                conn.execute(
+                    "INSERT INTO results(test_date, total_score, data, candidate_id) VALUES (?, ?, ?, ?)", params)
+        elif kind == "questions":
+            record = dict(record)
+            department_ids = record.pop("department_ids", None) or []
+            conn.execute(
+                "INSERT INTO questions(id, category, type, difficulty, data) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET category = excluded.category, type = excluded.type, "
+                "difficulty = excluded.difficulty, data = excluded.data",
+                (record["id"], record.get("category"), record.get("type"), record.get("difficulty"),
+                 json.dumps(record, ensure_ascii=False)))
+            conn.execute("DELETE FROM question_departments WHERE question_id = ?", (record["id"],))
+            conn.executemany(
+                "INSERT OR IGNORE INTO question_departments(question_id, department_id) VALUES (?, ?)",
+                [(record["id"], department_id) for department_id in department_ids])
+        elif kind == "departments":
+            conn.execute(
+                "INSERT INTO departments(id, name) VALUES (?, ?) ON CONFLICT(id) DO UPDATE SET name = excluded.name",
+                (record["id"], record["name"]))
+        else:
+            raise ValueError(f"알 수 없는 데이터 종류입니다: {kind}")
+
+
+def migrate_json_to_sqlite(data_folder: str, db_path: str) -> Dict[str, int]:
+    """data/*.json 데이터를 SQLite 데이터베이스로 한 번에 옮김 (대상 테이블의 기존 내용은 교체)"""
+    source = JsonFileStorage(data_folder)
+    target = SQLiteStorage(db_path)
+    counts = {}
+    for kind in KINDS:
+        records = source.load(kind)
+        target.write(kind, lambda: records)
+        counts[kind] = len(records)
+    return counts
+
+
+if __name__ == "__main__":
+    # 사용법: python storage.py [data 폴더] [db 파일 경로]
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    data_folder = sys.argv[1] if len(sys.argv) > 1 else os.path.join(base_dir, "data")
+    db_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(data_folder, "aptitude.db")
+    counts = migrate_json_to_sqlite(data_folder, db_path)
+    for kind, count in counts.items():
+        print(f"{kind}: {count}건 이전")
+    print(f"SQLite 데이터베이스로 마이그레이션되었습니다: {db_path}")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+답안 동시 제출 스트레스 테스트 스크립트
+
+임시 data 폴더에 지원자를 등록한 뒤, 여러 프로세스 x 스레드에서 /submit_answers를 동시에 호출하고
+모든 제출 결과가 빠짐없이 저장되었는지(유실/중복/파일 손상 없음) 확인합니다.
+
+사용법:
+    python stress_submit.py --candidates 400 --processes 4 --threads 8
+    python stress_submit.py --backend sqlite
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from models import Candidate, DataManager
+from storage import SQLiteStorage
+
+
+def create_manager(data_folder, backend):
+    if backend == 'sqlite':
+        return DataManager(data_folder, storage=SQLiteStorage(os.path.join(data_folder, 'aptitude.db')))
+    return DataManager(data_folder)
+
+
+def submit_worker(data_folder, backend, candidate_ids, threads, failures):
+    """한 프로세스에서 여러 스레드로 답안 제출"""
+    import app as app_module
+    # 스트레스 테스트용 임시 데이터 폴더 사용
+    app_module.data_manager = create_manager(data_folder, backend)
+
+    def submit_all(ids):
+        client = app_module.app.test_client()
+        for candidate_id in ids:
+            with client.session_transaction() as sess:
+                sess['candidate_id'] = candidate_id
+            response = client.post('/submit_answers', data={
+                'question_java_mc_basic_05': 'switch',
+                'question_db_mc_basic_01': 'SELECT',
+            })
+            if response.status_code != 302:
+                failures.put((candidate_id, response.status_code))
+
+    chunks = [candidate_ids[i::threads] for i in range(threads)]
+    workers = [threading.Thread(target=submit_all, args=(chunk,)) for chunk in chunks]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='/submit_answers 동시 제출 스트레스 테스트')
+    parser.add_argument('--candidates', type=int, default=400, help='제출할 지원자 수')
+    parser.add_argument('--processes', type=int, default=4, help='워커 프로세스 수')
+    parser.add_argument('--threads', type=int, default=8, help='프로세스당 스레드 수')
+    parser.add_argument('--backend', choices=['json', 'sqlite'], default='json', help='저장소 백엔드')
+    args = parser.parse_args()
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    data_folder = tempfile.mkdtemp(prefix='aptitude_stress_')
+    try:
+        # 문제 데이터는 실제 문제 은행을 복사해서 사용
+        shutil.copy(os.path.join(base_dir, 'data', 'questions.json'), os.path.join(data_folder, 'questions.json'))
+        manager = create_manager(data_folder, args.backend)
+        candidate_ids = []
+        for i in range(args.candidates):
+            candidate = Candidate(name=f'스트레스{i:04d}', access_date=time.strftime('%Y-%m-%d'), test_duration=10)
+            candidate_ids.append(candidate.id)
+            manager.save_candidate(candidate)
+
+        failures = multiprocessing.Queue()
+        chunks = [candidate_ids[i::args.processes] for i in range(args.processes)]
+        started = time.time()
+        processes = [
+            multiprocessing.Process(target=submit_worker,
+                                    args=(data_folder, args.backend, chunk, args.threads, failures))
+            for chunk in chunks
+        ]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+        elapsed = time.time() - started
+
+        # 새 매니저로 디스크에서 다시 읽어 검증
+        results = create_manager(data_folder, args.backend).get_all_results()
+        saved_ids = [r.candidate_id for r in results]
+        missing = set(candidate_ids) - set(saved_ids)
+        duplicated = len(saved_ids) - len(set(saved_ids))
+        failed = []
+        while not failures.empty():
+            failed.append(failures.get())
+        if args.backend == 'json':
+            # 스냅샷 파일이 손상되지 않았는지 확인
+            with open(os.path.join(data_folder, 'results.json'), 'r', encoding='utf-8') as f:
+                json.load(f)
+
+        print(f"제출 {args.candidates}건 / 프로세스 {args.processes} x 스레드 {args.threads} / 백엔드 {args.backend}")
+        print(f"소요 시간: {elapsed:.2f}초")
+        print(f"저장된 결과: {len(saved_ids)}건, 유실: {len(missing)}건, 중복: {duplicated}건, 요청 실패: {len(failed)}건")
+        if missing or duplicated or failed or any(p.exitcode != 0 for p in processes):
+            print("실패: 유실되었거나 중복/실패한 제출이 있습니다.")
+            return 1
+        print("성공: 모든 제출이 저장되었습니다.")
+        return 0
+    finally:
+        shutil.rmtree(data_folder, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
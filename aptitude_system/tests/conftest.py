@@ -0,0 +1,42 @@
+import os
+import sys
+
+# 앱 모듈은 aptitude_system 폴더 기준으로 import (python app.py와 같은 방식)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from models import DataManager
+
+
+@pytest.fixture
+def data_manager(tmp_path):
+    """임시 data 폴더를 쓰는 DataManager"""
+    return DataManager(str(tmp_path))
+
+
+@pytest.fixture
+def app_module(data_manager, monkeypatch):
+    """임시 DataManager/스케줄러/이벤트 버스로 바꾼 app 모듈 (백그라운드 스케줄러 스레드는 시작하지 않음)"""
+    import app as app_module
+    from events import EventBus
+    from exam_timer import DeadlineScheduler
+
+    monkeypatch.setattr(app_module, "data_manager", data_manager)
+    monkeypatch.setattr(app_module, "event_bus", EventBus())
+    monkeypatch.setattr(app_module, "exam_scheduler", DeadlineScheduler(app_module.finalize_expired_attempt))
+    monkeypatch.setattr(app_module, "exam_scheduler_started", True)
+    app_module.app.config["TESTING"] = True
+    return app_module
+
+
+@pytest.fixture
+def admin_client(app_module):
+    """관리자 로그인 세션의 테스트 클라이언트"""
+    from datetime import datetime, timezone
+
+    client = app_module.app.test_client()
+    with client.session_transaction() as session:
+        session[app_module.ADMIN_SESSION_KEY] = True
+        session["admin_auth_time"] = datetime.now(timezone.utc).isoformat()
+    return client
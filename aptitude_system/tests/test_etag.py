@@ -0,0 +1,38 @@
+from models import Department, Question
+
+
+def test_matching_etag_returns_304_until_data_changes(app_module, admin_client):
+    data_manager = app_module.data_manager
+    data_manager.save_question(Question("tech_1", "Java", "주관식", "초급", "GC란?", keywords=["GC"]))
+
+    first = admin_client.get("/api/questions")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    cached = admin_client.get("/api/questions", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+    assert cached.headers["ETag"] == etag
+
+    data_manager.save_question(Question("tech_2", "Java", "주관식", "초급", "JIT란?", keywords=["JIT"]))
+    changed = admin_client.get("/api/questions", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [q["id"] for q in changed.get_json()] == ["tech_1", "tech_2"]
+
+
+def test_etag_tracks_only_the_data_the_response_uses(app_module, admin_client):
+    etag = admin_client.get("/api/departments").headers["ETag"]
+
+    app_module.data_manager.save_question(Question("tech_1", "Java", "주관식", "초급", "GC란?", keywords=["GC"]))
+    assert admin_client.get("/api/departments", headers={"If-None-Match": etag}).status_code == 304
+
+    app_module.data_manager.save_department(Department("개발팀"))
+    assert admin_client.get("/api/departments", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_error_responses_carry_no_etag(app_module, admin_client):
+    response = admin_client.get("/api/questions?sort=unknown")
+    assert response.status_code == 400
+    assert "ETag" not in response.headers
@@ -0,0 +1,104 @@
+import time
+
+from models import Candidate, Question
+
+
+def start_exam(data_manager, scheduler, name="응시자"):
+    data_manager.save_question(Question("q1", "Java", "객관식", "초급", "JVM?", options=["A", "B"], correct_answer="A"))
+    candidate = Candidate(name, selected_questions=["q1"])
+    candidate.start_test()
+    data_manager.save_candidate(candidate)
+    data_manager.save_answer_draft(candidate.id, {"q1": "A"})
+    scheduler.schedule(candidate.id, time.time() + 60)
+    return candidate
+
+
+def test_deleting_candidate_mid_exam_leaves_no_result(app_module, admin_client):
+    data_manager = app_module.data_manager
+    candidate = start_exam(data_manager, app_module.exam_scheduler)
+
+    assert admin_client.delete(f"/admin/candidate/delete/{candidate.id}").get_json()["success"]
+    assert app_module.exam_scheduler.pending() == 0
+    assert data_manager.load_answer_draft(candidate.id) == {}
+
+    app_module.exam_scheduler.run_pending(now=time.time() + 120)
+    assert data_manager.get_result(candidate.id) is None
+    assert data_manager.get_all_results() == []
+
+
+def test_finalize_attempt_skips_deleted_candidate(data_manager):
+    candidate = Candidate("응시자", selected_questions=["q1"])
+    data_manager.save_candidate(candidate)
+    data_manager.save_answer_draft(candidate.id, {"q1": "A"})
+    data_manager.delete_candidate(candidate.id)
+
+    assert data_manager.finalize_attempt(candidate.id) is None
+    assert data_manager.get_result(candidate.id) is None
+
+
+def test_deadline_finalizes_from_draft(app_module):
+    data_manager = app_module.data_manager
+    candidate = start_exam(data_manager, app_module.exam_scheduler)
+
+    assert app_module.exam_scheduler.run_pending(now=time.time() + 120) == [candidate.id]
+    result = data_manager.get_result(candidate.id)
+    assert result is not None and result.answers == {"q1": "A"}
+
+
+def open_exam_events(app_module, candidate, headers=None):
+    """응시 화면 SSE 스트림을 열고 접속 직후 보내는 retry/time을 읽은 뒤의 청크 반복자"""
+    client = app_module.app.test_client()
+    with client.session_transaction() as session:
+        session["candidate_id"] = candidate.id
+    response = client.get("/api/exam/events", headers=headers or {}, buffered=False)
+    chunks = iter(response.response)
+    assert next(chunks).startswith(b"retry:")
+    assert next(chunks).startswith(b"event: time")
+    return response, chunks
+
+
+def test_fresh_exam_event_connection_gets_no_replay(app_module):
+    candidate = start_exam(app_module.data_manager, app_module.exam_scheduler)
+    event_bus = app_module.event_bus
+    event_bus.publish(app_module.EXAM_BROADCAST_CHANNEL, "notice", {"message": "지난 공지"})
+
+    response, chunks = open_exam_events(app_module, candidate)
+    seq = event_bus.publish(app_module.EXAM_BROADCAST_CHANNEL, "notice", {"message": "새 공지"})
+    chunk = next(chunks).decode("utf-8")
+    response.close()
+
+    assert chunk.startswith(f"id: {seq}\n")
+    assert "새 공지" in chunk
+
+
+def test_reconnect_replays_after_last_event_id(app_module):
+    candidate = start_exam(app_module.data_manager, app_module.exam_scheduler)
+    event_bus = app_module.event_bus
+    first = event_bus.publish(app_module.EXAM_BROADCAST_CHANNEL, "notice", {"message": "받은 공지"})
+    event_bus.publish(app_module.EXAM_BROADCAST_CHANNEL, "notice", {"message": "놓친 공지"})
+
+    response, chunks = open_exam_events(app_module, candidate, headers={"Last-Event-ID": str(first)})
+    chunk = next(chunks).decode("utf-8")
+    response.close()
+
+    assert "놓친 공지" in chunk
+
+
+def test_scheduler_rebuilds_pending_deadlines_from_storage(app_module, monkeypatch):
+    data_manager = app_module.data_manager
+    candidate = start_exam(data_manager, app_module.exam_scheduler)
+    finished = start_exam(data_manager, app_module.exam_scheduler, name="제출자")
+    data_manager.finalize_attempt(finished.id)
+
+    # 워커 재시작: 메모리의 예약은 모두 사라진 상태
+    from exam_timer import DeadlineScheduler
+    restarted = DeadlineScheduler(app_module.finalize_expired_attempt)
+    monkeypatch.setattr(restarted, "start", lambda: None)
+    monkeypatch.setattr(app_module, "exam_scheduler", restarted)
+    monkeypatch.setattr(app_module, "exam_scheduler_started", False)
+
+    app_module.start_exam_scheduler()
+
+    assert restarted.pending() == 1
+    assert restarted.run_pending(now=candidate.deadline_timestamp() + 1) == [candidate.id]
+    assert data_manager.get_result(candidate.id) is not None
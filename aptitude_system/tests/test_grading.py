@@ -0,0 +1,44 @@
+import copy
+
+import models
+from models import DataManager, Question
+
+
+def test_get_grading_regrades_without_mutating_cached_result(data_manager):
+    question = Question("q1", "Database", "주관식", "초급", "인덱스란?", keywords=["인덱스"], points=5)
+    data_manager.save_question(question)
+    result = models.TestResult("c1")
+    result.add_answer("q1", "B-Tree 인덱스")
+    result.calculate_score(data_manager.load_questions())
+    data_manager.save_result(result)
+    stored = copy.deepcopy(data_manager.get_result("c1").grading)
+
+    question.keywords = ["B-Tree", "해시"]
+    data_manager.save_question(question)
+    cached = data_manager.get_result("c1")
+    grading = cached.get_grading(data_manager.get_question("q1"))
+
+    assert grading["matched_keywords"] == ["B-Tree"]
+    assert cached.grading == stored
+    assert DataManager(data_manager.data_folder).get_result("c1").grading == stored
+
+
+def test_regrade_all_results_refreshes_stored_gradings(data_manager):
+    question = Question("q1", "Java", "객관식", "초급", "JVM?", options=["A", "B"], correct_answer="A", points=5)
+    data_manager.save_question(question)
+    result = models.TestResult("c1")
+    result.add_answer("q1", "B")
+    result.calculate_score(data_manager.load_questions())
+    data_manager.save_result(result)
+    assert result.total_score == 0
+
+    question.correct_answer = "B"
+    data_manager.save_question(question)
+    report = data_manager.regrade_all_results()
+
+    assert report["gradings_refreshed"] == 1
+    for stored in (data_manager.get_result("c1"), DataManager(data_manager.data_folder).get_result("c1")):
+        grading = stored.grading["q1"]
+        assert stored.total_score == 5
+        assert grading["correct"] and grading["points"] == 5
+        assert grading["key"] == question.answer_key_hash
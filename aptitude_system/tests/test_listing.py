@@ -0,0 +1,76 @@
+import pytest
+
+from listing import SortedView, decode_cursor, encode_cursor
+from models import Candidate
+
+
+def collect(view, limit, descending=False):
+    """커서를 따라 끝까지 페이지를 모음 (페이지별 항목 목록)"""
+    pages, after = [], None
+    while True:
+        items, next_key = view.page(after, limit, descending)
+        pages.append(items)
+        if next_key is None:
+            return pages
+        after = decode_cursor(encode_cursor("score", next_key), "score")
+
+
+ITEMS = [("a", 3), ("b", 1), ("c", None), ("d", 3), ("e", 2)]
+
+
+def test_sorted_view_pages_ascending_and_descending():
+    view = SortedView(ITEMS, value_of=lambda item: item[1], id_of=lambda item: item[0])
+
+    ascending = collect(view, 2)
+    assert [[item[0] for item in page] for page in ascending] == [["b", "e"], ["a", "d"], ["c"]]
+    descending = collect(view, 2, descending=True)
+    assert [[item[0] for item in page] for page in descending] == [["c", "d"], ["a", "e"], ["b"]]
+
+
+def test_cursor_survives_insert_between_pages():
+    view = SortedView(ITEMS, value_of=lambda item: item[1], id_of=lambda item: item[0])
+    first, next_key = view.page(None, 2)
+    changed = SortedView(ITEMS + [("0", 0)], value_of=lambda item: item[1], id_of=lambda item: item[0])
+    second, _ = changed.page(next_key, 10)
+    assert [item[0] for item in first + second] == ["b", "e", "a", "d", "c"]
+
+
+def test_decode_cursor_rejects_bad_input():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", "name")
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor("name", [[False, "x"], "id"]), "-name")
+
+
+def test_listing_api_cursor_pagination(app_module, admin_client):
+    names = ["다", "가", "마", "나", "라"]
+    app_module.data_manager.save_candidates([Candidate(name) for name in names])
+
+    def pages(sort):
+        seen, cursor = [], None
+        while True:
+            url = f"/api/candidates?sort={sort}&limit=2&fields=name"
+            body = admin_client.get(url + (f"&cursor={cursor}" if cursor else "")).get_json()
+            assert body["total"] == 5 and len(body["items"]) <= 2
+            assert all(set(item) == {"name"} for item in body["items"])
+            seen += [item["name"] for item in body["items"]]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                return seen
+
+    assert pages("name") == sorted(names)
+    assert pages("-name") == sorted(names, reverse=True)
+    assert len(admin_client.get("/api/candidates").get_json()) == 5
+
+
+def test_listing_api_rejects_bad_sort_filter_and_cursor(app_module, admin_client):
+    app_module.data_manager.save_candidates([Candidate("가"), Candidate("나"), Candidate("다")])
+    cursor = admin_client.get("/api/candidates?sort=name&limit=1").get_json()["next_cursor"]
+
+    for url in ("/api/candidates?sort=password",
+                "/api/candidates?unknown=1",
+                "/api/candidates?sort=name&cursor=%%%",
+                f"/api/candidates?sort=-name&cursor={cursor}"):
+        response = admin_client.get(url)
+        assert response.status_code == 400, url
+        assert response.get_json()["success"] is False
@@ -0,0 +1,18 @@
+import unicodedata
+
+from matching import KeywordMatcher, normalize_text
+
+
+def test_normalize_text_composes_decomposed_syllables():
+    assert normalize_text(unicodedata.normalize("NFD", "인덱스")) == "인덱스"
+    assert normalize_text("ＧＲＯＵＰ  By") == "groupby"
+
+
+def test_spelled_out_compatibility_jamo_is_not_composed():
+    assert normalize_text("ㅇㅣㄴㄷㅔㄱㅅㅡ") != "인덱스"
+
+
+def test_keyword_matcher_finds_overlapping_keywords():
+    matcher = KeywordMatcher(["인덱스", "덱스", "GROUP BY", ""])
+    assert matcher.match_indices("인덱스와 group by 절") == {0, 1, 2, 3}
+    assert matcher.match_indices("해시") == {3}
@@ -0,0 +1,46 @@
+import io
+
+from question_import import import_questions, iter_question_rows
+
+CSV = (
+    "id,category,type,question,options,correct_answer,keywords,points\n"
+    "tech_a,Java,객관식,JVM은?,가상 머신|컴파일러,가상 머신,,0\n"
+    "tech_b,Java,주관식,GC란?,,,메모리,\n"
+    "tech_c,Database,주관식,인덱스란?,,,B-Tree, 3 \n"
+    "tech_d,Database,주관식,음수?,,,키,-1\n"
+    "tech_e,Database,주관식,소수?,,,키,2.5\n"
+    "tech_f,Database,주관식,문자?,,,키,많이\n"
+    "tech_g,Database,주관식,정수 표기?,,,키,4.0\n"
+)
+
+
+def test_import_csv_points(data_manager):
+    rows = iter_question_rows(io.BytesIO(CSV.encode("utf-8")), "bank.csv")
+    report = import_questions(data_manager, rows)
+
+    assert report["imported"] == 4
+    assert report["failed"] == 3
+    assert [error["message"] for error in report["errors"]] == [
+        "배점은 0 이상이어야 합니다.", "배점은 정수여야 합니다: 2.5", "배점은 숫자여야 합니다: 많이"]
+    assert data_manager.get_question("tech_e") is None
+    assert data_manager.get_question("tech_g").points == 4
+    assert data_manager.get_question("tech_a").points == 0
+    assert data_manager.get_question("tech_b").points == 1
+    assert data_manager.get_question("tech_c").points == 3
+
+
+def test_import_jsonl_zero_points(data_manager):
+    jsonl = '{"id": "tech_z", "category": "Java", "type": "주관식", "question": "Q", "keywords": ["k"], "points": 0}\n'
+    report = import_questions(data_manager, iter_question_rows(io.BytesIO(jsonl.encode("utf-8")), "bank.jsonl"))
+
+    assert report["imported"] == 1
+    assert data_manager.get_question("tech_z").points == 0
+
+
+def test_import_jsonl_rejects_fractional_points(data_manager):
+    jsonl = '{"id": "tech_f", "category": "Java", "type": "주관식", "question": "Q", "keywords": ["k"], "points": 2.5}\n'
+    report = import_questions(data_manager, iter_question_rows(io.BytesIO(jsonl.encode("utf-8")), "bank.jsonl"))
+
+    assert report["failed"] == 1
+    assert report["errors"] == [{"row": 1, "message": "배점은 정수여야 합니다: 2.5"}]
+    assert data_manager.get_question("tech_f") is None
@@ -0,0 +1,51 @@
+import json
+import os
+
+from models import DataManager, Question
+from storage import JsonFileStorage
+
+
+def make_question(question_id, category, department_ids=None):
+    return Question(question_id, category, "주관식", "초급", f"{question_id} 문제", keywords=["키워드"],
+                    department_ids=department_ids or ["d1"])
+
+
+def question_sections(data_folder):
+    with open(os.path.join(data_folder, "questions.json"), encoding="utf-8") as f:
+        data = json.load(f)
+    return {section: [q["id"] for q in records] for section, records in data.items()}
+
+
+def test_journal_edit_that_changes_category_moves_section(tmp_path):
+    data_manager = DataManager(str(tmp_path), storage=JsonFileStorage(str(tmp_path), compact_threshold=3))
+    data_manager.save_all_questions([make_question("tech_1", "Java"), make_question("tech_2", "Database")])
+
+    edited = make_question("tech_1", "문제해결")
+    data_manager.save_question(edited)
+    pools = data_manager._question_pools().pools
+    assert pools[("d1", "문제해결", "주관식")] == ["tech_1"]
+    assert ("d1", "Java", "주관식") not in pools or pools[("d1", "Java", "주관식")] == []
+    assert data_manager.get_question("tech_1").category == "문제해결"
+
+    # 저널이 압축되면 새 카테고리의 섹션으로 옮겨져 있어야 함
+    data_manager.save_question(make_question("tech_3", "Java"))
+    data_manager.save_question(make_question("tech_4", "Java"))
+    sections = question_sections(str(tmp_path))
+    assert sections["problem_solving_questions"] == ["tech_1"]
+    assert sections["technical_questions"] == ["tech_2", "tech_3", "tech_4"]
+
+    fresh = DataManager(str(tmp_path))
+    assert fresh.get_question("tech_1").category == "문제해결"
+    assert fresh._question_pools().pools[("d1", "문제해결", "주관식")] == ["tech_1"]
+
+
+def test_question_kept_in_original_section_until_category_changes(tmp_path):
+    storage = JsonFileStorage(str(tmp_path))
+    # 카테고리와 다른 섹션에 있던 기존 데이터는 수정해도 원래 섹션 유지
+    with open(os.path.join(str(tmp_path), "questions.json"), "w", encoding="utf-8") as f:
+        json.dump({"problem_solving_questions": [make_question("ps_1", "Java").to_dict()]}, f, ensure_ascii=False)
+    data_manager = DataManager(str(tmp_path), storage=storage)
+    question = data_manager.get_question("ps_1")
+    question.points = 3
+    data_manager.save_all_questions(data_manager.load_questions())
+    assert question_sections(str(tmp_path))["problem_solving_questions"] == ["ps_1"]
@@ -0,0 +1,51 @@
+import random
+
+import models
+
+
+def make_result(candidate_id, total_score):
+    result = models.TestResult(candidate_id)
+    result.total_score = total_score
+    return result
+
+
+def test_result_index_put_replaces_in_place_and_keeps_order():
+    index = models.ResultIndex([make_result("a", 10), make_result("b", 30), make_result("c", 20)])
+    index.put(make_result("a", 40))
+    index.put(make_result("d", 5))
+
+    assert [r.candidate_id for r in index.results] == ["a", "b", "c", "d"]
+    assert [r.candidate_id for r in index.top_k(4)] == ["a", "b", "c", "d"]
+    assert index.rank_of("a") == 1
+    assert index.rank_of("c") == 3
+
+
+def test_result_index_remove():
+    index = models.ResultIndex([make_result("a", 10), make_result("b", 30), make_result("c", 20)])
+
+    assert index.remove("b")
+    assert not index.remove("b")
+    assert [r.candidate_id for r in index.results] == ["a", "c"]
+    assert index.rank_of("c") == 1
+    assert index.rank_of("b") is None
+    index.refresh_ranks()
+    assert [r.rank for r in index.results] == [2, 1]
+
+
+def test_score_ranking_matches_sorted_order():
+    rng = random.Random(7)
+    entries = [((-rng.randint(0, 20), seq), f"r{seq}") for seq in range(300)]
+    ranking = models.ScoreRanking(entries[:200])
+    for key, result in entries[200:]:
+        ranking.add(key, result)
+    removed = rng.sample(entries, 120)
+    for key, _ in removed:
+        ranking.discard(key)
+    ranking.discard((1, -1))  # 없는 키는 무시
+
+    expected = sorted(set(entries) - set(removed))
+    assert len(ranking) == len(expected)
+    assert ranking.top() == [result for _, result in expected]
+    assert ranking.top(5) == [result for _, result in expected[:5]]
+    for i, (key, _) in enumerate(expected):
+        assert ranking.rank_of(key) == i + 1
@@ -0,0 +1,50 @@
+import csv
+import io
+
+from openpyxl import load_workbook
+
+import models
+from models import Candidate, Question
+from results_export import escape_formula
+
+ANSWER = "=HYPERLINK(\"http://evil.example\",\"클릭\")"
+
+
+def test_escape_formula():
+    assert escape_formula("=1+1") == "'=1+1"
+    for text in ("+1", "-1", "@SUM(A1)", "\tx", "\rx"):
+        assert escape_formula(text) == "'" + text
+    assert escape_formula("정상 답안") == "정상 답안"
+    assert escape_formula(-3) == -3
+    assert escape_formula(None) is None
+
+
+def submit(data_manager):
+    data_manager.save_question(Question("q1", "Java", "주관식", "초급", "GC란?", keywords=["GC"]))
+    candidate = Candidate("=1+1", selected_questions=["q1"])
+    data_manager.save_candidate(candidate)
+    result = models.TestResult(candidate.id)
+    result.add_answer("q1", ANSWER)
+    result.calculate_score(data_manager.load_questions())
+    data_manager.save_result(result)
+
+
+def test_xlsx_export_writes_formula_shaped_text_as_strings(app_module, admin_client):
+    submit(app_module.data_manager)
+    response = admin_client.get("/admin/results/export?format=xlsx")
+    assert response.status_code == 200
+
+    workbook = load_workbook(io.BytesIO(response.data))
+    cells = [cell for sheet in workbook.worksheets for row in sheet.iter_rows() for cell in row]
+    assert not [cell.coordinate for cell in cells if cell.data_type == "f"]
+    values = {cell.value for cell in cells}
+    assert "'" + ANSWER in values and "'=1+1" in values
+
+
+def test_csv_export_escapes_formula_shaped_text(app_module, admin_client):
+    submit(app_module.data_manager)
+    text = admin_client.get("/admin/results/export?format=csv&view=questions").get_data(as_text=True)
+    rows = list(csv.reader(io.StringIO(text.lstrip("\ufeff"))))
+
+    assert rows[1][1] == "'=1+1"
+    assert rows[1][8] == "'" + ANSWER
@@ -0,0 +1,52 @@
+from models import Question
+from search import tokenize
+
+
+def make_question(question_id, text, category="Java"):
+    return Question(question_id, category, "주관식", "초급", text, keywords=["키워드"])
+
+
+def bank(data_manager):
+    questions = [make_question(f"tech_{i}", f"{i}번 인덱스 문제") for i in (2, 10, 1)]
+    questions.append(make_question("ps_1", "트랜잭션 격리 수준", category="문제해결"))
+    data_manager.save_all_questions(questions)
+    return [q.id for q in questions]
+
+
+def test_tokenize_uses_hangul_bigrams():
+    assert tokenize("인덱스를 GROUP BY") == ["인덱", "덱스", "스를", "group", "by"]
+
+
+def test_empty_query_keeps_bank_order(data_manager):
+    order = bank(data_manager)
+    view, facets = data_manager.search_questions("")
+    assert [q.id for _, q in view.items] == order
+    assert facets["category"] == {"Java": 3, "문제해결": 1}
+
+    data_manager.save_question(make_question("tech_0", "새 문제"))
+    data_manager.save_question(make_question("tech_10", "수정한 인덱스 문제"))
+    view, _ = data_manager.search_questions("")
+    assert [q.id for _, q in view.items] == order + ["tech_0"]
+
+
+def test_query_matches_with_particles_and_filters(data_manager):
+    bank(data_manager)
+    view, facets = data_manager.search_questions("인덱스", {"category": "Java"})
+    assert [q.id for _, q in view.items] == ["tech_2", "tech_10", "tech_1"]
+    assert facets["category"] == {"Java": 3}
+
+    data_manager.delete_question("tech_10")
+    view, _ = data_manager.search_questions("인덱스")
+    assert [q.id for _, q in view.items] == ["tech_2", "tech_1"]
+
+
+def test_search_api_pages_in_bank_order(app_module, admin_client):
+    order = bank(app_module.data_manager)
+    first = admin_client.get("/api/questions/search?limit=2").get_json()
+    second = admin_client.get(f"/api/questions/search?limit=2&cursor={first['next_cursor']}").get_json()
+    assert [item["id"] for item in first["items"] + second["items"]] == order
+    assert first["total"] == 4 and second["next_cursor"] is None
+
+    page = admin_client.get("/admin/questions").get_data(as_text=True)
+    positions = [page.index(f'value="{question_id}"') for question_id in order]
+    assert positions[:3] == sorted(positions[:3])
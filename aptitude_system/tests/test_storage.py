@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from models import Candidate, DataManager
+from storage import JsonFileStorage, SQLiteStorage, migrate_json_to_sqlite
+
+RECORDS = {
+    "candidates": [{"id": "c1", "name": "홍길동", "access_date": "2026-10-01", "department_id": "d1"},
+                   {"id": "c2", "name": "김철수", "access_date": None, "department_id": None}],
+    "results": [{"candidate_id": "c1", "test_date": "2026-10-01 10:00:00", "total_score": 7, "answers": {}},
+                {"candidate_id": "c2", "test_date": "2026-10-01 11:00:00", "total_score": 3, "answers": {}}],
+    "questions": [{"id": "tech_1", "category": "Java", "type": "주관식", "difficulty": "초급", "department_ids": ["d1"]},
+                  {"id": "ps_1", "category": "문제해결", "type": "주관식", "difficulty": "중급", "department_ids": []}],
+    "departments": [{"id": "d1", "name": "개발팀"}],
+}
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def storage(request, tmp_path):
+    if request.param == "json":
+        return JsonFileStorage(str(tmp_path))
+    return SQLiteStorage(str(tmp_path / "aptitude.db"))
+
+
+def test_full_write_round_trip(storage):
+    for kind, records in RECORDS.items():
+        before = storage.signature(kind)
+        after = storage.write(kind, lambda records=records: records)
+        assert after != before
+        assert storage.signature(kind) == after
+        assert storage.load(kind) == records
+
+
+def test_partial_write_upsert_and_delete(storage):
+    storage.write("results", lambda: RECORDS["results"])
+    updated = dict(RECORDS["results"][0], total_score=9)
+    added = {"candidate_id": "c3", "test_date": "2026-10-02 09:00:00", "total_score": 5, "answers": {}}
+    storage.write("results", lambda: pytest.fail("전체 기록은 필요 없음"), upserts=[updated, added], deletes=["c2"])
+
+    assert storage.load("results") == [updated, added]
+
+
+def test_json_journal_replays_after_delete(tmp_path):
+    storage = JsonFileStorage(str(tmp_path))
+    storage.write("questions", lambda: RECORDS["questions"])
+    edited = dict(RECORDS["questions"][0], difficulty="고급")
+    storage.write("questions", lambda: [], upserts=[edited])
+    storage.write("questions", lambda: [], deletes=["ps_1"])
+
+    assert os.path.getsize(tmp_path / "questions.journal.jsonl") > 0
+    assert JsonFileStorage(str(tmp_path)).load("questions") == [edited]
+
+
+def test_json_journal_ignores_torn_tail_and_compacts(tmp_path):
+    storage = JsonFileStorage(str(tmp_path), compact_threshold=3)
+    storage.write("results", lambda: RECORDS["results"])
+    storage.write("results", lambda: [], deletes=["c1"])
+    with open(tmp_path / "results.journal.jsonl", "ab") as f:
+        f.write(b'{"op": "delete", "key": "c2"')  # 기록 도중 중단된 줄
+    assert JsonFileStorage(str(tmp_path)).load("results") == RECORDS["results"][1:]
+
+    reloaded = JsonFileStorage(str(tmp_path), compact_threshold=3)
+    reloaded.load("results")
+    final = RECORDS["results"][1:]
+    reloaded.write("results", lambda: final, upserts=[RECORDS["results"][1]])
+    reloaded.write("results", lambda: final, upserts=[RECORDS["results"][1]])
+    assert os.path.getsize(tmp_path / "results.journal.jsonl") == 0
+    assert JsonFileStorage(str(tmp_path)).load("results") == final
+
+
+def test_sqlite_uses_wal_and_versions_table(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / "aptitude.db"))
+    assert storage._connect().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert storage.signature("candidates") == 0
+    storage.write("candidates", lambda: RECORDS["candidates"])
+    storage.write("candidates", lambda: [], deletes=["c2"])
+    assert storage.signature("candidates") == 2
+    # 다른 연결(다른 워커)도 같은 버전과 데이터를 봄
+    other = SQLiteStorage(str(tmp_path / "aptitude.db"))
+    assert other.signature("candidates") == 2
+    assert other.load("candidates") == RECORDS["candidates"][:1]
+
+
+def test_migrate_json_to_sqlite(tmp_path):
+    source = JsonFileStorage(str(tmp_path))
+    for kind, records in RECORDS.items():
+        source.write(kind, lambda records=records: records)
+    source.write("results", lambda: [], deletes=["c2"])
+
+    counts = migrate_json_to_sqlite(str(tmp_path), str(tmp_path / "aptitude.db"))
+
+    assert counts == {"candidates": 2, "results": 1, "questions": 2, "departments": 1}
+    target = SQLiteStorage(str(tmp_path / "aptitude.db"))
+    for kind in RECORDS:
+        assert target.load(kind) == source.load(kind)
+
+
+def test_data_manager_on_sqlite_sees_other_workers_writes(tmp_path):
+    db_path = str(tmp_path / "aptitude.db")
+    first = DataManager(str(tmp_path), storage=SQLiteStorage(db_path))
+    second = DataManager(str(tmp_path), storage=SQLiteStorage(db_path))
+    assert second.get_all_candidates() == []
+
+    candidate = Candidate("홍길동")
+    first.save_candidate(candidate)
+    assert [c.id for c in second.get_all_candidates()] == [candidate.id]